@@ -0,0 +1,68 @@
+"""
+Benchmarks computing the digests of large build artifacts for the recipe.
+
+Compares hashing the artifacts one after the other in 1 MiB reads with the file digester, which hashes them at the same
+time with memory mapped reads, and with the file digester when the digests of the last build are cached.
+
+Usage: python benchmarks/bench_artifact_digests.py [--dir /path/on/filesystem] [--size 256] [--files 4]
+"""
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import gdk.common.utils as utils
+from gdk.common.FileDigester import FileDigester
+
+
+def create_artifacts(build_dir: Path, files: int, size_mb: int) -> list:
+    build_dir.mkdir(parents=True)
+    artifacts = []
+    chunk = os.urandom(1024 * 1024)
+    for i in range(files):
+        artifact = build_dir.joinpath(f"artifact_{i}.jar")
+        with open(artifact, "wb") as f:
+            for _ in range(size_mb):
+                f.write(chunk)
+        artifacts.append(artifact)
+    return artifacts
+
+
+def measure(name, digest, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        digest()
+        timings.append(time.perf_counter() - start)
+    print(f"{name:<20} best {min(timings):8.3f}s")
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dir", default=None, help="Directory on the filesystem to benchmark. Defaults to the temp dir.")
+    parser.add_argument("--size", type=int, default=256, help="Size of each artifact in MiB.")
+    parser.add_argument("--files", type=int, default=4, help="Number of artifacts.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs for each approach.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        root = Path(tmp)
+        artifacts = create_artifacts(root.joinpath("target"), args.files, args.size)
+        cache_file = root.joinpath("artifact-digests.json")
+        print(f"Artifacts: {args.files} x {args.size} MiB in {root}, {os.cpu_count()} cpus")
+
+        def digest_cold():
+            if cache_file.exists():
+                cache_file.unlink()
+            FileDigester(cache_file).digest(artifacts)
+
+        serial_time = measure("serial 1 MiB reads", lambda: [utils.get_file_sha256(a) for a in artifacts], args.repeat)
+        cold_time = measure("FileDigester", digest_cold, args.repeat)
+        warm_time = measure("FileDigester cached", lambda: FileDigester(cache_file).digest(artifacts), args.repeat)
+        print(f"Speedup: {serial_time / cold_time:.2f}x, cached {serial_time / warm_time:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmarks staging large build artifacts in the greengrass-build folder.
+
+Compares copying the artifacts with `shutil.copy`, which the build used to do, with the file stager that reflinks,
+hardlinks or copies them depending on the filesystem. Reports the time to stage the artifacts and the disk space used by
+the staged files, measured by the change of the free space of the filesystem.
+
+Usage: python benchmarks/bench_artifact_staging.py [--dir /path/on/filesystem] [--size 256] [--files 2]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from gdk.common.FileStager import FileStager
+
+
+def create_artifacts(build_dir: Path, files: int, size_mb: int) -> list:
+    build_dir.mkdir(parents=True)
+    artifacts = []
+    chunk = os.urandom(1024 * 1024)
+    for i in range(files):
+        artifact = build_dir.joinpath(f"artifact_{i}.jar")
+        with open(artifact, "wb") as f:
+            for _ in range(size_mb):
+                f.write(chunk)
+        artifacts.append(artifact)
+    return artifacts
+
+
+def free_bytes(path: Path) -> int:
+    stat = os.statvfs(path)
+    return stat.f_bavail * stat.f_frsize
+
+
+def measure(name, stage, artifacts, root: Path, repeat: int):
+    timings = []
+    used = 0
+    for _ in range(repeat):
+        destination_dir = root.joinpath("greengrass-build")
+        destination_dir.mkdir()
+        os.sync()
+        free_before = free_bytes(root)
+        start = time.perf_counter()
+        for artifact in artifacts:
+            stage(artifact, destination_dir)
+        timings.append(time.perf_counter() - start)
+        os.sync()
+        used = free_before - free_bytes(root)
+        shutil.rmtree(destination_dir)
+    print(f"{name:<12} best {min(timings):8.3f}s  disk used {used / (1024 * 1024):10.1f} MiB")
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dir", default=None, help="Directory on the filesystem to benchmark. Defaults to the temp dir.")
+    parser.add_argument("--size", type=int, default=256, help="Size of each artifact in MiB.")
+    parser.add_argument("--files", type=int, default=2, help="Number of artifacts.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs for each approach.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        root = Path(tmp)
+        artifacts = create_artifacts(root.joinpath("target"), args.files, args.size)
+        print(f"Artifacts: {args.files} x {args.size} MiB in {root}")
+
+        copy_time = measure("shutil.copy", shutil.copy, artifacts, root, args.repeat)
+        stager = FileStager()
+        stager_time = measure("FileStager", stager.stage, artifacts, root, args.repeat)
+        print(f"Staging method: {next(iter(FileStager._methods.values()))}")
+        print(f"Speedup: {copy_time / stager_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmarks reading, updating and writing back a large recipe with the case insensitive dictionary of the recipes.
+
+Compares the previous dictionary, which converted the whole recipe when it was created and again in `to_dict`, with the
+dictionary that converts nested values when they are accessed. Each run does what a build does with the recipe: it
+creates the dictionary, updates the component name and the URI of every artifact and converts it back with `to_dict`.
+
+Usage: python benchmarks/bench_case_insensitive_dict.py [--manifests 200] [--artifacts 20]
+"""
+import argparse
+import time
+
+from requests.structures import CaseInsensitiveDict as RequestsCaseInsensitiveDict
+
+from gdk.common.CaseInsensitive import CaseInsensitiveDict
+
+
+class PreviousCaseInsensitiveDict(RequestsCaseInsensitiveDict):
+    def __init__(self, data=None, **kwargs):
+        super().__init__(data, **kwargs)
+        _dict = RequestsCaseInsensitiveDict(data)
+        self._convert_nested_dict(_dict)
+        self.update(_dict)
+
+    def to_dict(self):
+        _dict = dict(self)
+        self._convert_nested_case_insensitive_dict(_dict)
+        return _dict
+
+    def update_value(self, key, value):
+        if key.lower() in self._store:
+            key = self._store[key.lower()][0]
+        self._store[key.lower()] = (key, value)
+
+    def _convert_nested_dict(self, case_insensitive_dict):
+        for key, value in case_insensitive_dict.items():
+            if isinstance(value, dict):
+                case_insensitive_dict.update({key: PreviousCaseInsensitiveDict(value)})
+            elif isinstance(value, list):
+                case_insensitive_dict.update(
+                    {key: [PreviousCaseInsensitiveDict(val) if isinstance(val, dict) else val for val in value]}
+                )
+
+    def _convert_nested_case_insensitive_dict(self, dictObj):
+        for key, value in dictObj.items():
+            if isinstance(value, PreviousCaseInsensitiveDict):
+                dictObj.update({key: self._convert_nested_case_insensitive_dict(dict(value))})
+            elif isinstance(value, list):
+                dictObj.update(
+                    {
+                        key: [
+                            self._convert_nested_case_insensitive_dict(dict(val))
+                            if isinstance(val, PreviousCaseInsensitiveDict)
+                            else val
+                            for val in value
+                        ]
+                    }
+                )
+        return dictObj
+
+
+def create_recipe(manifests: int, artifacts: int) -> dict:
+    return {
+        "RecipeFormatVersion": "2020-01-25",
+        "ComponentName": "com.example.Large",
+        "ComponentVersion": "1.0.0",
+        "ComponentConfiguration": {
+            "DefaultConfiguration": {f"Setting{i}": {"Value": i, "Options": [{"Name": f"option{i}"}]} for i in range(500)}
+        },
+        "Manifests": [
+            {
+                "Platform": {"os": "linux", "architecture": f"arch{m}"},
+                "Lifecycle": {"Install": {"Script": "pip3 install -r requirements.txt"}, "Run": "python3 -u main.py"},
+                "Artifacts": [{"URI": f"s3://bucket/com.example.Large/1.0.0/artifact_{a}.zip"} for a in range(artifacts)],
+            }
+            for m in range(manifests)
+        ],
+    }
+
+
+def build(dictionary_class, recipe: dict) -> dict:
+    case_insensitive_recipe = dictionary_class(recipe)
+    case_insensitive_recipe.update_value("componentName", "com.example.Renamed")
+    for manifest in case_insensitive_recipe["manifests"]:
+        for artifact in manifest["artifacts"]:
+            artifact.update_value("uri", "s3://BUCKET_NAME/COMPONENT_NAME/COMPONENT_VERSION/artifact.zip")
+    return case_insensitive_recipe.to_dict()
+
+
+def measure(name, dictionary_class, recipe: dict, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build(dictionary_class, recipe)
+        timings.append(time.perf_counter() - start)
+    print(f"{name:<28} best {min(timings) * 1000:8.2f}ms")
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--manifests", type=int, default=200, help="Number of manifests in the recipe.")
+    parser.add_argument("--artifacts", type=int, default=20, help="Number of artifacts in each manifest.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs for each dictionary.")
+    args = parser.parse_args()
+
+    recipe = create_recipe(args.manifests, args.artifacts)
+    assert build(PreviousCaseInsensitiveDict, recipe) == build(CaseInsensitiveDict, recipe)
+    print(f"Recipe: {args.manifests} manifests with {args.artifacts} artifacts each")
+    previous_time = measure("previous CaseInsensitiveDict", PreviousCaseInsensitiveDict, recipe, args.repeat)
+    current_time = measure("CaseInsensitiveDict", CaseInsensitiveDict, recipe, args.repeat)
+    print(f"Speedup: {previous_time / current_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
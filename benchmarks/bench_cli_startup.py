@@ -0,0 +1,63 @@
+"""
+Benchmarks the startup latency of the cli for `gdk component build --help` and `gdk -v`.
+
+Each command is run in a new interpreter, alternately with the parser that only contains the branch of the invoked
+command and with the parser of every command, which the cli used to create at import. Both runs must print the same
+output. The check for a new version of the cli is disabled so that the network is not measured. The time to create each
+parser is measured in this process as well, as it is small compared to the startup of the interpreter.
+
+Usage: python benchmarks/bench_cli_startup.py [--repeat 10]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+COMMANDS = [["component", "build", "--help"], ["-v"]]
+LAZY_PARSER = "import gdk.CLIParser as c; c.main()"
+FULL_PARSER = "import gdk.CLIParser as c; c.parse_args = lambda: c.get_cli_parser().parse_args(); c.main()"
+
+
+def run(code, args):
+    env = dict(os.environ, GDK_DISABLE_UPDATE_CHECK="true")
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", code] + args, env=env, stdout=subprocess.PIPE, check=False)
+    return time.perf_counter() - start, result.stdout
+
+
+def create_parser_time(command_path, repeat):
+    import gdk.CLIParser as cli_parser
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        cli_parser.CLIParser("gdk", None, command_path=command_path).create_parser()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10, help="Number of runs of each command.")
+    args = parser.parse_args()
+
+    import gdk.CLIParser as cli_parser
+
+    for command in COMMANDS:
+        full_timings, lazy_timings = [], []
+        for _ in range(args.repeat):
+            full_time, full_output = run(FULL_PARSER, command)
+            lazy_time, lazy_output = run(LAZY_PARSER, command)
+            if full_output != lazy_output:
+                raise Exception(f"The parser of the invoked command printed a different output for `gdk {' '.join(command)}`.")
+            full_timings.append(full_time)
+            lazy_timings.append(lazy_time)
+        command_path = cli_parser.get_command_path(command)
+        print(
+            f"gdk {' '.join(command):<22} startup: full parser {min(full_timings) * 1000:6.1f}ms, command parser"
+            f" {min(lazy_timings) * 1000:6.1f}ms  create parser: full {create_parser_time((), 100) * 1000:5.2f}ms,"
+            f" command {create_parser_time(command_path, 100) * 1000:5.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmarks the lookup of the highest version of a component with many versions, which is used with NEXT_PATCH.
+
+A stubbed Greengrass client returns the versions in pages of 100 with the newest version first and sleeps for the given
+latency on every request. The first lookup lists every page, and the later lookups only list the first page as the highest
+version is cached per component arn.
+
+Usage: python benchmarks/bench_component_versions.py [--versions 5000] [--latency 0.05]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from gdk.aws_clients.Greengrassv2Client import Greengrassv2Client
+
+PAGE_SIZE = 100
+COMPONENT_ARN = "arn:aws:greengrass:us-east-1:123456789012:components:com.example.Benchmark"
+
+
+class StubbedGreengrassClient:
+    def __init__(self, versions, latency):
+        self.versions = versions
+        self.latency = latency
+        self.calls = 0
+
+    def list_component_versions(self, arn, nextToken=None):
+        self.calls += 1
+        time.sleep(self.latency)
+        start = int(nextToken or 0)
+        response = {"componentVersions": [{"componentVersion": v} for v in self.versions[start:start + PAGE_SIZE]]}
+        if start + PAGE_SIZE < len(self.versions):
+            response["nextToken"] = str(start + PAGE_SIZE)
+        return response
+
+
+def create_versions(count):
+    """
+    Creates versions in creation order, newest first, where the newest version is not the highest one.
+    """
+    rng = random.Random(0)
+    versions = [f"{major}.{minor}.{patch}" for major in range(1, 6) for minor in range(50) for patch in range(count // 250)]
+    versions = versions[:count]
+    rng.shuffle(versions)
+    return versions
+
+
+def lookup(versions, latency):
+    ggv2 = Greengrassv2Client("us-east-1")
+    ggv2.client = StubbedGreengrassClient(versions, latency)
+    start = time.perf_counter()
+    highest_version = ggv2.get_highest_cloud_component_version(COMPONENT_ARN)
+    return time.perf_counter() - start, ggv2.client.calls, highest_version
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--versions", type=int, default=5000, help="Number of versions of the component.")
+    parser.add_argument("--latency", type=float, default=0.05, help="Latency of a request in seconds.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of cached lookups.")
+    args = parser.parse_args()
+
+    versions = create_versions(args.versions)
+    print(f"Component: {len(versions)} versions, first listed '{versions[0]}', latency {args.latency * 1000:.0f} ms")
+    with tempfile.TemporaryDirectory() as cache_dir:
+        os.environ["GDK_CACHE_DIR"] = cache_dir
+        cold_time, cold_calls, cold_version = lookup(versions, args.latency)
+        print(f"{'first listed (old)':<24} {'':8}   requests   1  highest '{versions[0]}'")
+        print(f"{'uncached':<24} {cold_time:8.3f}s  requests {cold_calls:3d}  highest '{cold_version}'")
+
+        versions.insert(0, "0.0.1")
+        timings = [lookup(versions, args.latency) for _ in range(args.repeat)]
+        warm_time = min(timing[0] for timing in timings)
+        print(f"{'cached':<24} {warm_time:8.3f}s  requests {timings[0][1]:3d}  highest '{timings[0][2]}'")
+        if timings[0][2] != cold_version:
+            raise Exception("The cached lookup returned a different highest version.")
+        print(f"Speedup: {cold_time / warm_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmarks the archive writers used by the zip build system.
+
+Compares `shutil.make_archive`, which is used by the default zip build, with the parallel archive writer used when the
+'zip_jobs' build option is set.
+
+Usage: python benchmarks/bench_zip_build.py [--files 2000] [--file-size 65536] [--jobs 8]
+"""
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+from gdk.common.ParallelZipFile import ParallelZipFile
+
+
+def create_project(root: Path, files: int, file_size: int) -> None:
+    words = [b"greengrass", b"component", b"artifact", b"recipe", b"lifecycle", b"deployment", b"nucleus", b"device"]
+    rng = random.Random(0)
+    for i in range(files):
+        module_dir = root.joinpath(f"module_{i % 50}", f"package_{i % 7}")
+        module_dir.mkdir(parents=True, exist_ok=True)
+        content = b" ".join(rng.choice(words) for _ in range(file_size // 8))
+        module_dir.joinpath(f"file_{i}.py").write_bytes(content[:file_size])
+
+
+def make_archive(source: Path, archive: Path, jobs: int) -> None:
+    shutil.make_archive(str(archive.with_suffix("")), "zip", root_dir=source)
+
+
+def parallel_archive(source: Path, archive: Path, jobs: int) -> None:
+    with ParallelZipFile(archive, jobs) as zip_file:
+        for dirpath, dirnames, filenames in os.walk(source):
+            dirnames.sort()
+            arcdirpath = os.path.relpath(dirpath, source)
+            for name in dirnames:
+                zip_file.write(os.path.join(dirpath, name), os.path.normpath(os.path.join(arcdirpath, name)))
+            for name in filenames:
+                zip_file.write(os.path.join(dirpath, name), os.path.normpath(os.path.join(arcdirpath, name)))
+
+
+def measure(name, writer, source: Path, archive: Path, jobs: int, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        if archive.exists():
+            archive.unlink()
+        start = time.perf_counter()
+        writer(source, archive, jobs)
+        timings.append(time.perf_counter() - start)
+    with zipfile.ZipFile(archive) as zip_file:
+        entries = len(zip_file.infolist())
+    best = min(timings)
+    print(f"{name:<28} best {best:8.3f}s  entries {entries}  size {archive.stat().st_size / 1024 / 1024:8.2f} MiB")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=2000, help="Number of files in the generated project.")
+    parser.add_argument("--file-size", type=int, default=64 * 1024, help="Size of each generated file in bytes.")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Number of jobs for the parallel writer.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs for each writer.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp).joinpath("project")
+        create_project(source, args.files, args.file_size)
+        print(f"Project: {args.files} files of {args.file_size} bytes, {args.jobs} jobs")
+
+        baseline = measure("shutil.make_archive", make_archive, source, Path(tmp).joinpath("baseline.zip"), 1,
+                           args.repeat)
+        parallel = measure(f"ParallelZipFile (jobs={args.jobs})", parallel_archive, source,
+                           Path(tmp).joinpath("parallel.zip"), args.jobs, args.repeat)
+        print(f"Speedup: {baseline / parallel:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmarks matching the zip build excludes on a large project.
+
+Compares listing the excluded paths with `glob.glob` for every pattern, which the zip build system used to do, with the
+compiled matcher that is evaluated while the project is walked. Both approaches must include the same files.
+
+Usage: python benchmarks/bench_zip_excludes.py [--files 100000]
+"""
+import argparse
+import glob
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from gdk.build_system.Zip import Zip
+
+DEFAULT_EXCLUDES = ["gdk-config.json", "greengrass-build", "recipe.json", "**/test*", "**/.*", "**/node_modules"]
+
+
+def create_project(root: Path, files: int) -> None:
+    """
+    Creates a project where most of the files are in directories that are excluded by default, like a component that
+    bundles its node_modules and git history.
+    """
+    layout = [("src/module_{0}", 0.2), ("node_modules/pkg_{0}/lib", 0.5), (".git/objects/{0}", 0.2), ("tests/case_{0}", 0.1)]
+    root.mkdir(parents=True)
+    root.joinpath("gdk-config.json").touch()
+    root.joinpath("recipe.json").touch()
+    for directory, share in layout:
+        count = int(files * share)
+        for i in range(count):
+            parent = root.joinpath(directory.format(i // 100))
+            if i % 100 == 0:
+                parent.mkdir(parents=True, exist_ok=True)
+            parent.joinpath(f"file_{i}.js").touch()
+
+
+def walk_included_files(root: Path, ignore):
+    included = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        ignored_names = ignore(dirpath, dirnames + filenames)
+        dirnames[:] = [name for name in dirnames if name not in ignored_names]
+        included.extend(os.path.join(dirpath, name) for name in filenames if name not in ignored_names)
+    return sorted(included)
+
+
+def glob_ignore(root: Path):
+    ignored_paths = set()
+    for pattern in DEFAULT_EXCLUDES:
+        ignored_paths |= set(glob.glob(f"{root}{os.path.sep}{pattern}", recursive=True))
+
+    def ignore(dir, names):
+        ignore_set = set()
+        for name in names:
+            full_pathname = Path(dir) / name
+            if str(full_pathname) in ignored_paths or f"{str(full_pathname)}{os.path.sep}" in ignored_paths:
+                ignore_set.add(name)
+        return ignore_set
+
+    return ignore
+
+
+def matcher_ignore(root: Path):
+    return Zip().generate_ignore_function_from_globs(root, DEFAULT_EXCLUDES)
+
+
+def measure(name, create_ignore, root: Path, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        included = walk_included_files(root, create_ignore(root))
+        timings.append(time.perf_counter() - start)
+    print(f"{name:<24} best {min(timings):8.3f}s  included files {len(included)}")
+    return min(timings), included
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=100000, help="Number of files in the generated project.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs for each approach.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp).joinpath("project")
+        create_project(root, args.files)
+        print(f"Project: {args.files} files, excludes {DEFAULT_EXCLUDES}")
+
+        glob_time, glob_included = measure("glob.glob per pattern", glob_ignore, root, args.repeat)
+        matcher_time, matcher_included = measure("GlobMatcher", matcher_ignore, root, args.repeat)
+        if glob_included != matcher_included:
+            raise Exception("The compiled matcher included different files than glob.glob.")
+        print(f"Speedup: {glob_time / matcher_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import argparse
 import logging
+import sys
 
 import gdk.common.consts as consts
 import gdk.common.model_actions as model_actions
@@ -23,9 +24,15 @@ class ArgumentParser(argparse.ArgumentParser):
 class CLIParser:
     cli_model = model_actions.get_validated_model()
 
-    def __init__(self, command, top_level_parser, model=cli_model[consts.cli_tool_name]):
-        """A class that represents an argument parser at command level."""
+    def __init__(self, command, top_level_parser, model=cli_model[consts.cli_tool_name], command_path=()):
+        """
+        A class that represents an argument parser at command level.
+
+        When a command path is given, only the subcommands on that path are added to the parser. All subcommands below the
+        end of the path are added.
+        """
         self.command_model = model
+        self.command_path = tuple(command_path)
         help_text_for_command = self.command_model["help"]
         if command != consts.cli_tool_name:
             self.top_level_parser = top_level_parser
@@ -132,8 +139,11 @@ class CLIParser:
 
         if "sub-commands" in self.command_model:
             sub_commands = self.command_model["sub-commands"]
+            if self.command_path:
+                # Other branches of the command tree are not needed to parse the arguments of the invoked command.
+                sub_commands = {self.command_path[0]: sub_commands[self.command_path[0]]}
             for sub_command, model in sub_commands.items():
-                CLIParser(sub_command, self.subparsers, model).create_parser()
+                CLIParser(sub_command, self.subparsers, model, self.command_path[1:]).create_parser()
 
     def _get_arg_from_model(self, argument):
         """
@@ -178,11 +188,93 @@ class CLIParser:
         )
 
 
+def get_command_path(args):
+    """
+    Resolves the subcommands invoked by the command-line arguments from the cli model.
+
+    Parameters
+    ----------
+      args(list): Command-line arguments without the name of the cli tool.
+
+    Returns
+    -------
+      command_path(list): Names of the subcommands, in order, up to the first argument that is not a subcommand.
+    """
+    command_path = []
+    model = CLIParser.cli_model[consts.cli_tool_name]
+    for arg in args:
+        sub_commands = model.get("sub-commands", {})
+        if arg not in sub_commands:
+            break
+        command_path.append(arg)
+        model = sub_commands[arg]
+    return command_path
+
+
+def parse_args(args=None):
+    """
+    Parses the command-line arguments with a parser that only contains the branch of the invoked command.
+
+    The parser of each command on the path has the same arguments as in the full parser, and the last command has all its
+    subcommands, so help requested at any level prints the same output. When no command is invoked or some arguments are
+    not recognized, the arguments are parsed again with the full parser so that its help and errors list every command.
+
+    Parameters
+    ----------
+      args(list): Command-line arguments without the name of the cli tool. Defaults to sys.argv.
+
+    Returns
+    -------
+      args_namespace(argparse.Namespace): Parsed arguments.
+    """
+    args = sys.argv[1:] if args is None else list(args)
+    command_path = get_command_path(args)
+    if command_path:
+        parser = _create_cli_tool(command_path).parser
+        args_namespace, unknown_args = parser.parse_known_args(args)
+        if not unknown_args:
+            return args_namespace
+    return get_cli_parser().parse_args(args)
+
+
+def get_cli_parser():
+    """
+    Returns the parser with every command of the cli. It is created on first use.
+    """
+    global _cli_tool
+    if _cli_tool is None:
+        _cli_tool = _create_cli_tool(())
+    return _cli_tool.parser
+
+
+def _create_cli_tool(command_path):
+    try:
+        cli_tool = CLIParser(consts.cli_tool_name, None, command_path=command_path)
+        cli_tool.create_parser()
+        return cli_tool
+    except Exception as e:
+        print(
+            f"{utils.error_line}Command failed due to CLI error.\nPlease report it at"
+            f" https://github.com/aws-greengrass/aws-greengrass-gdk-cli/issues if the issue persists.\nError details: {e}"
+        )
+        exit(1)
+
+
+def __getattr__(name):
+    # The full parser is only created when it is used, for example by `gdk.CLIParser.cli_parser.parse_args`.
+    if name == "cli_parser":
+        return get_cli_parser()
+    if name == "cli_tool":
+        get_cli_parser()
+        return _cli_tool
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
 def main():
     try:
         # Check the version of the cli before command parsing.
         utils.cli_version_check()
-        args_namespace = cli_parser.parse_args()
+        args_namespace = parse_args()
         parse_args_actions.run_command(args_namespace)
     except Exception as e:
         print(f"{utils.error_line}")
@@ -190,12 +282,4 @@ def main():
         exit(1)
 
 
-try:
-    cli_tool = CLIParser(consts.cli_tool_name, None)
-    cli_parser = cli_tool.create_parser()
-except Exception as e:
-    print(
-        f"{utils.error_line}Command failed due to CLI error.\nPlease report it at"
-        " https://github.com/aws-greengrass/aws-greengrass-gdk-cli/issues if the issue persists.\nError details: {}".format(e)
-    )
-    exit(1)
+_cli_tool = None
@@ -0,0 +1,80 @@
+import logging
+import threading
+from collections import Counter
+
+import boto3
+
+
+class ClientRegistry:
+    """
+    Creates the AWS clients used by a command once and shares them between the configuration and the command.
+
+    Clients are created from a single boto3 session of the registry, so the credentials are only resolved once, and reused
+    for each service and region, so their endpoints and connections are only set up once per command. The registry counts
+    the clients it creates and the API calls made with them, which are logged at the end of the command.
+    """
+
+    def __init__(self) -> None:
+        self._clients = {}
+        self._session = None
+        self._account_number = None
+        self._lock = threading.Lock()
+        self.clients_created = 0
+        self.api_calls = Counter()
+
+    def client(self, service_name, region=None, endpoint_url=None):
+        """
+        Returns the client of the service in the region, creating it on first use.
+
+        Parameters
+        ----------
+            service_name(string): Name of the AWS service, like 's3'.
+            region(string): Region of the client. The region of the session is used when not set.
+            endpoint_url(string): Endpoint of the client, like the one of an S3-compatible service. The default endpoint
+            of the service is used when not set.
+        """
+        with self._lock:
+            key = (service_name, region, endpoint_url)
+            if key not in self._clients:
+                logging.debug("Creating the '%s' client in the region '%s'.", service_name, region)
+                client = self._get_session().client(service_name, region_name=region, endpoint_url=endpoint_url)
+                events = getattr(getattr(client, "meta", None), "events", None)
+                if events is not None:
+                    events.register(f"before-parameter-build.{service_name}", self._count_api_call)
+                self._clients[key] = client
+                self.clients_created += 1
+            return self._clients[key]
+
+    def get_partition_for_region(self, region) -> str:
+        """
+        Returns the AWS partition of the region, like 'aws' or 'aws-cn'.
+        """
+        with self._lock:
+            session = self._get_session()
+        return session.get_partition_for_region(region_name=region)
+
+    def get_account_number(self) -> str:
+        """
+        Returns the account number of the credentials used by the clients. The account is only looked up once.
+        """
+        if self._account_number is None:
+            self._account_number = self.client("sts").get_caller_identity().get("Account")
+        return self._account_number
+
+    def log_statistics(self) -> None:
+        logging.debug(
+            "Created %d AWS client(s) and made %d API call(s): %s.",
+            self.clients_created,
+            sum(self.api_calls.values()),
+            ", ".join(f"{operation} x{count}" for operation, count in sorted(self.api_calls.items())) or "none",
+        )
+
+    def _get_session(self):
+        # Called with the lock held.
+        if self._session is None:
+            self._session = boto3.Session()
+        return self._session
+
+    def _count_api_call(self, model, **kwargs):
+        with self._lock:
+            self.api_calls[f"{model.service_model.service_name}:{model.name}"] += 1
@@ -1,5 +1,10 @@
 import logging
-import boto3
+
+import semver
+
+import gdk.common.consts as consts
+from gdk.aws_clients.ClientRegistry import ClientRegistry
+from gdk.common.DiskCache import DiskCache
 
 
 class Greengrassv2Client:
@@ -7,21 +12,39 @@ class Greengrassv2Client:
     Greengrasv2 client utils wrapper
     """
 
-    def __init__(self, _region):
-        self.client = boto3.client("greengrassv2", region_name=_region)
+    def __init__(self, _region, clients: ClientRegistry = None):
+        self.client = (clients or ClientRegistry()).client("greengrassv2", _region)
+        self._version_cache = DiskCache(consts.COMPONENT_VERSIONS_CACHE_NAME)
 
     def get_highest_cloud_component_version(self, component_arn) -> str:
         """
-        Gets highest version of the component from the sorted order of its versions from an account in a region.
+        Gets highest semantic version of the component from all of its versions in an account in a region.
+
+        Versions are listed with the newest version first. The highest version and the newest version seen are cached per
+        component arn, so when the newest and the highest cached versions are still on the first page of versions, only the
+        versions before the newest one need to be compared with the cached highest version, instead of listing every version
+        of the component again. Otherwise, for example when the cached highest version was deleted, every version is listed.
 
         Returns highest version of the component if it exists already. Else returns None.
         """
 
         try:
-            component_versions = self.get_component_version(component_arn)
-            if not component_versions:
+            first_page = self.client.list_component_versions(arn=component_arn)
+            versions = [version["componentVersion"] for version in first_page["componentVersions"]]
+            if not versions:
                 return None
-            return component_versions[0]["componentVersion"]
+
+            cached = self._get_cached_versions(component_arn)
+            if cached and cached["newest_version"] in versions and cached["highest_version"] in versions:
+                logging.debug("Using the cached highest version of the component '%s'.", component_arn)
+                new_versions = versions[: versions.index(cached["newest_version"])]
+                highest_version = _highest_version(new_versions + [cached["highest_version"]])
+            else:
+                highest_version = _highest_version(self._list_remaining_versions(component_arn, first_page, versions))
+
+            if highest_version:
+                self._version_cache.set(component_arn, {"highest_version": highest_version, "newest_version": versions[0]})
+            return highest_version
         except Exception:
             logging.error("Error while getting the component versions using arn: %s.", component_arn)
             raise
@@ -30,6 +53,25 @@ class Greengrassv2Client:
         comp_list_response = self.client.list_component_versions(arn=component_arn)
         return comp_list_response["componentVersions"]
 
+    def _list_remaining_versions(self, component_arn, first_page, versions) -> list:
+        versions = list(versions)
+        next_token = first_page.get("nextToken")
+        while next_token:
+            page = self.client.list_component_versions(arn=component_arn, nextToken=next_token)
+            versions.extend(version["componentVersion"] for version in page["componentVersions"])
+            next_token = page.get("nextToken")
+        logging.debug("Listed %d versions of the component '%s'.", len(versions), component_arn)
+        return versions
+
+    def _get_cached_versions(self, component_arn) -> dict:
+        cached = self._version_cache.get(component_arn)
+        if not isinstance(cached, dict):
+            return None
+        if not all(semver.Version.is_valid(str(cached.get(key))) for key in ["highest_version", "newest_version"]):
+            logging.debug("Ignoring the invalid cached versions of the component '%s'.", component_arn)
+            return None
+        return cached
+
     def create_gg_component(self, file_path) -> None:
         """
         Creates a GreengrassV2 private component version using its recipe.
@@ -47,3 +89,13 @@ class Greengrassv2Client:
             except Exception:
                 logging.error("Failed to create a private version of the component using the recipe at '%s'.", file_path)
                 raise
+
+
+def _highest_version(versions) -> str:
+    """
+    Returns the highest semantic version, ignoring the versions that are not valid semantic versions.
+    """
+    valid_versions = [version for version in versions if semver.Version.is_valid(version)]
+    if not valid_versions:
+        return None
+    return max(valid_versions, key=semver.Version.parse)
@@ -1,6 +1,7 @@
 import logging
-import boto3
 from botocore.exceptions import ClientError
+from gdk.aws_clients.ClientRegistry import ClientRegistry
+import gdk.common.consts as consts
 import gdk.common.utils as utils
 
 
@@ -9,8 +10,8 @@ class S3Client:
     S3 client wrapper
     """
 
-    def __init__(self, _region):
-        self.s3_client = boto3.client("s3", region_name=_region)
+    def __init__(self, _region, clients: ClientRegistry = None):
+        self.s3_client = (clients or ClientRegistry()).client("s3", _region)
         self._region = _region
 
     def create_bucket(self, bucket):
@@ -46,20 +47,64 @@ class S3Client:
 
     def upload_artifact(self, artifact_path, bucket, s3_key_path, extra_args):
         """
-        Uploads all the artifacts from component artifacts build folder to s3 bucket.
+        Uploads the artifact to the s3 bucket. The client is thread safe, so artifacts can be uploaded from multiple threads.
 
         Raises an exception when the request is not successful.
 
         Parameters
         ----------
-            component_name(string): Name of the component to use in the s3 file path.
-            component_version(string): Version of the component to use in the s3 file path.
-
+            artifact_path(Path): Path of the artifact to upload.
+            bucket(string): Name of the bucket to upload the artifact to.
+            s3_key_path(string): Key of the artifact in the bucket.
+            extra_args(dict): Extra arguments used by the s3 client during file transfer.
         """
         try:
             self.s3_client.upload_file(str(artifact_path.resolve()), bucket, s3_key_path, ExtraArgs=extra_args)
         except Exception:
-            logging.error("Failed to upload artifacts to s3 during")
+            logging.error("Failed to upload the artifact '%s' to s3 with the key '%s'.", artifact_path.name, s3_key_path)
+            raise
+
+    def get_artifact_checksum(self, bucket, s3_key_path):
+        """
+        Returns the SHA-256 checksum stored in the metadata of the artifact when it was published. Returns None if the
+        artifact does not exist in the bucket, was uploaded without a checksum or cannot be read.
+
+        Parameters
+        ----------
+            bucket(string): Name of the bucket of the artifact.
+            s3_key_path(string): Key of the artifact in the bucket.
+        """
+        try:
+            response = self.s3_client.head_object(Bucket=bucket, Key=s3_key_path)
+        except Exception as exc:
+            # The artifact is uploaded again when its checksum cannot be read.
+            logging.debug("Could not read the checksum of the artifact '%s'. Error: %s", s3_key_path, exc)
+            return None
+        return response.get("Metadata", {}).get(consts.ARTIFACT_CHECKSUM_METADATA_KEY)
+
+    def copy_artifact(self, bucket, source_s3_key_path, s3_key_path, extra_args):
+        """
+        Copies an artifact that is already in the bucket to a new key with a server side copy, without downloading or
+        uploading its content.
+
+        Raises an exception when the request is not successful.
+
+        Parameters
+        ----------
+            bucket(string): Name of the bucket of the artifact.
+            source_s3_key_path(string): Key of the artifact to copy.
+            s3_key_path(string): Key of the copy of the artifact.
+            extra_args(dict): Extra arguments used by the s3 client during file transfer.
+        """
+        try:
+            self.s3_client.copy(
+                {"Bucket": bucket, "Key": source_s3_key_path},
+                bucket,
+                s3_key_path,
+                ExtraArgs={**extra_args, "MetadataDirective": "REPLACE"},
+            )
+        except Exception:
+            logging.error("Failed to copy the artifact '%s' to the key '%s'.", source_s3_key_path, s3_key_path)
             raise
 
     def valid_bucket_for_artifacts_exists(self, bucket, region) -> bool:
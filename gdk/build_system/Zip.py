@@ -1,12 +1,14 @@
-import glob
 import os
 import shutil
 import logging
+import zipfile
 from pathlib import Path
 
 import gdk.common.utils as utils
 import gdk.common.consts as consts
 from gdk.build_system.GDKBuildSystem import GDKBuildSystem
+from gdk.common.GlobMatcher import GlobMatcher
+from gdk.common.ParallelZipFile import ParallelZipFile
 from gdk.commands.component.config.ComponentBuildConfiguration import ComponentBuildConfiguration
 
 
@@ -16,7 +18,9 @@ class Zip(GDKBuildSystem):
 
     Copies over necessary files by excluding certain files to a build folder identied for zip build system
     (supported_component_builds.json has the build folder info).
-    This build folder is zipped completely as a component zip artifact.
+    This build folder is zipped completely as a component zip artifact. When the 'zip_mode' build option is set to
+    'stream', the files are written straight into the component zip artifact without copying them to the build folder.
+    The 'zip_jobs' build option sets the number of jobs used to compress the files.
     Raises an exception if there's an error in the process of zippings.
     """
 
@@ -37,55 +41,125 @@ class Zip(GDKBuildSystem):
             project_config: ComponentBuildConfiguration = kwargs.get("project_config")
             # Only one zip-build folder in the set
             zip_build = utils.get_current_directory().joinpath(*self.build_folder).resolve()
-            artifacts_zip_build = Path(zip_build).joinpath(utils.get_current_directory().name).resolve()
             utils.clean_dir(zip_build)
-            logging.debug("Copying over component files to the '{}' folder.".format(artifacts_zip_build.name))
             root_directory_path = utils.get_current_directory()
 
-            unwanted_paths = self.generate_ignore_list_from_globs(root_directory_path,
-                                                                  self.get_ignored_file_patterns(project_config))
-            self.smart_excludes_warning(project_config)
-
-            def ignore_with_glob_support(dir, names):
-                ignore_set = set()
-                for name in names:
-                    full_pathname = Path(dir) / name
-                    if str(full_pathname) in unwanted_paths or f"{str(full_pathname)}{os.path.sep}" in unwanted_paths:
-                        ignore_set.add(name)
-                return ignore_set
-
-            shutil.copytree(
-                root_directory_path,
-                artifacts_zip_build,
-                ignore=ignore_with_glob_support,
+            ignore_with_glob_support = self.generate_ignore_function_from_globs(
+                root_directory_path, self.get_ignored_file_patterns(project_config)
             )
+            self.smart_excludes_warning(project_config)
 
-            # Get build file name without extension. This will be used as name of the archive.
-            archive_file = utils.get_current_directory().name
-            zip_name_setting = project_config.build_options.get("zip_name", None)
-            if zip_name_setting is not None:
-                if len(zip_name_setting):
-                    archive_file = zip_name_setting
-                else:
-                    archive_file = project_config.component_name
-            logging.debug(
-                "Creating an archive named '{}.zip' in '{}' folder with the files in '{}' folder.".format(
-                    archive_file, zip_build.name, artifacts_zip_build.name
-                )
-            )
-            archive_file_name = Path(zip_build).joinpath(archive_file).resolve()
-            shutil.make_archive(archive_file_name, "zip", root_dir=artifacts_zip_build)
+            archive_file = self.get_archive_name(project_config)
+            jobs = self.get_zip_jobs(project_config)
+            if self.get_zip_mode(project_config) == "stream":
+                self.stream_archive(root_directory_path, zip_build, archive_file, ignore_with_glob_support, jobs)
+            else:
+                self.copy_and_archive(root_directory_path, zip_build, archive_file, ignore_with_glob_support, jobs)
             logging.debug("Archive complete.")
 
         except Exception:
             logging.error("Failed to zip the component in default build mode.")
             raise
 
+    def copy_and_archive(self, root_directory_path, zip_build, archive_file, ignore, jobs=1):
+        """
+        Copies the component files into the zip-build folder and zips the copied folder as the component artifact.
+        """
+        artifacts_zip_build = Path(zip_build).joinpath(root_directory_path.name).resolve()
+        logging.debug("Copying over component files to the '{}' folder.".format(artifacts_zip_build.name))
+        shutil.copytree(
+            root_directory_path,
+            artifacts_zip_build,
+            ignore=ignore,
+        )
+        logging.debug(
+            "Creating an archive named '{}.zip' in '{}' folder with the files in '{}' folder.".format(
+                archive_file, zip_build.name, artifacts_zip_build.name
+            )
+        )
+        archive_file_name = Path(zip_build).joinpath(archive_file).resolve()
+        if jobs > 1:
+            self.write_archive(artifacts_zip_build, Path(f"{archive_file_name}.zip"), None, jobs)
+        else:
+            shutil.make_archive(archive_file_name, "zip", root_dir=artifacts_zip_build)
+
+    def stream_archive(self, root_directory_path, zip_build, archive_file, ignore, jobs=1):
+        """
+        Walks the component files once and writes them straight into the component zip artifact without creating a
+        staging copy of the project.
+        """
+        Path.mkdir(zip_build, parents=True, exist_ok=True)
+        archive_file_name = Path(zip_build).joinpath(f"{archive_file}.zip").resolve()
+        logging.debug("Streaming component files into an archive named '{}.zip' in '{}' folder.".format(
+            archive_file, zip_build.name))
+
+        def ignore_with_zip_build(dir, names):
+            ignore_set = ignore(dir, names)
+            if Path(dir) == root_directory_path:
+                # The zip-build folder is created after copytree lists the project, so it is never part of the archive.
+                ignore_set.add(zip_build.name)
+            return ignore_set
+
+        self.write_archive(root_directory_path, archive_file_name, ignore_with_zip_build, jobs)
+
+    def write_archive(self, source_directory, archive_file_name, ignore, jobs):
+        """
+        Writes the files in the source directory into a zip archive, deflating them with the given number of jobs.
+
+        The archive has the same entries as the one created by `shutil.make_archive`. Directories are written in sorted
+        order followed by the files in each directory, and ignored directories are not walked into.
+        """
+        if jobs > 1:
+            logging.debug("Compressing the archive '{}' with {} jobs.".format(archive_file_name.name, jobs))
+            zip_file = ParallelZipFile(archive_file_name, jobs)
+        else:
+            zip_file = zipfile.ZipFile(archive_file_name, "w", compression=zipfile.ZIP_DEFLATED)
+
+        with zip_file as archive:
+            for dirpath, dirnames, filenames in os.walk(source_directory, followlinks=True):
+                ignored_names = ignore(dirpath, dirnames + filenames) if ignore else set()
+                dirnames[:] = sorted(name for name in dirnames if name not in ignored_names)
+                arcdirpath = os.path.relpath(dirpath, source_directory)
+                for name in dirnames:
+                    archive.write(os.path.join(dirpath, name), os.path.normpath(os.path.join(arcdirpath, name)))
+                for name in filenames:
+                    path = os.path.join(dirpath, name)
+                    if name not in ignored_names and os.path.isfile(path):
+                        archive.write(path, os.path.normpath(os.path.join(arcdirpath, name)))
+
+    def get_archive_name(self, project_config: ComponentBuildConfiguration) -> str:
+        """
+        Returns the name of the component zip artifact without extension.
+        """
+        # Get build file name without extension. This will be used as name of the archive.
+        archive_file = utils.get_current_directory().name
+        zip_name_setting = project_config.build_options.get("zip_name", None)
+        if zip_name_setting is not None:
+            if len(zip_name_setting):
+                archive_file = zip_name_setting
+            else:
+                archive_file = project_config.component_name
+        return archive_file
+
+    def get_zip_mode(self, project_config: ComponentBuildConfiguration) -> str:
+        """
+        Returns the mode used to create the component zip artifact. 'copy' stages the files in the zip-build folder before
+        zipping them and 'stream' writes the files straight into the archive.
+        """
+        return project_config.build_options.get("zip_mode", "copy").strip().lower()
+
+    def get_zip_jobs(self, project_config: ComponentBuildConfiguration) -> int:
+        """
+        Returns the number of jobs used to compress the component zip artifact. Files are compressed one after another
+        when the 'zip_jobs' build option is not set.
+        """
+        return max(int(project_config.build_options.get("zip_jobs", 1)), 1)
+
     def get_ignored_file_patterns(self, project_config: ComponentBuildConfiguration) -> list:
         """
         Creates a list of files or directory patterns to ignore while copying a directory.
 
-        When no `exclude` option is present on the build configuration, it excludes:
+        When no options other than `zip_mode` and `zip_jobs` are present on the build configuration, it excludes:
         1. project config file -> gdk-config.json
         2. greengrass-build directory
         3. recipe file
@@ -107,7 +181,8 @@ class Zip(GDKBuildSystem):
             project_config.recipe_file.name,
         ]
 
-        if not options:
+        # The zip_mode and zip_jobs options do not change the files of the archive, so they do not turn off the defaults.
+        if not set(options) - {"zip_mode", "zip_jobs"}:
             ignore_list.extend(
                 [
                     "**/test*",
@@ -120,13 +195,27 @@ class Zip(GDKBuildSystem):
 
         return ignore_list
 
-    def generate_ignore_list_from_globs(self, root_directory, globs):
-        ignored_pathnames = set()
-        for pattern in globs:
-            # glob.glob has a root_dir parameter, but only for python 3.10+, so we prepend the root dir to the glob pattern
-            glob_pattern_whole = f"{root_directory}{os.path.sep}{pattern}"
-            ignored_pathnames = ignored_pathnames | set(glob.glob(glob_pattern_whole, recursive=True))
-        return ignored_pathnames
+    def generate_ignore_function_from_globs(self, root_directory, globs):
+        """
+        Creates an ignore function for `shutil.copytree` that ignores the files and directories matching the glob patterns
+        relative to the root directory.
+
+        The patterns are compiled once and matched as the directory tree is walked, so ignored directories are never
+        listed.
+        """
+        matcher = GlobMatcher(globs)
+        root_directory = str(root_directory)
+
+        def ignore_with_glob_support(dir, names):
+            relative_dir = os.path.relpath(dir, root_directory)
+            dir_parts = () if relative_dir == os.curdir else tuple(Path(relative_dir).parts)
+            ignore_set = set()
+            for name in names:
+                if matcher.matches(dir_parts + (name,), lambda: os.path.isdir(os.path.join(dir, name))):
+                    ignore_set.add(name)
+            return ignore_set
+
+        return ignore_with_glob_support
 
     def smart_excludes_warning(self, project_config: ComponentBuildConfiguration):
         """
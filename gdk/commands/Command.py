@@ -74,11 +74,11 @@ class Command:
           _non_conflicting_args_map(dict): A dictionary object formed with argument as a key and a set of its non-conflicting
           args as value.
         """
-        from gdk.CLIParser import cli_tool
+        from gdk.CLIParser import CLIParser
 
         _non_conflicting_args_map = {}
 
-        cli_model = self.get_sub_c(next(iter(cli_tool.cli_model.keys())), cli_tool.cli_model)
+        cli_model = self.get_sub_c(next(iter(CLIParser.cli_model.keys())), CLIParser.cli_model)
         if not cli_model:
             return {}
         if self.name in cli_model and "conflicting_arg_groups" in cli_model[self.name]:
@@ -6,18 +6,25 @@ import gdk.common.consts as consts
 import gdk.common.exceptions.error_messages as error_messages
 import gdk.common.utils as utils
 
+from gdk.aws_clients.ClientRegistry import ClientRegistry
 from gdk.build_system.ComponentBuildSystem import ComponentBuildSystem
 from gdk.commands.Command import Command
+from gdk.commands.component.cache.BuildCache import BuildCache
+from gdk.commands.component.cache.SharedBuildCache import SharedBuildCache
 from gdk.commands.component.transformer.BuildRecipeTransformer import BuildRecipeTransformer
 from gdk.commands.component.config.ComponentBuildConfiguration import ComponentBuildConfiguration
 
 
 class BuildCommand(Command):
-    def __init__(self, command_args) -> None:
+    def __init__(self, command_args, clients: ClientRegistry = None) -> None:
         super().__init__(command_args, "build")
 
+        # AWS clients of the build, shared with the command that runs it, like the publish command.
+        self.clients = clients or ClientRegistry()
         self.project_config = ComponentBuildConfiguration(command_args)
-        self.build_recipe_transformer = BuildRecipeTransformer(self.project_config)
+        self.build_recipe_transformer = BuildRecipeTransformer(self.project_config, self.clients)
+        # Build files of the modules in the project found by the command, by the name of the file.
+        self._build_files = {}
 
     def run(self):
         """
@@ -30,6 +37,14 @@ class BuildCommand(Command):
         If the project configuration specifies custom build system with a custom build command, then the tool executes
         the command as it is.
 
+        The build is skipped when its inputs did not change since the last successful build and the outputs of that build
+        are still in the "greengrass-build" folder, or when the outputs of a build with the same inputs are found in the
+        shared build cache, unless the '--no-cache' argument is provided.
+
+        Only the component recipes and artifacts in the "greengrass-build" folder are replaced by the build. Other content
+        of the folder, like the built test module and the downloaded nucleus archive, is kept unless the '--clean' argument
+        is provided, which removes the whole folder before the build.
+
         Parameters
         ----------
             None
@@ -41,25 +56,80 @@ class BuildCommand(Command):
         build_system = self.project_config.build_system
 
         logging.info("Building the component '%s' with the given project configuration.", self.project_config.component_name)
-
-        # Create build directories
-        self.create_gg_build_directories()
+        if self.arguments.get("clean"):
+            logging.info("Removing the '%s' folder as '--clean' is provided in the command.", consts.greengrass_build_dir)
+            utils.clean_dir(self.project_config.gg_build_dir)
 
         if build_system == "custom":
+            # The outputs of a custom build command are not known, so the outputs of previous builds are removed first.
+            utils.clean_dir(self.project_config.gg_build_recipes_dir)
+            utils.clean_dir(self.project_config.gg_build_artifacts_dir)
+            # Create build directories
+            self.create_gg_build_directories()
             # Run custom command as is.
             custom_build_command = self.project_config.build_config.get("custom_build_command", [])
             logging.info("Using custom build configuration to build the component.")
             logging.info("Running the following command\n%s", custom_build_command)
             sp.run(custom_build_command, check=True)
         else:
-            logging.info("Using '%s' build system to build the component.", build_system)
-            self.default_build_component()
+            build_cache = self._get_build_cache()
+            try:
+                self._build_with_cache(build_cache)
+            finally:
+                if build_cache and build_cache.backend:
+                    build_cache.backend.log_statistics()
+
+    def _build_with_cache(self, build_cache):
+        if build_cache and build_cache.is_up_to_date():
+            logging.info(
+                "Component '%s' is up to date with its last build. Skipping the build. Use '--no-cache' to build it again.",
+                self.project_config.component_name,
+            )
+            return
+        if build_cache and build_cache.restore():
+            return
+        # Create build directories
+        self.create_gg_build_directories()
+        logging.info("Using '%s' build system to build the component.", self.project_config.build_system)
+        self.default_build_component()
+        if build_cache:
+            build_cache.save()
+
+    def _get_build_cache(self):
+        """
+        Returns the cache used to skip the build when its inputs did not change. Returns None when the '--no-cache' argument
+        is provided in the command.
+
+        Builds with a custom build command are not cached as their inputs are not known to the tool. When a shared build
+        cache is configured, the outputs of builds are also stored in and fetched from it.
+        """
+        if self.arguments.get("no_cache"):
+            logging.debug("Not using the build cache as '--no-cache' is provided in the command.")
+            return None
+        backend = None
+        if self.project_config.build_cache_config:
+            backend = SharedBuildCache.get(self.project_config.build_cache_config, self.clients)
+            logging.debug("Using the build cache '%s'.", backend.location)
+        return BuildCache(self.project_config, output_dirs=self._get_build_output_dirs(), backend=backend)
+
+    def _get_build_output_dirs(self) -> set:
+        """
+        Returns the folders the build system writes its outputs to in each module of the project, like `<module>/target`
+        for maven and `<module>/build` for gradle, whether or not they exist yet.
+        """
+        build_system = ComponentBuildSystem.get(self.project_config.build_system)
+        output_dirs = set()
+        for identifier in build_system.build_system_identifier:
+            for module_dir in self._get_module_dirs(identifier):
+                output_dirs.add(Path(module_dir).joinpath(build_system.build_folder[0]).resolve())
+        return output_dirs
 
     def create_gg_build_directories(self):
         """
         Creates "greengrass-build" directory with component artifacts and recipes sub directories.
 
-        This method removes the "greengrass-build" directory if it already exists.
+        The content of the "greengrass-build" directory is kept if it already exists. The outputs of previous builds that
+        are not written again by the build are removed after it.
 
         Parameters
         ----------
@@ -69,9 +139,6 @@ class BuildCommand(Command):
         -------
             None
         """
-        # Clean build directory if it exists already.
-        utils.clean_dir(self.project_config.gg_build_dir)
-
         logging.debug("Creating '%s' directory with artifacts and recipes.", consts.greengrass_build_dir)
         # Create build artifacts and recipe directories
         Path.mkdir(self.project_config.gg_build_recipes_dir, parents=True, exist_ok=True)
@@ -99,10 +166,57 @@ class BuildCommand(Command):
             # Build the project with specified build system
             self.run_build_command()
             self.build_recipe_transformer.transform(self._get_build_folder_by_build_system())
+            self.remove_stale_outputs()
         except Exception:
             logging.error(error_messages.BUILD_FAILED)
+            self.remove_outputs()
             raise
 
+    def remove_outputs(self):
+        """
+        Removes the recipes, the artifacts of previous builds and the manifest of the last build from the
+        "greengrass-build" folder after a failed build, so that the outputs of a previous build are neither published nor
+        reused by the build cache. Artifacts staged by the failed build are kept.
+
+        Parameters
+        ----------
+            None
+
+        Returns
+        -------
+            None
+        """
+        logging.debug("Removing the component recipes and the artifacts of previous builds.")
+        utils.clean_dir(self.project_config.gg_build_recipes_dir)
+        self.remove_stale_outputs()
+        manifest_file = self.project_config.gg_build_dir.joinpath(consts.BUILD_MANIFEST_FILE)
+        if manifest_file.is_file():
+            manifest_file.unlink()
+
+    def remove_stale_outputs(self):
+        """
+        Removes the recipes and artifacts in the "greengrass-build" folder that were not written by the last build, like
+        artifacts that are no longer in the recipe or the artifacts of other component versions.
+
+        Parameters
+        ----------
+            None
+
+        Returns
+        -------
+            None
+        """
+        build_outputs = self.build_recipe_transformer.build_outputs
+        for output_dir in [self.project_config.gg_build_recipes_dir, self.project_config.gg_build_artifacts_dir]:
+            # Reverse order visits the content of a directory before the directory itself.
+            for path in sorted(Path(output_dir).rglob("*"), reverse=True):
+                if path.is_dir() and not path.is_symlink():
+                    if path != self.project_config.gg_build_component_artifacts_dir and not any(path.iterdir()):
+                        path.rmdir()
+                elif path.resolve() not in build_outputs:
+                    logging.debug("Removing the output '%s' of a previous build.", path)
+                    path.unlink()
+
     def run_build_command(self):
         """
         Runs the build command based on the configuration in 'project_build_system.json' file and component project build
@@ -148,11 +262,36 @@ class BuildCommand(Command):
             build_folder(Path): Path to the build folder created by component build system.
         """
         build_system_identifiers = self.component_build_system.build_system_identifier
+        self.find_build_files(build_system_identifiers)
         build_folders = set()
         for identifier in build_system_identifiers:
             build_folders = build_folders.union(self.get_build_folders(self.component_build_system.build_folder, identifier))
         return build_folders
 
+    def find_build_files(self, build_files) -> dict:
+        """
+        Finds the build files of the modules in the project, like pom.xml and build.gradle, with a single walk of the
+        project. Output and version control folders are not searched.
+
+        The files found are kept by the command, so other build steps that look up the same build files do not walk the
+        project again.
+
+        Parameters
+        ----------
+            build_files(list): Names of the build files.
+
+        Returns
+        -------
+            (dict): Paths of the build files found in the project for each name.
+        """
+        missing_build_files = [build_file for build_file in build_files if build_file not in self._build_files]
+        if missing_build_files:
+            logging.debug("Looking for the build files %s in the project.", missing_build_files)
+            self._build_files.update(
+                utils.find_files(utils.get_current_directory(), missing_build_files, consts.MODULE_SEARCH_EXCLUDED_DIRS)
+            )
+        return {build_file: self._build_files[build_file] for build_file in build_files}
+
     def get_build_folders(self, build_folder, build_file):
         """
         Recursively identifies build folders in a project.
@@ -171,12 +310,18 @@ class BuildCommand(Command):
         -------
             paths(set): Set of build folder paths in a multi-module project.
         """
-        # Filter module directories which contain pom.xml, build.gradle, build.gradle.kts build files.
-        set_dirs_with_build_file = set(f.parent for f in Path(utils.get_current_directory()).rglob(build_file))
         set_of_module_dirs = set()
-        for module_dir in set_dirs_with_build_file:
+        for module_dir in self._get_module_dirs(build_file):
             module_build_folder = Path(module_dir).joinpath(*build_folder).resolve()
             # Filter module directories that also contain build folders - target/, build/libs/
             if module_build_folder.exists():
                 set_of_module_dirs.add(module_build_folder)
         return set_of_module_dirs
+
+    def _get_module_dirs(self, build_file) -> set:
+        # Filter module directories which contain pom.xml, build.gradle, build.gradle.kts build files.
+        set_dirs_with_build_file = set(f.parent for f in self.find_build_files([build_file])[build_file])
+        if build_file == consts.cli_project_config_file:
+            # Components of a project with multiple components are built in their own directories without a config file.
+            set_dirs_with_build_file.add(Path(utils.get_current_directory()))
+        return set_dirs_with_build_file
@@ -0,0 +1,153 @@
+import logging
+import operator
+import re
+
+import semver
+
+import gdk.common.exceptions.error_messages as error_messages
+from gdk.common.CaseInsensitive import CaseInsensitiveRecipeFile
+
+_COMPARATOR = re.compile(r"^(>=|<=|>|<|=)?v?(.+)$")
+_OPERATORS = {">=": operator.ge, "<=": operator.le, ">": operator.gt, "<": operator.lt, "=": operator.eq}
+
+
+class ComponentGraph:
+    """
+    Dependencies between the components of a project with multiple components.
+
+    The dependencies are read from the 'ComponentDependencies' of the recipe of each component. Only the dependencies on
+    other components of the project order the builds and publishes. Dependencies on components outside of the project are
+    resolved by the Greengrass service when the component is deployed.
+
+    Raises an exception when the components depend on each other in a cycle, or when a component requires a version of
+    another component of the project that is not the version in the project configuration.
+    """
+
+    def __init__(self, components: dict, component_dirs: dict) -> None:
+        self.dependencies = {
+            component_name: self._get_local_dependencies(component_name, component_dir, components)
+            for component_name, component_dir in component_dirs.items()
+        }
+        self.order = self._sort()
+        self._depths = self._get_depths()
+
+    def get_priority(self, component_name) -> int:
+        """
+        Returns the number of components on the longest chain of components that depend on the component, including the
+        component itself. Components with longer chains are started first, as the chain has to run one after the other.
+        """
+        return self._depths[component_name]
+
+    def get_critical_path(self, durations: dict):
+        """
+        Finds the chain of dependent components with the longest total duration. All the components cannot finish faster
+        than the components on this path, however many of them run at the same time.
+
+        Parameters
+        ----------
+            durations(dict): Duration in seconds of each component.
+
+        Returns
+        -------
+            path(list): Names of the components on the critical path, in the order they ran.
+            duration(float): Total duration of the components on the critical path.
+        """
+        finish = {}
+        previous = {}
+        for component_name in self.order:
+            slowest_dependency = max(self.dependencies[component_name], key=lambda name: finish[name], default=None)
+            previous[component_name] = slowest_dependency
+            finish[component_name] = durations.get(component_name, 0) + finish.get(slowest_dependency, 0)
+        component_name = max(self.order, key=lambda name: finish[name])
+        duration = finish[component_name]
+        path = []
+        while component_name is not None:
+            path.append(component_name)
+            component_name = previous[component_name]
+        return path[::-1], duration
+
+    def _get_local_dependencies(self, component_name, component_dir, components: dict) -> list:
+        recipe = self._read_recipe(component_dir)
+        dependencies = []
+        for dependency_name, dependency in (recipe.get("ComponentDependencies") or {}).items():
+            if dependency_name not in components:
+                continue
+            requirement = (dependency or {}).get("VersionRequirement")
+            version = components[dependency_name].get("version")
+            if requirement and semver.Version.is_valid(str(version)) and not _satisfies(version, str(requirement)):
+                raise Exception(
+                    error_messages.COMPONENT_DEPENDENCY_VERSION_NOT_FOUND.format(
+                        component_name, requirement, dependency_name, version
+                    )
+                )
+            dependencies.append(dependency_name)
+        return sorted(dependencies)
+
+    def _read_recipe(self, component_dir):
+        recipe_files = [component_dir.joinpath(name) for name in ["recipe.json", "recipe.yaml"]]
+        recipe_files = [recipe_file for recipe_file in recipe_files if recipe_file.is_file()]
+        if len(recipe_files) != 1:
+            # The command of the component reports the missing recipe.
+            return {}
+        try:
+            return CaseInsensitiveRecipeFile().read(recipe_files[0])
+        except Exception as e:
+            logging.debug("Could not read the dependencies of the component in '%s'. Error: %s", component_dir, e)
+            return {}
+
+    def _sort(self) -> list:
+        remaining = {component_name: set(dependencies) for component_name, dependencies in self.dependencies.items()}
+        order = []
+        while remaining:
+            ready = sorted(component_name for component_name, dependencies in remaining.items() if not dependencies)
+            if not ready:
+                raise Exception(error_messages.COMPONENT_DEPENDENCY_CYCLE.format(" -> ".join(self._find_cycle(remaining))))
+            for component_name in ready:
+                order.append(component_name)
+                del remaining[component_name]
+            for dependencies in remaining.values():
+                dependencies.difference_update(ready)
+        return order
+
+    def _find_cycle(self, remaining: dict) -> list:
+        # Every remaining component depends on another remaining component, so following them leads to a cycle.
+        path = [min(remaining)]
+        while path[-1] not in path[:-1]:
+            path.append(min(remaining[path[-1]]))
+        return path[path.index(path[-1]):]
+
+    def _get_depths(self) -> dict:
+        depths = {}
+        for component_name in reversed(self.order):
+            dependents = [name for name, dependencies in self.dependencies.items() if component_name in dependencies]
+            depths[component_name] = 1 + max((depths[name] for name in dependents), default=0)
+        return depths
+
+
+def _satisfies(version, requirement) -> bool:
+    """
+    Checks the version against a version requirement of a component dependency, which uses the npm-style syntax of
+    Greengrass. Requirements that cannot be parsed are considered satisfied and left to the Greengrass service.
+    """
+    version = semver.Version.parse(version)
+    try:
+        return any(
+            all(_matches(version, comparator) for comparator in alternative.split())
+            for alternative in requirement.split("||")
+        )
+    except ValueError:
+        return True
+
+
+def _matches(version, comparator) -> bool:
+    if comparator[0] in "^~":
+        lower = semver.Version.parse(comparator[1:])
+        if comparator[0] == "~" or (lower.major == 0 and lower.minor > 0):
+            upper = lower.bump_minor()
+        elif lower.major == 0:
+            upper = lower.bump_patch()
+        else:
+            upper = lower.bump_major()
+        return lower <= version < upper
+    match = _COMPARATOR.match(comparator)
+    return _OPERATORS[match.group(1) or "="](version, semver.Version.parse(match.group(2)))
@@ -0,0 +1,257 @@
+import contextlib
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+import gdk.common.configuration as configuration
+import gdk.common.consts as consts
+import gdk.common.exceptions.error_messages as error_messages
+import gdk.common.utils as utils
+from gdk.commands.component.ComponentGraph import ComponentGraph
+
+# Past tense of the commands that the scheduler runs, used in the log messages.
+_COMMANDS_DONE = {"build": "Built", "publish": "Published"}
+
+
+class ComponentScheduler:
+    """
+    Builds or publishes the components of a project with multiple components at the same time.
+
+    The command of each component runs in a worker process in the directory of the component, which is set by its 'path'
+    in the project configuration, so every component has its own greengrass-build folder. A component only starts after
+    the components of the project that it depends on in its recipe succeeded. Components that do not depend on each other
+    run at the same time.
+
+    The output of each command is written to a log file of the component in the greengrass-build/logs folder of the
+    project. The command finishes with a summary of the result and the duration of every component and the critical path
+    of the dependencies between them.
+    """
+
+    def __init__(self, command_name, command_args, project_config: dict) -> None:
+        self.command_name = command_name
+        self.command_args = command_args
+        self.project_dir = utils.get_current_directory()
+        self.config_file = self.project_dir.joinpath(consts.cli_project_config_file).resolve()
+        components = project_config.get("component", {})
+        self.component_dirs = self._get_component_dirs(components)
+        self.graph = ComponentGraph(components, self.component_dirs)
+        self.logs_dir = self.project_dir.joinpath(consts.greengrass_build_dir, consts.BUILD_LOGS_DIR, command_name)
+        self.jobs = min(command_args.get("jobs") or os.cpu_count() or 1, len(self.component_dirs))
+
+    @staticmethod
+    def is_required(project_config: dict) -> bool:
+        """
+        Checks if the components of the project are built and published by the scheduler. That is the case for projects
+        with multiple components, or with a component in a directory other than the project directory.
+        """
+        components = project_config.get("component", {})
+        project_dir = utils.get_current_directory()
+        return len(components) > 1 or any(
+            project_dir.joinpath(component.get("path", ".")).resolve() != project_dir for component in components.values()
+        )
+
+    def run(self) -> None:
+        """
+        Runs the command of every component of the project in a pool of worker processes and logs a summary of the results.
+        Components start as soon as the components they depend on succeeded. Components that depend on a component that
+        failed are skipped.
+
+        Raises an exception when the command of any component failed or was skipped.
+        """
+        self.logs_dir.mkdir(parents=True, exist_ok=True)
+        logging.info(
+            "Running the %s command of %d components with %d jobs. The log of each component is written to '%s'.",
+            self.command_name,
+            len(self.component_dirs),
+            self.jobs,
+            self.logs_dir,
+        )
+        start = time.perf_counter()
+        results = {}
+        pending = sorted(self.component_dirs, key=lambda name: (-self.graph.get_priority(name), name))
+        # Workers are spawned rather than forked, as forking this process with the threads of boto3 and of the update check
+        # can leave the workers waiting for locks held by those threads.
+        with ProcessPoolExecutor(max_workers=self.jobs, mp_context=multiprocessing.get_context("spawn")) as executor:
+            running = {}
+            while pending or running:
+                self._skip_failed_dependents(pending, results)
+                for component_name in [name for name in pending if self._is_ready(name, results)]:
+                    pending.remove(component_name)
+                    running[self._submit(executor, component_name)] = component_name
+                done, _ = wait(running, return_when=FIRST_COMPLETED) if running else (set(), None)
+                for future in done:
+                    del running[future]
+                    result = future.result()
+                    self._log_result(result)
+                    results[result["component"]] = result
+        self._log_summary(list(results.values()), time.perf_counter() - start)
+
+        failed = sorted(name for name, result in results.items() if not result["succeeded"])
+        if failed:
+            raise Exception(
+                f"Failed to {self.command_name} the components {failed}. Please check the logs in '{self.logs_dir}'."
+            )
+
+    def get_log_file(self, component_name) -> Path:
+        return self.logs_dir.joinpath(f"{component_name}.log")
+
+    def _submit(self, executor, component_name):
+        return executor.submit(
+            run_component_command,
+            self.command_name,
+            self.config_file,
+            component_name,
+            self.component_dirs[component_name],
+            self.command_args,
+            self.get_log_file(component_name),
+            logging.getLogger().getEffectiveLevel(),
+        )
+
+    def _is_ready(self, component_name, results: dict) -> bool:
+        return all(dependency in results for dependency in self.graph.dependencies[component_name])
+
+    def _log_result(self, result: dict) -> None:
+        if result["succeeded"]:
+            logging.info(
+                "%s the component '%s' in %.2f seconds.",
+                _COMMANDS_DONE[self.command_name],
+                result["component"],
+                result["duration"],
+            )
+        else:
+            logging.error(
+                "Failed to %s the component '%s'. Error: %s", self.command_name, result["component"], result["error"]
+            )
+
+    def _skip_failed_dependents(self, pending: list, results: dict) -> None:
+        # Dependents of a skipped component are skipped as well, so components are checked in the order of the graph.
+        for component_name in [name for name in self.graph.order if name in pending]:
+            failed_dependencies = [
+                dependency
+                for dependency in self.graph.dependencies[component_name]
+                if dependency in results and not results[dependency]["succeeded"]
+            ]
+            if failed_dependencies:
+                pending.remove(component_name)
+                results[component_name] = {
+                    "component": component_name,
+                    "succeeded": False,
+                    "skipped": True,
+                    "duration": 0.0,
+                    "error": f"Skipped as the components {failed_dependencies} that it depends on did not succeed.",
+                }
+                self._log_result(results[component_name])
+
+    def _get_component_dirs(self, components: dict) -> dict:
+        component_dirs = {}
+        for component_name, component in components.items():
+            component_dir = self.project_dir.joinpath(component.get("path", ".")).resolve()
+            if not component_dir.is_dir():
+                raise Exception(error_messages.COMPONENT_DIR_NOT_FOUND.format(component_dir, component_name))
+            for other_component, other_dir in component_dirs.items():
+                if other_dir == component_dir:
+                    raise Exception(
+                        error_messages.COMPONENT_DIRS_CONFLICT.format(other_component, component_name, component_dir)
+                    )
+            if len(components) > 1 and component_dir == self.project_dir:
+                raise Exception(error_messages.COMPONENT_DIR_IS_PROJECT_DIR.format(component_name))
+            component_dirs[component_name] = component_dir
+        return component_dirs
+
+    def _log_summary(self, results, duration) -> None:
+        name_width = max(len(result["component"]) for result in results)
+        logging.info("Summary:")
+        for result in sorted(results, key=lambda r: r["duration"], reverse=True):
+            if result["succeeded"]:
+                status = "SUCCEEDED"
+            else:
+                status = "SKIPPED" if result.get("skipped") else "FAILED"
+            logging.info("  %s  %-9s  %8.2fs", result["component"].ljust(name_width), status, result["duration"])
+
+        critical_path, critical_duration = self.graph.get_critical_path(
+            {result["component"]: result["duration"] for result in results}
+        )
+        logging.info("Critical path (%.2f seconds): %s", critical_duration, " -> ".join(critical_path))
+        succeeded = sum(1 for result in results if result["succeeded"])
+        logging.info(
+            "%s %d of %d components in %.2f seconds.", _COMMANDS_DONE[self.command_name], succeeded, len(results), duration
+        )
+
+
+def run_component_command(command_name, config_file, component_name, component_dir, command_args, log_file, log_level):
+    """
+    Builds or publishes one component of a project with multiple components in a worker process.
+
+    The worker runs in the directory of the component. The log of the command and the output of the commands it runs are
+    written to the log file.
+
+    Returns
+    -------
+        result(dict): Name of the component, whether the command succeeded, its duration in seconds and the error if it
+        failed.
+    """
+    start = time.perf_counter()
+    error = None
+    with open(log_file, "w", buffering=1, encoding="utf-8") as log_stream, _redirect_output(log_stream, log_level):
+        try:
+            os.chdir(component_dir)
+            configuration.select_component(config_file, component_name)
+            _get_command_class(command_name)(command_args).run()
+        except Exception as e:
+            logging.exception("Failed to %s the component '%s'.", command_name, component_name)
+            error = str(e)
+    return {
+        "component": component_name,
+        "succeeded": error is None,
+        "duration": time.perf_counter() - start,
+        "error": error,
+    }
+
+
+def _get_command_class(command_name):
+    if command_name == "publish":
+        from gdk.commands.component.PublishCommand import PublishCommand
+
+        return PublishCommand
+    from gdk.commands.component.BuildCommand import BuildCommand
+
+    return BuildCommand
+
+
+@contextlib.contextmanager
+def _redirect_output(log_stream, log_level):
+    """
+    Sends the log records and the stdout and stderr of the worker process, including the output of the build commands, to
+    the log stream. Workers run one component at a time, so the output is restored for the next component afterwards.
+    """
+    root_logger = logging.getLogger()
+    handlers = list(root_logger.handlers)
+    level = root_logger.level
+    log_handler = logging.StreamHandler(log_stream)
+    log_handler.setFormatter(logging.Formatter(consts.log_format, consts.date_format))
+    for handler in handlers:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(log_handler)
+    root_logger.setLevel(log_level)
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_fds = [os.dup(1), os.dup(2)]
+    os.dup2(log_stream.fileno(), 1)
+    os.dup2(log_stream.fileno(), 2)
+    try:
+        yield
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        for fd, saved_fd in zip((1, 2), saved_fds):
+            os.dup2(saved_fd, fd)
+            os.close(saved_fd)
+        root_logger.removeHandler(log_handler)
+        for handler in handlers:
+            root_logger.addHandler(handler)
+        root_logger.setLevel(level)
@@ -1,21 +1,30 @@
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from gdk.commands.component.transformer.PublishRecipeTransformer import PublishRecipeTransformer
 
 import gdk.commands.component.component as component
+import gdk.common.consts as consts
 import gdk.common.utils as utils
+from gdk.aws_clients.ClientRegistry import ClientRegistry
 from gdk.aws_clients.Greengrassv2Client import Greengrassv2Client
 from gdk.aws_clients.S3Client import S3Client
 from gdk.commands.Command import Command
 from gdk.commands.component.config.ComponentPublishConfiguration import ComponentPublishConfiguration
 
+# Number of artifacts uploaded at the same time when the 'upload_concurrency' publish option is not set.
+DEFAULT_UPLOAD_CONCURRENCY = 4
+
 
 class PublishCommand(Command):
     def __init__(self, command_args) -> None:
         super().__init__(command_args, "publish")
 
-        self.project_config = ComponentPublishConfiguration(command_args)
-        self.s3_client = S3Client(self.project_config.region)
-        self.greengrass_client = Greengrassv2Client(self.project_config.region)
+        # AWS clients shared by the configuration and the command.
+        self.clients = ClientRegistry()
+        self.project_config = ComponentPublishConfiguration(command_args, self.clients)
+        self.s3_client = S3Client(self.project_config.region, self.clients)
+        self.greengrass_client = Greengrassv2Client(self.project_config.region, self.clients)
 
     def run(self):
         try:
@@ -28,6 +37,8 @@ class PublishCommand(Command):
                 self.project_config.component_name,
             )
             raise
+        finally:
+            self.clients.log_statistics()
 
     def try_build(self):
         # TODO: This method should just warn and proceed. It should not build the component.
@@ -37,7 +48,7 @@ class PublishCommand(Command):
             logging.warning(
                 "The component '%s' is not built.\nSo, building the component before publishing it.", component_name
             )
-            component.build({})
+            component.build({}, self.clients)
 
     def _publish_component_version(self, component_name, component_version):
         logging.info("Publishing the component '%s' with the given project configuration.", component_name)
@@ -54,7 +65,11 @@ class PublishCommand(Command):
         """
         Uploads all the artifacts from component artifacts build folder to s3 bucket.
 
-        Raises an exception when the request is not successful.
+        Artifacts are uploaded concurrently with the same s3 client. The number of artifacts uploaded at a time is set by
+        the 'upload_concurrency' publish option. Every artifact is attempted even if some of them fail to upload. Artifacts
+        whose content is already in the bucket are not uploaded again.
+
+        Raises an exception listing the artifacts that failed to upload when any of the requests is not successful.
         """
         _bucket = self.project_config.bucket
 
@@ -76,12 +91,81 @@ class PublishCommand(Command):
 
         self.s3_client.create_bucket(_bucket)
 
-        component_name = self.project_config.component_name
-        component_version = self.project_config.component_version
         options = self.project_config.options
         s3_upload_file_args = options.get("file_upload_args", {})
+        upload_concurrency = min(self.get_upload_concurrency(), len(build_component_artifacts))
+
+        start_time = time.perf_counter()
+        failed_artifacts = []
+        bytes_saved = 0
+        with ThreadPoolExecutor(max_workers=upload_concurrency) as executor:
+            uploads = [
+                (artifact, executor.submit(self._upload_artifact, artifact, _bucket, s3_upload_file_args))
+                for artifact in build_component_artifacts
+            ]
+            for artifact, upload in uploads:
+                try:
+                    bytes_saved += upload.result()
+                except Exception as e:
+                    logging.error("Failed to upload the artifact '%s'. Error: %s", artifact.name, e)
+                    failed_artifacts.append(artifact.name)
+
+        logging.info(
+            "Published %d of %d artifacts to the bucket '%s' in %.2f seconds. Skipped uploading %s of unchanged artifacts.",
+            len(build_component_artifacts) - len(failed_artifacts),
+            len(build_component_artifacts),
+            _bucket,
+            time.perf_counter() - start_time,
+            utils.format_size(bytes_saved),
+        )
+        if failed_artifacts:
+            raise Exception(f"Failed to upload the artifacts {failed_artifacts} to the bucket '{_bucket}'.")
 
-        for artifact in build_component_artifacts:
-            s3_file_path = f"{component_name}/{component_version}/{artifact.name}"
-            logging.debug("Uploading artifact '%s' to the bucket '%s'.", artifact.resolve(), _bucket)
-            self.s3_client.upload_artifact(artifact, _bucket, s3_file_path, s3_upload_file_args)
+    def _upload_artifact(self, artifact, bucket, s3_upload_file_args) -> int:
+        """
+        Uploads the artifact with its SHA-256 checksum in the object metadata, unless an object with the same checksum is
+        already in the bucket.
+
+        An artifact that is already published with the same key and content is not uploaded again. With the 'versioned'
+        artifact layout, an artifact that did not change since the latest version of the component is copied from that
+        version on the server side.
+
+        Returns
+        -------
+            (int): Number of bytes that did not have to be uploaded.
+        """
+        checksum = self.project_config.get_artifact_checksum(artifact)
+        s3_file_path = self.project_config.get_artifact_s3_key(artifact)
+        if self.s3_client.get_artifact_checksum(bucket, s3_file_path) == checksum:
+            logging.debug("Artifact '%s' is already in the bucket with the same content. Skipping the upload.", s3_file_path)
+            return artifact.stat().st_size
+
+        metadata = {**s3_upload_file_args.get("Metadata", {}), consts.ARTIFACT_CHECKSUM_METADATA_KEY: checksum}
+        upload_args = {**s3_upload_file_args, "Metadata": metadata}
+        latest_s3_file_path = self._get_latest_version_s3_key(artifact)
+        if latest_s3_file_path and self.s3_client.get_artifact_checksum(bucket, latest_s3_file_path) == checksum:
+            logging.debug("Artifact '%s' did not change since '%s'. Copying it.", s3_file_path, latest_s3_file_path)
+            self.s3_client.copy_artifact(bucket, latest_s3_file_path, s3_file_path, upload_args)
+            return artifact.stat().st_size
+
+        logging.debug("Uploading artifact '%s' to the bucket '%s'.", artifact.resolve(), bucket)
+        self.s3_client.upload_artifact(artifact, bucket, s3_file_path, upload_args)
+        return 0
+
+    def _get_latest_version_s3_key(self, artifact):
+        latest_component_version = self.project_config.latest_component_version
+        if not latest_component_version or self.project_config.artifact_layout != consts.ARTIFACT_LAYOUT_VERSIONED:
+            return None
+        return f"{self.project_config.component_name}/{latest_component_version}/{artifact.name}"
+
+    def get_upload_concurrency(self) -> int:
+        """
+        Returns the number of artifacts uploaded at the same time, set by the 'upload_concurrency' publish option.
+        """
+        upload_concurrency = self.project_config.options.get("upload_concurrency", DEFAULT_UPLOAD_CONCURRENCY)
+        if not isinstance(upload_concurrency, int) or isinstance(upload_concurrency, bool) or upload_concurrency < 1:
+            raise ValueError(
+                f"Invalid value '{upload_concurrency}' for the 'upload_concurrency' publish option. Please provide a positive"
+                " integer."
+            )
+        return upload_concurrency
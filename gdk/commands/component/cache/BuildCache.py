@@ -0,0 +1,231 @@
+import copy
+import hashlib
+import json
+import logging
+import os
+import tarfile
+import tempfile
+from pathlib import Path
+
+import gdk.common.consts as consts
+import gdk.common.utils as utils
+from gdk.commands.component.cache.BuildCacheBackend import BuildCacheBackend
+from gdk.commands.component.config.ComponentBuildConfiguration import ComponentBuildConfiguration
+
+# Version of the manifest format. Manifests written with a different version are ignored.
+MANIFEST_VERSION = 1
+
+
+class BuildCache:
+    """
+    Skips component builds when their inputs did not change since the last successful build.
+
+    The inputs of a build are recorded in a manifest inside the greengrass-build folder. The manifest contains the hashes
+    of the project files, the component configuration, the recipe, the build system and the version of the cli. When the
+    inputs of a new build are identical to the ones in the manifest and the outputs of the last build are still in the
+    greengrass-build folder, the build is up to date.
+
+    The output folders of the build system, the greengrass-build folder and version control folders are not considered
+    inputs of the build. The output folders are excluded by their path in the project, so source folders with the same
+    name, like a `build` package of a gradle project, are still inputs.
+
+    When a shared build cache backend is configured, the outputs of each build are also stored in the backend by the hash
+    of the build inputs, so that builds with the same inputs on other hosts fetch them instead of building again.
+    """
+
+    def __init__(
+        self, project_config: ComponentBuildConfiguration, output_dirs=(), backend: BuildCacheBackend = None
+    ) -> None:
+        self.project_config = project_config
+        self.backend = backend
+        self.manifest_file = project_config.gg_build_dir.joinpath(consts.BUILD_MANIFEST_FILE)
+        self._output_dirs = {Path(output_dir).resolve() for output_dir in output_dirs}
+        self._previous_manifest = self._read_manifest()
+        self.manifest = None
+
+    def is_up_to_date(self) -> bool:
+        """
+        Computes the inputs of the build and checks them against the manifest of the last successful build.
+
+        Returns
+        -------
+            (bool): True if the inputs did not change and the outputs of the last build still exist. Else False.
+        """
+        try:
+            self.manifest = self._create_manifest()
+        except Exception as e:
+            logging.debug("Could not compute the inputs of the component build. Error: %s", e)
+            return False
+        previous_manifest = self._previous_manifest
+        if not previous_manifest:
+            logging.debug("No manifest of a previous build found in '%s'.", consts.greengrass_build_dir)
+            return False
+        if previous_manifest.get("inputs_hash") != self.manifest["inputs_hash"]:
+            logging.debug("Inputs of the component build changed since the last build.")
+            return False
+        if not self._outputs_exist(previous_manifest.get("outputs", {})):
+            logging.debug("Outputs of the last build were changed or removed from '%s'.", consts.greengrass_build_dir)
+            return False
+        return True
+
+    def restore(self) -> bool:
+        """
+        Fetches the outputs of a build with the same inputs from the shared build cache backend into the greengrass-build
+        folder.
+
+        Returns
+        -------
+            (bool): True if the outputs are restored from the backend. Else False.
+        """
+        if self.backend is None or self.manifest is None:
+            return False
+        try:
+            with tempfile.TemporaryDirectory() as download_dir:
+                archive = self.backend.fetch(self.manifest["inputs_hash"], Path(download_dir))
+                if archive is None:
+                    logging.info("No outputs for the inputs of the build found in the build cache '%s'.",
+                                 self.backend.location)
+                    return False
+                self._extract_outputs(archive)
+        except Exception as e:
+            logging.warning("Could not fetch the build outputs from the build cache '%s'. Error: %s", self.backend.location, e)
+            return False
+        logging.info("Restored the build outputs from the build cache '%s'.", self.backend.location)
+        self._write_manifest()
+        return True
+
+    def save(self) -> None:
+        """
+        Records the inputs and outputs of a successful build in the manifest and stores the outputs in the shared build
+        cache backend.
+        """
+        if self._write_manifest() and self.backend is not None:
+            self._store_outputs()
+
+    def _write_manifest(self) -> bool:
+        try:
+            if self.manifest is None:
+                self.manifest = self._create_manifest()
+            self.manifest["outputs"] = self._list_outputs()
+            logging.debug("Writing the build manifest to '%s'.", self.manifest_file)
+            with open(self.manifest_file, "w", encoding="utf-8") as f:
+                f.write(json.dumps(self.manifest))
+            self._previous_manifest = self.manifest
+            return True
+        except Exception as e:
+            # The build itself succeeded, so the next build just runs again without the manifest.
+            logging.warning("Could not write the build manifest. The next build will not be skipped. Error: %s", e)
+            return False
+
+    def _store_outputs(self) -> None:
+        try:
+            with tempfile.TemporaryDirectory() as archive_dir:
+                archive = Path(archive_dir).joinpath("outputs.tar")
+                with tarfile.open(archive, "w") as tar:
+                    for relative_path in sorted(self.manifest["outputs"]):
+                        tar.add(str(self.project_config.gg_build_dir.joinpath(relative_path)), arcname=relative_path)
+                self.backend.store(self.manifest["inputs_hash"], archive)
+            logging.info("Stored the build outputs in the build cache '%s'.", self.backend.location)
+            self.backend.evict()
+        except Exception as e:
+            logging.warning("Could not store the build outputs in the build cache '%s'. Error: %s", self.backend.location, e)
+
+    def _extract_outputs(self, archive: Path) -> None:
+        gg_build_dir = self.project_config.gg_build_dir
+        with tarfile.open(archive, "r") as tar:
+            members = tar.getmembers()
+            for member in members:
+                member_path = Path(member.name)
+                if member_path.is_absolute() or ".." in member_path.parts or not (member.isfile() or member.isdir()):
+                    raise Exception(f"Build cache archive contains an invalid entry '{member.name}'.")
+            utils.clean_dir(self.project_config.gg_build_recipes_dir)
+            utils.clean_dir(self.project_config.gg_build_component_artifacts_dir)
+            Path.mkdir(self.project_config.gg_build_recipes_dir, parents=True, exist_ok=True)
+            Path.mkdir(self.project_config.gg_build_component_artifacts_dir, parents=True, exist_ok=True)
+            tar.extractall(str(gg_build_dir), members=members)
+
+    def _create_manifest(self) -> dict:
+        files = self._hash_project_files()
+        inputs = {
+            "gdk_version": utils.cli_version,
+            "component_name": self.project_config.component_name,
+            "component": self._component_config_without_cache(),
+            "build_system": self.project_config.build_system,
+            "recipe": self._hash_file(self.project_config.recipe_file),
+            "files": {path: entry[2] for path, entry in files.items()},
+        }
+        inputs_hash = hashlib.sha256(json.dumps(inputs, sort_keys=True).encode("utf-8")).hexdigest()
+        return {"version": MANIFEST_VERSION, "inputs_hash": inputs_hash, "files": files}
+
+    def _component_config_without_cache(self) -> dict:
+        # Where the outputs are cached does not change the outputs of the build.
+        component_config = copy.deepcopy(self.project_config.component_config)
+        component_config.get("build", {}).pop("cache", None)
+        return component_config
+
+    def _hash_project_files(self) -> dict:
+        """
+        Hashes the files in the project directory. The hash of a file is reused from the previous manifest when its size
+        and modification time did not change.
+        """
+        previous_files = (self._previous_manifest or {}).get("files", {})
+        project_dir = utils.get_current_directory()
+        files = {}
+        for dirpath, dirnames, filenames in os.walk(project_dir):
+            dirnames[:] = [
+                name
+                for name in dirnames
+                if name not in consts.BUILD_CACHE_EXCLUDED_DIRS and Path(dirpath).joinpath(name) not in self._output_dirs
+            ]
+            for name in filenames:
+                path = Path(dirpath).joinpath(name)
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                relative_path = path.relative_to(project_dir).as_posix()
+                previous_entry = previous_files.get(relative_path)
+                if previous_entry and previous_entry[0] == stat.st_size and previous_entry[1] == stat.st_mtime_ns:
+                    files[relative_path] = previous_entry
+                else:
+                    files[relative_path] = [stat.st_size, stat.st_mtime_ns, self._hash_file(path)]
+        return files
+
+    def _list_outputs(self) -> dict:
+        outputs = {}
+        gg_build_dir = self.project_config.gg_build_dir
+        for output_dir in [self.project_config.gg_build_recipes_dir, self.project_config.gg_build_component_artifacts_dir]:
+            for path in Path(output_dir).rglob("*"):
+                if path.is_file():
+                    stat = path.stat()
+                    outputs[path.relative_to(gg_build_dir).as_posix()] = [stat.st_size, stat.st_mtime_ns]
+        return outputs
+
+    def _outputs_exist(self, outputs: dict) -> bool:
+        if not outputs:
+            return False
+        gg_build_dir = self.project_config.gg_build_dir
+        for relative_path, (size, mtime_ns) in outputs.items():
+            try:
+                stat = gg_build_dir.joinpath(relative_path).stat()
+            except OSError:
+                return False
+            if stat.st_size != size or stat.st_mtime_ns != mtime_ns:
+                return False
+        return True
+
+    def _read_manifest(self) -> dict:
+        if not self.manifest_file.is_file():
+            return None
+        try:
+            with open(self.manifest_file, "r", encoding="utf-8") as f:
+                manifest = json.loads(f.read())
+        except (OSError, ValueError) as e:
+            logging.debug("Ignoring the build manifest as it could not be read. Error: %s", e)
+            return None
+        if manifest.get("version") != MANIFEST_VERSION:
+            return None
+        return manifest
+
+    def _hash_file(self, file_path) -> str:
+        return utils.get_file_sha256(file_path)
@@ -0,0 +1,84 @@
+import logging
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import gdk.common.utils as utils
+
+
+class BuildCacheBackend(ABC):
+    """
+    Class for a shared store of component build outputs.
+
+    Build outputs are stored as a single archive per build, keyed by the hash of the build inputs. Backends count the hits,
+    misses and bytes transferred so that they can be reported in the build output.
+    """
+
+    def __init__(self, max_size_bytes=None, max_age_seconds=None) -> None:
+        self.max_size_bytes = max_size_bytes
+        self.max_age_seconds = max_age_seconds
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+        self.evicted = 0
+        self.bytes_fetched = 0
+        self.bytes_stored = 0
+
+    @property
+    @abstractmethod
+    def location(self) -> str:
+        """
+        Location of the cache shown in the build output.
+        """
+
+    @abstractmethod
+    def fetch(self, key: str, download_dir: Path) -> Path:
+        """
+        Returns the path of the archive stored with the key, downloading it into the directory if needed. Returns None if
+        there is no archive with the key.
+        """
+
+    @abstractmethod
+    def store(self, key: str, archive: Path) -> None:
+        """
+        Stores the archive with the key. Readers never see a partially written archive.
+        """
+
+    @abstractmethod
+    def evict(self) -> None:
+        """
+        Removes the archives that are older than the max age, then the least recently used archives until the cache is
+        smaller than the max size.
+        """
+
+    def log_statistics(self) -> None:
+        logging.info(
+            "Build cache '%s': %d hit(s), %d miss(es), %d stored, %d evicted, %s fetched, %s stored.",
+            self.location,
+            self.hits,
+            self.misses,
+            self.stored,
+            self.evicted,
+            utils.format_size(self.bytes_fetched),
+            utils.format_size(self.bytes_stored),
+        )
+
+    def _select_evictions(self, entries, now):
+        """
+        Selects the entries to evict from a list of (key, size, last used time in seconds) tuples.
+        """
+        evictions = []
+        remaining = []
+        for entry in entries:
+            if self.max_age_seconds is not None and now - entry[2] > self.max_age_seconds:
+                evictions.append(entry)
+            else:
+                remaining.append(entry)
+
+        if self.max_size_bytes is not None:
+            remaining.sort(key=lambda entry: entry[2])
+            total_size = sum(entry[1] for entry in remaining)
+            while remaining and total_size > self.max_size_bytes:
+                entry = remaining.pop(0)
+                total_size -= entry[1]
+                evictions.append(entry)
+        return evictions
@@ -0,0 +1,79 @@
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+
+import gdk.common.utils as utils
+from gdk.commands.component.cache.BuildCacheBackend import BuildCacheBackend
+
+ARCHIVE_SUFFIX = ".tar"
+# Temporary files older than this are left behind by interrupted writes and are removed during eviction.
+STALE_TEMPORARY_FILE_SECONDS = 24 * 60 * 60
+
+
+class LocalBuildCacheBackend(BuildCacheBackend):
+    """
+    Stores build outputs in a directory, which can be shared between hosts with a network file system.
+
+    Archives are written to a temporary file in the cache directory and renamed to their key, so concurrent builds never
+    read a partially written archive. Reading an archive updates its modification time, which is used as its last used
+    time during eviction.
+    """
+
+    def __init__(self, directory, max_size_bytes=None, max_age_seconds=None) -> None:
+        super().__init__(max_size_bytes, max_age_seconds)
+        self.directory = Path(directory).expanduser().resolve()
+
+    @property
+    def location(self):
+        return str(self.directory)
+
+    def fetch(self, key, download_dir):
+        archive = self.directory.joinpath(f"{key}{ARCHIVE_SUFFIX}")
+        try:
+            os.utime(archive)
+            size = archive.stat().st_size
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.bytes_fetched += size
+        return archive
+
+    def store(self, key, archive):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(archive, "rb") as source, utils.atomic_write(self.directory.joinpath(f"{key}{ARCHIVE_SUFFIX}"), "wb") as f:
+            shutil.copyfileobj(source, f, 1024 * 1024)
+            f.flush()
+            os.fsync(f.fileno())
+        self.stored += 1
+        self.bytes_stored += archive.stat().st_size
+
+    def evict(self):
+        if not self.directory.is_dir():
+            return
+        now = time.time()
+        entries = []
+        for path in self.directory.iterdir():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if path.name.endswith(ARCHIVE_SUFFIX):
+                entries.append((path, stat.st_size, stat.st_mtime))
+            elif path.name.endswith(".tmp") and now - stat.st_mtime > STALE_TEMPORARY_FILE_SECONDS:
+                self._remove(path)
+
+        for path, _, _ in self._select_evictions(entries, now):
+            logging.debug("Evicting '%s' from the build cache.", path.name)
+            if self._remove(path):
+                self.evicted += 1
+
+    def _remove(self, path):
+        try:
+            path.unlink()
+            return True
+        except OSError:
+            # Another build removed the file first.
+            return False
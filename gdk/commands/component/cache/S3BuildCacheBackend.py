@@ -0,0 +1,80 @@
+import logging
+import time
+from pathlib import Path
+
+from botocore.exceptions import ClientError
+
+from gdk.aws_clients.ClientRegistry import ClientRegistry
+from gdk.commands.component.cache.BuildCacheBackend import BuildCacheBackend
+
+ARCHIVE_SUFFIX = ".tar"
+# Maximum number of keys in a single delete_objects request.
+DELETE_BATCH_SIZE = 1000
+
+
+class S3BuildCacheBackend(BuildCacheBackend):
+    """
+    Stores build outputs in an S3 or S3-compatible bucket.
+
+    Uploads only become visible once they complete, so concurrent builds never read a partially written archive. Objects
+    are not updated when they are read, so eviction uses the time they were stored as their last used time.
+    """
+
+    def __init__(
+        self,
+        bucket,
+        prefix="",
+        region=None,
+        endpoint_url=None,
+        max_size_bytes=None,
+        max_age_seconds=None,
+        clients: ClientRegistry = None,
+    ):
+        super().__init__(max_size_bytes, max_age_seconds)
+        self.bucket = bucket
+        self.prefix = prefix.strip("/") + "/" if prefix.strip("/") else ""
+        self.s3_client = (clients or ClientRegistry()).client("s3", region, endpoint_url)
+
+    @property
+    def location(self):
+        return f"s3://{self.bucket}/{self.prefix}"
+
+    def fetch(self, key, download_dir):
+        archive = Path(download_dir).joinpath(f"{key}{ARCHIVE_SUFFIX}")
+        try:
+            self.s3_client.download_file(self.bucket, self._object_key(key), str(archive))
+        except ClientError as e:
+            if e.response["Error"]["Code"] not in ["404", "NoSuchKey"]:
+                raise
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.bytes_fetched += archive.stat().st_size
+        return archive
+
+    def store(self, key, archive):
+        self.s3_client.upload_file(str(archive), self.bucket, self._object_key(key))
+        self.stored += 1
+        self.bytes_stored += archive.stat().st_size
+
+    def evict(self):
+        if self.max_size_bytes is None and self.max_age_seconds is None:
+            return
+        entries = []
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self.prefix):
+            for s3_object in page.get("Contents", []):
+                if s3_object["Key"].endswith(ARCHIVE_SUFFIX):
+                    entries.append((s3_object["Key"], s3_object["Size"], s3_object["LastModified"].timestamp()))
+
+        evictions = [entry[0] for entry in self._select_evictions(entries, time.time())]
+        for i in range(0, len(evictions), DELETE_BATCH_SIZE):
+            batch = evictions[i:i + DELETE_BATCH_SIZE]
+            logging.debug("Evicting %d objects from the build cache.", len(batch))
+            self.s3_client.delete_objects(
+                Bucket=self.bucket, Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True}
+            )
+            self.evicted += len(batch)
+
+    def _object_key(self, key):
+        return f"{self.prefix}{key}{ARCHIVE_SUFFIX}"
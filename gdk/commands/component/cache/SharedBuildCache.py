@@ -0,0 +1,38 @@
+from gdk.commands.component.cache.BuildCacheBackend import BuildCacheBackend
+from gdk.commands.component.cache.LocalBuildCacheBackend import LocalBuildCacheBackend
+import gdk.common.utils as utils
+
+
+class SharedBuildCache:
+    """
+    Creates the build cache backend for the cache location.
+    """
+
+    @classmethod
+    def get(self, cache_config: dict, clients=None) -> BuildCacheBackend:
+        location = cache_config.get("location", "").strip()
+        if not location:
+            raise Exception(
+                "Build cache location is not specified. Provide it in the build configuration or the GDK_BUILD_CACHE"
+                " environment variable."
+            )
+
+        max_size_mb = cache_config.get("max_size_mb")
+        max_age_days = cache_config.get("max_age_days")
+        max_size_bytes = int(max_size_mb * 1024 * 1024) if max_size_mb is not None else None
+        max_age_seconds = int(max_age_days * 24 * 60 * 60) if max_age_days is not None else None
+
+        if location.startswith(utils.s3_prefix):
+            from gdk.commands.component.cache.S3BuildCacheBackend import S3BuildCacheBackend
+
+            bucket, _, prefix = location[len(utils.s3_prefix):].partition("/")
+            return S3BuildCacheBackend(
+                bucket,
+                prefix,
+                region=cache_config.get("region"),
+                endpoint_url=cache_config.get("endpoint_url"),
+                max_size_bytes=max_size_bytes,
+                max_age_seconds=max_age_seconds,
+                clients=clients,
+            )
+        return LocalBuildCacheBackend(location, max_size_bytes=max_size_bytes, max_age_seconds=max_age_seconds)
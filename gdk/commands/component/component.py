@@ -4,19 +4,42 @@ def init(d_args):
     InitCommand(d_args).run()
 
 
-def build(d_args):
+def build(d_args, clients=None):
     from gdk.commands.component.BuildCommand import BuildCommand
+    from gdk.commands.component.ComponentScheduler import ComponentScheduler
 
-    BuildCommand(d_args).run()
+    project_config = _get_project_config()
+    if project_config and ComponentScheduler.is_required(project_config):
+        ComponentScheduler("build", d_args, project_config).run()
+    else:
+        BuildCommand(d_args, clients).run()
 
 
 def publish(d_args):
+    from gdk.commands.component.ComponentScheduler import ComponentScheduler
     from gdk.commands.component.PublishCommand import PublishCommand
 
-    PublishCommand(d_args).run()
+    project_config = _get_project_config()
+    if project_config and ComponentScheduler.is_required(project_config):
+        ComponentScheduler("publish", d_args, project_config).run()
+    else:
+        PublishCommand(d_args).run()
 
 
 def list(d_args):
     from gdk.commands.component.ListCommand import ListCommand
 
     ListCommand(d_args).run()
+
+
+def _get_project_config():
+    import gdk.common.configuration as configuration
+
+    if configuration.get_selected_component():
+        # The command runs for one component of a project with multiple components in a worker of the scheduler.
+        return None
+    try:
+        return configuration.get_configuration()
+    except Exception:
+        # The build command reports the errors in the project configuration.
+        return None
@@ -1,3 +1,6 @@
+import os
+
+import gdk.common.consts as consts
 from gdk.common.config.GDKProject import GDKProject
 
 
@@ -11,8 +14,20 @@ class ComponentBuildConfiguration(GDKProject):
         self.component_version = self.component_config.get("version", "NEXT_PATCH")
         self.publisher = self.component_config.get("author", "")
         self.region = self._get_region()
+        self.build_cache_config = self._get_build_cache_config()
 
     def _get_region(self):
         _publish_config = self.component_config.get("publish", {})
         _region = _publish_config.get("region", "")
         return _region
+
+    def _get_build_cache_config(self):
+        """
+        Returns the configuration of the shared build cache. The location of the cache in the environment variable
+        GDK_BUILD_CACHE overrides the location in the project configuration.
+        """
+        _cache_config = dict(self.build_config.get("cache", {}))
+        _cache_location = os.environ.get(consts.GDK_BUILD_CACHE_ENV_KEY, "").strip()
+        if _cache_location:
+            _cache_config["location"] = _cache_location
+        return _cache_config
@@ -3,21 +3,27 @@ import json
 from pathlib import Path
 from gdk.common.exceptions.CommandError import InvalidArgumentsError
 import logging
+import gdk.common.consts as consts
 import gdk.common.utils as utils
+from gdk.aws_clients.ClientRegistry import ClientRegistry
 from gdk.aws_clients.Greengrassv2Client import Greengrassv2Client
-import boto3
 from botocore import exceptions
 
 
 class ComponentPublishConfiguration(GDKProject):
-    def __init__(self, _args) -> None:
+    def __init__(self, _args, clients: ClientRegistry = None) -> None:
         super().__init__()
         self._args = _args
+        self.clients = clients or ClientRegistry()
         self._publish_config = self.component_config.get("publish", {})
         self.options = self._get_options()
+        self.artifact_layout = self._get_artifact_layout()
+        self._artifact_checksums = {}
         self.account_num = self.get_account_number()
         self.region = self._get_region()
         self.bucket = self._get_bucket(self.region, self.account_num)
+        # Latest version of the component in the account. Only looked up when the version is NEXT_PATCH.
+        self.latest_component_version = None
         self.component_version = self.get_component_version(self.region)
         self.publisher = self.component_config.get("author", "")
         self.publish_recipe_file = self.gg_build_recipes_dir.joinpath(
@@ -39,7 +45,7 @@ class ComponentPublishConfiguration(GDKProject):
             raise ValueError("Region cannot be empty. Please provide a valid region.")
         component_arn = self._get_component_arn(region)
         try:
-            Greengrassv2Client(region).get_component_version(component_arn)
+            Greengrassv2Client(region, self.clients).get_component_version(component_arn)
         except exceptions.EndpointConnectionError:
             raise ValueError("Greengrass does not exist in %s region. Please provide a valid region.", region)
         except Exception as e:
@@ -69,6 +75,38 @@ class ComponentPublishConfiguration(GDKProject):
         else:
             return self._publish_config.get("options", {})
 
+    def _get_artifact_layout(self):
+        _layout = self.options.get("artifact_layout", consts.ARTIFACT_LAYOUT_VERSIONED)
+        if _layout not in [consts.ARTIFACT_LAYOUT_VERSIONED, consts.ARTIFACT_LAYOUT_CONTENT_ADDRESSED]:
+            raise ValueError(
+                f"Invalid artifact layout '{_layout}'. Please provide one of '{consts.ARTIFACT_LAYOUT_VERSIONED}' or"
+                f" '{consts.ARTIFACT_LAYOUT_CONTENT_ADDRESSED}'."
+            )
+        return _layout
+
+    def get_artifact_checksum(self, artifact: Path) -> str:
+        """
+        Returns the SHA-256 checksum of the built artifact. The checksum is computed once per artifact content, so the
+        upload and the recipe transformation do not hash the same artifact twice.
+        """
+        _stat = artifact.stat()
+        _key = (str(artifact.resolve()), _stat.st_size, _stat.st_mtime_ns)
+        if _key not in self._artifact_checksums:
+            self._artifact_checksums[_key] = utils.get_file_sha256(artifact)
+        return self._artifact_checksums[_key]
+
+    def get_artifact_s3_key(self, artifact: Path) -> str:
+        """
+        Returns the key of the built artifact in the s3 bucket.
+
+        With the 'versioned' artifact layout, artifacts are stored under the component version. With the
+        'content-addressed' layout, they are stored once under their checksum and shared by all the versions of the
+        component. The key always ends with the artifact file name, which is the name of the artifact on the device.
+        """
+        if self.artifact_layout == consts.ARTIFACT_LAYOUT_CONTENT_ADDRESSED:
+            return f"{self.component_name}/sha256/{self.get_artifact_checksum(artifact)}/{artifact.name}"
+        return f"{self.component_name}/{self.component_version}/{artifact.name}"
+
     def _read_options_as_dict(self, _options: str):
         try:
             if _options.endswith(".json"):
@@ -114,7 +152,7 @@ class ComponentPublishConfiguration(GDKProject):
         try:
             c_name = self.component_name
             component_arn = self._get_component_arn(_region)
-            c_next_patch_version = Greengrassv2Client(_region).get_highest_cloud_component_version(component_arn)
+            c_next_patch_version = Greengrassv2Client(_region, self.clients).get_highest_cloud_component_version(component_arn)
             if not c_next_patch_version:
                 logging.info(
                     "No private version of the component '%s' exist in the account. Using '%s' as the next version to create.",
@@ -124,6 +162,7 @@ class ComponentPublishConfiguration(GDKProject):
 
                 return fallback_version
             logging.debug("Found latest version '%s' of the component '%s' in the account.", c_next_patch_version, c_name)
+            self.latest_component_version = c_next_patch_version
 
             next_version = utils.get_next_patch_version(c_next_patch_version)
             logging.info("Using '%s' as the next version of the component '%s' to create.", next_version, c_name)
@@ -137,8 +176,7 @@ class ComponentPublishConfiguration(GDKProject):
         return f"arn:{partition}:greengrass:{_region}:{self.account_num}:components:{self.component_name}"
 
     def _get_aws_partition(self, _region):
-        boto3_session = boto3.Session()
-        return boto3_session.get_partition_for_region(region_name=_region)
+        return self.clients.get_partition_for_region(_region)
 
     def get_account_number(self) -> str:
         """
@@ -146,8 +184,7 @@ class ComponentPublishConfiguration(GDKProject):
         Raises an exception when the request is unsuccessful.
         """
         try:
-            _sts_client = boto3.client("sts")
-            account_num = _sts_client.get_caller_identity().get("Account")
+            account_num = self.clients.get_account_number()
             logging.debug("Identified account number as '%s'.", account_num)
             return account_num
         except Exception:
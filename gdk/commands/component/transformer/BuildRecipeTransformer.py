@@ -1,30 +1,56 @@
 import jsonschema
 import logging
-import shutil
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from gdk.common.CaseInsensitive import CaseInsensitiveRecipeFile, CaseInsensitiveDict
+from gdk.common.FileDigester import DIGEST_ALGORITHM, FileDigester
+from gdk.common.FileStager import FileStager
 from gdk.common.RecipeValidator import RecipeValidator
 
 import gdk.common.consts as consts
 import gdk.common.utils as utils
 from gdk.commands.component.config.ComponentBuildConfiguration import ComponentBuildConfiguration
+from gdk.aws_clients.ClientRegistry import ClientRegistry
 from gdk.aws_clients.S3Client import S3Client
-from gdk.common.exceptions.error_messages import RECIPE_SIZE_INVALID, PROJECT_RECIPE_FILE_INVALID, SCHEMA_FILE_INVALID
+from gdk.common.exceptions.error_messages import (
+    ARTIFACT_IN_MULTIPLE_BUILD_FOLDERS,
+    RECIPE_SIZE_INVALID,
+    PROJECT_RECIPE_FILE_INVALID,
+    SCHEMA_FILE_INVALID,
+)
+
+# Number of artifacts that are checked on s3 at the same time.
+S3_ARTIFACT_CHECK_CONCURRENCY = 8
 
 
 class BuildRecipeTransformer:
-    def __init__(self, project_config: ComponentBuildConfiguration) -> None:
+    def __init__(self, project_config: ComponentBuildConfiguration, clients: ClientRegistry = None) -> None:
         self.project_config = project_config
+        self.clients = clients or ClientRegistry()
         self._s3_client = None
+        self._file_stager = FileStager()
+        # Recipe and artifact files written to the greengrass-build folder by the last transform.
+        self.build_outputs = set()
+        # Files in the build folders by their name, and the build folders they were listed from.
+        self._artifact_index = None
+        self._indexed_build_folders = None
+        # Whether the artifacts on s3 exist, by their URI.
+        self._s3_artifacts_exist = {}
+        # Artifacts of the recipe that are staged from the build folders, with the file they are staged from.
+        self._staged_artifacts = []
 
     def _get_s3_client(self, _region):
         if not _region:
             raise ValueError("Region cannot be empty. Please provide a valid region.")
         if self._s3_client is None:
-            self._s3_client = S3Client(_region)
+            self._s3_client = S3Client(_region, self.clients)
         return self._s3_client
 
     def transform(self, build_folders):
+        self.build_outputs = set()
+        self._artifact_index = None
         logging.info(f"Validating the file size of recipe {self.project_config.recipe_file}")
         # Validate the size of the recipe file before processing its content.
         valid_file_size, input_recipe_file_size = utils.is_recipe_size_valid(self.project_config.recipe_file)
@@ -64,6 +90,11 @@ class BuildRecipeTransformer:
         searched on S3 with exact URI in the recipe.
 
         Build command fails when the artifacts are neither not found in local both folders not on s3.
+
+        The URIs of the artifacts that are not in the build folders are checked on s3 once each, at the same time.
+
+        The 'Digest' and 'Algorithm' of the artifacts that are staged from the build folders are set in the recipe, so
+        devices can skip the download of artifacts they already have.
         """
         logging.info("Copying over the build artifacts to the greengrass component artifacts build folder.")
         logging.info("Updating artifact URIs in the recipe.")
@@ -71,6 +102,8 @@ class BuildRecipeTransformer:
             logging.debug("No 'Manifests' key in the recipe.")
             return
         manifests = parsed_component_recipe["Manifests"]
+        s3_artifact_uris = []
+        self._staged_artifacts = []
         for manifest in manifests:
             if "Artifacts" not in manifest:
                 logging.debug("No 'Artifacts' key in the recipe manifest.")
@@ -83,19 +116,64 @@ class BuildRecipeTransformer:
                 # Skip non-s3 URIs in the recipe. Eg docker URIs
                 if not artifact["URI"].startswith(utils.s3_prefix):
                     continue
-                if not self.is_artifact_in_build(artifact, build_folders):
-                    if not self._get_s3_client(self.project_config.region).s3_artifact_exists(artifact["URI"]):
-                        raise Exception(
-                            "Could not find artifact with URI '{}' on s3 or inside the build folders.".format(artifact["URI"])
-                        )
+                if not self.is_artifact_in_build(artifact, build_folders) and artifact["URI"] not in s3_artifact_uris:
+                    s3_artifact_uris.append(artifact["URI"])
+
+        s3_artifacts_exist = self.s3_artifacts_exist(s3_artifact_uris)
+        for artifact_uri in s3_artifact_uris:
+            if not s3_artifacts_exist[artifact_uri]:
+                raise Exception(
+                    "Could not find artifact with URI '{}' on s3 or inside the build folders.".format(artifact_uri)
+                )
+        self.update_artifact_digests()
+
+    def update_artifact_digests(self) -> None:
+        """
+        Sets the SHA-256 digest of each artifact that is staged from the build folders in the recipe. The files are hashed
+        at the same time, and the digests of files that did not change since the last build are reused.
+        """
+        if not self._staged_artifacts:
+            return
+        digests = FileDigester(self.project_config.gg_build_dir.joinpath(consts.ARTIFACT_DIGESTS_FILE)).digest(
+            [artifact_file for _, artifact_file in self._staged_artifacts]
+        )
+        for artifact, artifact_file in self._staged_artifacts:
+            artifact.update_value("Digest", digests[artifact_file])
+            artifact.update_value("Algorithm", DIGEST_ALGORITHM)
+
+    def s3_artifacts_exist(self, artifact_uris) -> dict:
+        """
+        Checks if the artifacts exist on s3 with concurrent requests. The result of each URI is kept for the build, so it is
+        only requested once.
+
+        Parameters
+        ----------
+            artifact_uris(list): S3 URIs of the artifacts.
+
+        Returns
+        -------
+            (dict): True for each URI of an artifact that exists on s3. Else False.
+        """
+        unchecked_uris = [uri for uri in dict.fromkeys(artifact_uris) if uri not in self._s3_artifacts_exist]
+        if unchecked_uris:
+            s3_client = self._get_s3_client(self.project_config.region)
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=min(S3_ARTIFACT_CHECK_CONCURRENCY, len(unchecked_uris))) as executor:
+                for uri, exists in zip(unchecked_uris, executor.map(s3_client.s3_artifact_exists, unchecked_uris)):
+                    self._s3_artifacts_exist[uri] = exists
+            logging.info("Checked %d artifact(s) on s3 in %.2f seconds.", len(unchecked_uris), time.perf_counter() - start)
+        return {uri: self._s3_artifacts_exist[uri] for uri in artifact_uris}
 
     def is_artifact_in_build(self, artifact, build_folders) -> bool:
         """
-        Copies over the build artifacts to the greengrass artifacts build folder and update URIs in the recipe.
+        Stages the build artifacts in the greengrass artifacts build folder and update URIs in the recipe.
 
         The component artifacts in the recipe are looked up in the build folders specific to the build system of the component.
-        If the artifact is found, it is copied over to the greengrass artifacts build folder and the URI is updated in the
-        recipe and returns True. Otherwise, it returns False.
+        If the artifact is found, it is staged in the greengrass artifacts build folder with a reflink, a hardlink or a copy
+        and the URI is updated in the recipe and returns True. Otherwise, it returns False.
+
+        The files of the build folders are indexed by their name once, so each artifact is looked up without accessing the
+        filesystem. Raises an exception when files with the name of the artifact are in more than one build folder.
 
         Parameters
         ----------
@@ -106,26 +184,53 @@ class BuildRecipeTransformer:
         artifact_uri = f"{utils.s3_prefix}BUCKET_NAME/COMPONENT_NAME/COMPONENT_VERSION"
         gg_build_component_artifacts_dir = self.project_config.gg_build_component_artifacts_dir
         artifact_file_name = Path(artifact["URI"]).name
-        # If the artifact is present in build system specific build folder, copy it to greengrass artifacts build folder
-        for build_folder in build_folders:
-            artifact_file = Path(build_folder).joinpath(artifact_file_name).resolve()
-            if artifact_file.is_file():
-                logging.debug(
-                    "Copying file '%s' from '%s' to '%s'.", artifact_file_name, build_folder, gg_build_component_artifacts_dir
-                )
+        artifact_files = self._get_artifact_index(build_folders).get(os.path.normcase(artifact_file_name), [])
+        if len(artifact_files) > 1:
+            raise Exception(
+                ARTIFACT_IN_MULTIPLE_BUILD_FOLDERS.format(artifact_file_name, [str(file.parent) for file in artifact_files])
+            )
+        if not artifact_files:
+            logging.warning(
+                "Could not find the artifact file '%s' in the build folder '%s'.", artifact_file_name, build_folders
+            )
+            return False
+
+        # If the artifact is present in build system specific build folder, stage it in greengrass artifacts build folder.
+        # The file is staged with the name in the recipe, which is the name of the artifact uploaded by publish.
+        artifact_file = artifact_files[0].with_name(artifact_file_name)
+        logging.debug(
+            "Staging file '%s' from '%s' in '%s'.", artifact_file_name, artifact_file.parent, gg_build_component_artifacts_dir
+        )
+        self.build_outputs.add(self._file_stager.stage(artifact_file, gg_build_component_artifacts_dir))
+        self._staged_artifacts.append((artifact, artifact_file))
+        logging.debug("Updating artifact URI of '%s' in the recipe file.", artifact_file_name)
+        artifact.update_value("Uri", f"{artifact_uri}/{artifact_file_name}")
+        return True
 
-                shutil.copy(artifact_file, gg_build_component_artifacts_dir)
-                logging.debug("Updating artifact URI of '%s' in the recipe file.", artifact_file_name)
-                artifact.update_value("Uri", f"{artifact_uri}/{artifact_file_name}")
-                return True
-            else:
-                logging.debug(
-                    "Could not find the artifact file specified in the recipe '%s' inside the build folder '%s'.",
-                    artifact_file_name,
-                    build_folder,
-                )
-        logging.warning("Could not find the artifact file '%s' in the build folder '%s'.", artifact_file_name, build_folders)
-        return False
+    def _get_artifact_index(self, build_folders) -> dict:
+        """
+        Returns the files in the build folders by their name. The build folders are listed once and the index is reused
+        for all the artifacts in the recipe.
+
+        The names are normalized with `os.path.normcase`, so on case insensitive filesystems an artifact is found in the
+        build folders regardless of the case of its name in the recipe.
+        """
+        build_folders = sorted(Path(build_folder).resolve() for build_folder in build_folders)
+        if self._artifact_index is not None and self._indexed_build_folders == build_folders:
+            return self._artifact_index
+        artifact_index = {}
+        for build_folder in build_folders:
+            try:
+                with os.scandir(build_folder) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            artifact_index.setdefault(os.path.normcase(entry.name), []).append(Path(entry.path))
+            except OSError as e:
+                logging.debug("Could not list the files in the build folder '%s'. Error: %s", build_folder, e)
+        logging.debug("Found %d files in the build folders %s.", len(artifact_index), [str(f) for f in build_folders])
+        self._artifact_index = artifact_index
+        self._indexed_build_folders = build_folders
+        return artifact_index
 
     def create_build_recipe_file(self, parsed_component_recipe) -> None:
         """
@@ -143,3 +248,4 @@ class BuildRecipeTransformer:
         ).resolve()
         logging.debug("Creating component recipe at '%s'.", gg_build_recipe_file)
         CaseInsensitiveRecipeFile().write(gg_build_recipe_file, parsed_component_recipe)
+        self.build_outputs.add(gg_build_recipe_file)
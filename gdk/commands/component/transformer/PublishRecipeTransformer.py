@@ -37,7 +37,6 @@ class PublishRecipeTransformer:
         """
         logging.debug("Updating artifact URIs in the recipe...")
         component_name = self.project_config.component_name
-        component_version = self.project_config.component_version
 
         if parsed_component_recipe.get("ComponentName") != component_name:
             logging.error("Component '{}' is not built.".format(parsed_component_recipe["ComponentName"]))
@@ -46,7 +45,7 @@ class PublishRecipeTransformer:
                 " build` before publishing it.".format(parsed_component_recipe["ComponentName"])
             )
         gg_build_component_artifacts = self.project_config.gg_build_component_artifacts_dir
-        artifact_uri = f"{utils.s3_prefix}{self.project_config.bucket}/{component_name}/{component_version}"
+        bucket_uri = f"{utils.s3_prefix}{self.project_config.bucket}"
 
         if "Manifests" not in parsed_component_recipe:
             logging.debug("No 'Manifests' key in the recipe.")
@@ -67,7 +66,8 @@ class PublishRecipeTransformer:
                 build_artifact_files = list(gg_build_component_artifacts.glob(artifact_file))
                 if len(build_artifact_files) == 1:
                     logging.debug("Updating artifact URI of '{}' in the recipe file.".format(artifact_file))
-                    artifact.update_value("Uri", f"{artifact_uri}/{artifact_file}")
+                    artifact_key = self.project_config.get_artifact_s3_key(build_artifact_files[0])
+                    artifact.update_value("Uri", f"{bucket_uri}/{artifact_key}")
                 else:
                     logging.warning(
                         f"Could not find the artifact file specified in the recipe '{artifact_file}' inside the build folder"
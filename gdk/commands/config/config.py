@@ -1,8 +1,7 @@
-from gdk.commands.config.UpdateCommand import UpdateCommand
-
-
 def update(d_args):
     """
     gdk config update
     """
+    from gdk.commands.config.UpdateCommand import UpdateCommand
+
     UpdateCommand(d_args).run()
@@ -1,12 +1,9 @@
-from gdk.commands.test.InitCommand import InitCommand
-from gdk.commands.test.BuildCommand import BuildCommand
-from gdk.commands.test.RunCommand import RunCommand
-
-
 def init(d_args):
     """
     gdk test init
     """
+    from gdk.commands.test.InitCommand import InitCommand
+
     InitCommand(d_args).run()
 
 
@@ -14,6 +11,8 @@ def run(d_args):
     """
     gdk test run
     """
+    from gdk.commands.test.RunCommand import RunCommand
+
     RunCommand(d_args).run()
 
 
@@ -21,4 +20,6 @@ def build(d_args):
     """
     gdk test build
     """
+    from gdk.commands.test.BuildCommand import BuildCommand
+
     BuildCommand(d_args).run()
@@ -1,54 +1,109 @@
 import json
 import logging
+from collections.abc import Mapping, MutableMapping
 from pathlib import Path
 
 import yaml
-from requests.structures import CaseInsensitiveDict as _CaseInsensitiveDict
 from gdk.common.consts import DOCS_RECIPE_LINK
 
 
-class CaseInsensitiveDict(_CaseInsensitiveDict):
+class CaseInsensitiveDict(MutableMapping):
+    """
+    Dictionary of a recipe with case insensitive keys, like 'Manifests' and 'manifests'. The case of each key is kept as
+    it was last set, so the recipe is written with the keys of the original recipe.
+
+    Nested dictionaries, also the ones in lists, are converted to case insensitive dictionaries when they are accessed, so
+    the recipe is only walked where it is read or updated. The converted value replaces the original one, so changes to
+    it are kept in the dictionary.
+    """
+
+    __slots__ = ("_store",)
+
     def __init__(self, data=None, **kwargs):
-        super().__init__(data, **kwargs)
-        _dict = _CaseInsensitiveDict(data)
-        self._convert_nested_dict(_dict)
-        self.update(_dict)
+        if isinstance(data, CaseInsensitiveDict):
+            self._store = dict(data._store)
+        elif isinstance(data, Mapping):
+            self._store = {key.lower(): (key, value) for key, value in data.items()}
+        else:
+            self._store = {}
+            self.update(data or ())
+        for key, value in kwargs.items():
+            self[key] = value
+
+    def __getitem__(self, key):
+        key_lower = key.lower()
+        original_key, value = self._store[key_lower]
+        if isinstance(value, (dict, list)):
+            converted_value = _convert(value)
+            if converted_value is not value:
+                self._store[key_lower] = (original_key, converted_value)
+            return converted_value
+        return value
+
+    def __setitem__(self, key, value):
+        self._store[key.lower()] = (key, value)
+
+    def __delitem__(self, key):
+        del self._store[key.lower()]
+
+    def __iter__(self):
+        return (key for key, _ in self._store.values())
+
+    def __len__(self):
+        return len(self._store)
+
+    def __contains__(self, key):
+        return key.lower() in self._store
+
+    def __eq__(self, other):
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        other = other if isinstance(other, CaseInsensitiveDict) else CaseInsensitiveDict(other)
+        return dict(self.lower_items()) == dict(other.lower_items())
+
+    def __repr__(self):
+        return str(dict(self.items()))
+
+    def lower_items(self):
+        return ((key_lower, self[key_lower]) for key_lower in self._store)
+
+    def copy(self):
+        return CaseInsensitiveDict(self)
 
     def to_dict(self):
-        _dict = dict(self)
-        self._convert_nested_case_insensitive_dict(_dict)
-        return _dict
+        """
+        Returns the content as nested dictionaries and lists with the original case of the keys. Values that were never
+        accessed are copied without converting them.
+        """
+        return {key: _to_plain(value) for key, value in self._store.values()}
 
     def update_value(self, key, value):
+        """
+        Sets the value of the key and keeps the case of the key when it already exists.
+        """
         if key.lower() in self._store:
             key = self._store[key.lower()][0]
         self._store[key.lower()] = (key, value)
 
-    def _convert_nested_dict(self, case_insensitive_dict: _CaseInsensitiveDict) -> None:
-        for key, value in case_insensitive_dict.items():
-            if isinstance(value, dict):
-                case_insensitive_dict.update({key: CaseInsensitiveDict(value)})
-            elif isinstance(value, list):
-                case_insensitive_dict.update(
-                    {key: [CaseInsensitiveDict(val) if isinstance(val, dict) else val for val in value]}
-                )
-
-    def _convert_nested_case_insensitive_dict(self, dictObj: dict) -> dict:
-        for key, value in dictObj.items():
-            if isinstance(value, CaseInsensitiveDict):
-                dictObj.update({key: self._convert_nested_case_insensitive_dict(dict(value))})
-            elif isinstance(value, list):
-                dictObj.update(
-                    {
-                        key: [
-                            self._convert_nested_case_insensitive_dict(dict(val))
-                            if isinstance(val, CaseInsensitiveDict)
-                            else val
-                            for val in value
-                        ]
-                    }
-                )
-        return dictObj
+
+def _convert(value):
+    if isinstance(value, dict):
+        return CaseInsensitiveDict(value)
+    if any(isinstance(item, dict) for item in value):
+        return [CaseInsensitiveDict(item) if isinstance(item, dict) else item for item in value]
+    return value
+
+
+def _to_plain(value):
+    # New containers are returned also for values that were never converted, so that values which are shared in the
+    # recipe, like the ones of YAML anchors, are written in full and not as aliases.
+    if isinstance(value, CaseInsensitiveDict):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {key: _to_plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_to_plain(item) for item in value]
+    return value
 
 
 class CaseInsensitiveRecipeFile:
@@ -0,0 +1,52 @@
+import logging
+import time
+
+import gdk.common.utils as utils
+
+# Version of the cache file format. Files written with a different version are ignored.
+CACHE_FORMAT_VERSION = 1
+
+
+class DiskCache:
+    """
+    JSON cache kept in a file in the cli cache directory between commands.
+
+    Every entry is stored with the time it was written, so readers can ignore entries older than their time to live. The
+    file is read and written with `utils.read_versioned_json` and `utils.write_versioned_json`.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.cache_file = utils.get_cache_dir().joinpath(f"{name}.json")
+
+    def get(self, key: str, max_age_seconds=None):
+        """
+        Returns the value cached with the key. Returns None if there is no such value or it is older than the max age.
+
+        Parameters
+        ----------
+            key(string): Key of the cached value.
+            max_age_seconds(float): Time to live of the value. Values never expire when not set.
+        """
+        entry = self._read_entries().get(key)
+        if not isinstance(entry, dict) or not isinstance(entry.get("updated"), (int, float)):
+            return None
+        if max_age_seconds is not None and time.time() - entry["updated"] > max_age_seconds:
+            logging.debug("Ignoring the expired value of '%s' in the cache '%s'.", key, self.cache_file)
+            return None
+        return entry.get("value")
+
+    def set(self, key: str, value) -> None:
+        """
+        Caches the JSON serializable value with the key.
+        """
+        entries = self._read_entries()
+        entries[key] = {"value": value, "updated": time.time()}
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logging.debug("Could not create the cache directory '%s'. Error: %s", self.cache_file.parent, e)
+            return
+        utils.write_versioned_json(self.cache_file, CACHE_FORMAT_VERSION, "entries", entries)
+
+    def _read_entries(self) -> dict:
+        return utils.read_versioned_json(self.cache_file, CACHE_FORMAT_VERSION, "entries")
@@ -0,0 +1,106 @@
+import base64
+import hashlib
+import logging
+import mmap
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import gdk.common.utils as utils
+
+# Version of the digest cache file format.
+CACHE_FORMAT_VERSION = 1
+# Size of the blocks in which files are read when they cannot be memory mapped.
+READ_BLOCK_SIZE = 8 * 1024 * 1024
+
+# Name of the digest algorithm in the recipe.
+DIGEST_ALGORITHM = "SHA-256"
+
+
+class FileDigester:
+    """
+    Computes the base64 encoded SHA-256 digests of files, which is the format of the 'Digest' of the artifacts in a
+    Greengrass recipe.
+
+    The files are hashed at the same time in threads. Each file is memory mapped and hashed in a single call, which
+    releases the GIL, so the hashing is bound by the disk and not by the interpreter.
+
+    The digests are kept in a cache file with the size and the modification time of each file. Files with the same size
+    and modification time as in the cache file are not hashed again.
+    """
+
+    def __init__(self, cache_file: Path) -> None:
+        self.cache_file = Path(cache_file)
+
+    def digest(self, files) -> dict:
+        """
+        Computes the digests of the files.
+
+        Parameters
+        ----------
+            files(list): Paths of the files to hash.
+
+        Returns
+        -------
+            digests(dict): Base64 encoded SHA-256 digest of each file by its path.
+        """
+        files = list(dict.fromkeys(Path(file) for file in files))
+        if not files:
+            return {}
+        start = time.perf_counter()
+        cached_entries = self._read_entries()
+        entries = {}
+        digests = {}
+        changed_files = []
+        for file in files:
+            stat = file.stat()
+            key = str(file.resolve())
+            cached_entry = cached_entries.get(key)
+            if self._is_unchanged(cached_entry, stat):
+                digests[file] = cached_entry[2]
+                entries[key] = cached_entry
+            else:
+                changed_files.append((file, key, stat))
+
+        if changed_files:
+            with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(changed_files))) as executor:
+                file_digests = executor.map(lambda changed_file: self._sha256(changed_file[0]), changed_files)
+                for (file, key, stat), file_digest in zip(changed_files, file_digests):
+                    digests[file] = file_digest
+                    entries[key] = [stat.st_size, stat.st_mtime_ns, file_digest]
+            # Only the digests of the files of this build are kept, so the cache file does not grow with every build.
+            self._write_entries(entries)
+        logging.info(
+            "Computed the digests of %d file(s) in %.2f seconds. %d of them were hashed, the others were cached.",
+            len(files),
+            time.perf_counter() - start,
+            len(changed_files),
+        )
+        return digests
+
+    def _is_unchanged(self, cached_entry, stat) -> bool:
+        if not isinstance(cached_entry, list) or len(cached_entry) != 3:
+            return False
+        return cached_entry[0] == stat.st_size and cached_entry[1] == stat.st_mtime_ns
+
+    def _sha256(self, file: Path) -> str:
+        sha256 = hashlib.sha256()
+        with open(file, "rb") as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                    sha256.update(mapped_file)
+            except (OSError, ValueError):
+                # Empty files and files on some filesystems cannot be memory mapped.
+                buffer = memoryview(bytearray(READ_BLOCK_SIZE))
+                size = f.readinto(buffer)
+                while size:
+                    sha256.update(buffer[:size])
+                    size = f.readinto(buffer)
+        return base64.b64encode(sha256.digest()).decode("ascii")
+
+    def _read_entries(self) -> dict:
+        return utils.read_versioned_json(self.cache_file, CACHE_FORMAT_VERSION, "files")
+
+    def _write_entries(self, entries: dict) -> None:
+        utils.write_versioned_json(self.cache_file, CACHE_FORMAT_VERSION, "files", entries)
@@ -0,0 +1,110 @@
+import logging
+import os
+import shutil
+import threading
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Request code of the FICLONE ioctl on Linux, which clones the data of a file into another file on the same filesystem.
+FICLONE = 0x40049409
+
+REFLINK = "reflink"
+HARDLINK = "hardlink"
+COPY = "copy"
+
+
+class FileStager:
+    """
+    Places files into a directory without copying their content when the filesystem allows it.
+
+    The staging methods are tried in this order:
+    1. reflink: The new file shares the data blocks of the source until either of them is changed. Supported on Linux by
+       filesystems like btrfs and xfs.
+    2. hardlink: The new file is another name of the source file, so both have the same content and permissions.
+    3. copy: The content of the source is copied to the new file.
+
+    The method is chosen once for each pair of source and destination filesystems in the process, by the first method that
+    succeeds for them, and reported in the debug log.
+    """
+
+    # Staging method that succeeded for each pair of source and destination filesystems, by their device ids.
+    _methods = {}
+    _lock = threading.Lock()
+
+    def stage(self, source_file, destination_dir) -> Path:
+        """
+        Places the file into the directory with the same name. A file with the same name in the directory is replaced.
+
+        Parameters
+        ----------
+            source_file(Path): Path of the file to stage.
+            destination_dir(Path): Directory to place the file in.
+
+        Returns
+        -------
+            destination_file(Path): Path of the staged file.
+        """
+        source_file = Path(source_file)
+        destination_file = Path(destination_dir).joinpath(source_file.name)
+        # The file is removed first, so that a link to the source of a previous build is never written through.
+        if destination_file.is_file() or destination_file.is_symlink():
+            destination_file.unlink()
+
+        filesystems = (source_file.stat().st_dev, Path(destination_dir).stat().st_dev)
+        method = FileStager._methods.get(filesystems)
+        if method is not None:
+            # Links can still fail for a single file, for example when the source has too many links already.
+            if method == COPY or self._try_stage(method, source_file, destination_file):
+                return destination_file
+            self._stage(COPY, source_file, destination_file)
+            return destination_file
+
+        for method in [REFLINK, HARDLINK]:
+            if self._try_stage(method, source_file, destination_file):
+                self._select_method(filesystems, method, source_file, destination_dir)
+                return destination_file
+        self._stage(COPY, source_file, destination_file)
+        self._select_method(filesystems, COPY, source_file, destination_dir)
+        return destination_file
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Forgets the staging methods chosen for the filesystems.
+        """
+        with cls._lock:
+            cls._methods.clear()
+
+    def _select_method(self, filesystems, method, source_file, destination_dir) -> None:
+        with FileStager._lock:
+            FileStager._methods[filesystems] = method
+        logging.debug("Staging files from '%s' to '%s' with a %s.", source_file.parent, destination_dir, method)
+
+    def _try_stage(self, method, source_file: Path, destination_file: Path) -> bool:
+        try:
+            self._stage(method, source_file, destination_file)
+            return True
+        except OSError as e:
+            logging.debug("Could not stage the file '%s' with a %s. Error: %s", source_file.name, method, e)
+            if destination_file.is_file():
+                destination_file.unlink()
+            return False
+
+    def _stage(self, method, source_file: Path, destination_file: Path) -> None:
+        if method == REFLINK:
+            self._reflink(source_file, destination_file)
+        elif method == HARDLINK:
+            os.link(source_file, destination_file)
+        else:
+            shutil.copy(source_file, destination_file)
+
+    def _reflink(self, source_file: Path, destination_file: Path) -> None:
+        if fcntl is None:
+            raise OSError("Reflinks are not supported on this platform.")
+        with open(source_file, "rb") as source, open(destination_file, "wb") as destination:
+            fcntl.ioctl(destination.fileno(), FICLONE, source.fileno())
+        shutil.copymode(source_file, destination_file)
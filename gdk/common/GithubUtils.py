@@ -1,10 +1,46 @@
+import logging
+
 import requests
 
+from gdk.common.DiskCache import DiskCache
+from gdk.common.consts import GITHUB_RELEASES_CACHE_NAME
+
+# Seconds to wait for the Github API before giving up, so that commands do not hang on firewalled networks.
+GITHUB_API_TIMEOUT_SECONDS = 5
+
 
 class GithubUtils:
     def get_latest_release_name(self, owner, repository):
         latest_release_api_url = f"https://api.github.com/repos/{owner}/{repository}/releases/latest"
-        response = requests.get(latest_release_api_url)
+        response = requests.get(latest_release_api_url, timeout=GITHUB_API_TIMEOUT_SECONDS)
         if response.status_code != 200:
             response.raise_for_status()
         return response.json().get("name")  # We typically name our GTF releases by the version.
+
+    def get_cached_latest_release_name(self, owner, repository, max_age_seconds, offline=False):
+        """
+        Returns the name of the latest release of the repository, using the release cached on disk when it is newer than the
+        max age.
+
+        Parameters
+        ----------
+            owner(string): Owner of the Github repository.
+            repository(string): Name of the Github repository.
+            max_age_seconds(float): Time to live of the cached release name.
+            offline(bool): Whether to only use the cached release name, however old it is, instead of calling the Github API.
+
+        Returns
+        -------
+            (string): Name of the latest release. None when it is not cached in offline mode.
+        """
+        cache = DiskCache(GITHUB_RELEASES_CACHE_NAME)
+        cache_key = f"{owner}/{repository}"
+        release_name = cache.get(cache_key, None if offline else max_age_seconds)
+        if release_name is not None or offline:
+            logging.debug("Using the cached latest release '%s' of the repository '%s'.", release_name, cache_key)
+            return release_name
+
+        release_name = self.get_latest_release_name(owner, repository)
+        if release_name is not None:
+            cache.set(cache_key, release_name)
+        return release_name
@@ -0,0 +1,104 @@
+import fnmatch
+import os
+import re
+
+_MAGIC_CHECK = re.compile("[*?[]")
+# Component of a pattern that matches any number of nested directories.
+_RECURSIVE = object()
+# Empty last component of a pattern that ends with a separator. Such patterns only match directories.
+_DIRECTORY = object()
+
+
+class GlobMatcher:
+    """
+    Matches paths relative to a root directory against glob patterns.
+
+    The patterns are compiled once and evaluated against each path as the directory tree is walked, which avoids listing
+    the whole tree for every pattern. A path matches a pattern when `glob.glob(root/pattern, recursive=True)` would return
+    it, so:
+    1. Wildcards do not match names starting with '.', unless the pattern component starts with '.' as well.
+    2. '**' matches any number of nested directories, but does not descend into hidden directories.
+    3. Patterns ending with a separator, or with a '**' that matches no directory, only match directories.
+    """
+
+    def __init__(self, patterns):
+        self._patterns = [self._compile(pattern) for pattern in patterns]
+
+    def matches(self, path_parts, is_dir) -> bool:
+        """
+        Checks if the path matches any of the patterns.
+
+        Parameters
+        ----------
+            path_parts(tuple): Names of the path components relative to the root directory.
+            is_dir(callable): Returns True if the path is a directory. Only called for patterns that match directories only.
+
+        Returns
+        -------
+            (bool): True if the path matches any of the patterns. Else False.
+        """
+        names = tuple(os.path.normcase(part) for part in path_parts)
+        checked_dir = None
+        for components in self._patterns:
+            result = self._match(components, 0, names, 0)
+            if result is True:
+                return True
+            if result is _DIRECTORY:
+                if checked_dir is None:
+                    checked_dir = bool(is_dir())
+                if checked_dir:
+                    return True
+        return False
+
+    def _compile(self, pattern):
+        if os.path.altsep:
+            pattern = pattern.replace(os.path.altsep, os.path.sep)
+        components = []
+        parts = pattern.split(os.path.sep)
+        for index, part in enumerate(parts):
+            if part == "**":
+                components.append(_RECURSIVE)
+            elif part == "" and index == len(parts) - 1 and index > 0:
+                components.append(_DIRECTORY)
+            elif _MAGIC_CHECK.search(part):
+                part = os.path.normcase(part)
+                components.append((re.compile(fnmatch.translate(part)).match, part.startswith(".")))
+            else:
+                components.append(os.path.normcase(part))
+        return tuple(components)
+
+    def _match(self, components, index, names, position):
+        """
+        Returns True if the names match the components, _DIRECTORY if they match only when the path is a directory and
+        False otherwise.
+        """
+        if index == len(components):
+            return position == len(names)
+
+        component = components[index]
+        if component is _DIRECTORY:
+            return _DIRECTORY if position == len(names) else False
+        if component is _RECURSIVE:
+            return self._match_recursive(components, index, names, position)
+        if position == len(names) or not self._match_name(component, names[position]):
+            return False
+        return self._match(components, index + 1, names, position + 1)
+
+    def _match_recursive(self, components, index, names, position):
+        if index == len(components) - 1 and position == len(names):
+            # '**' at the end of the pattern that matches no directory only matches the directory before it.
+            return _DIRECTORY
+        result = self._match(components, index + 1, names, position)
+        end = position
+        while result is not True and end < len(names) and not names[end].startswith("."):
+            end += 1
+            deeper_result = self._match(components, index + 1, names, end)
+            if deeper_result is not False:
+                result = deeper_result
+        return result
+
+    def _match_name(self, component, name):
+        if isinstance(component, str):
+            return component == name
+        match, matches_hidden = component
+        return (matches_hidden or not name.startswith(".")) and match(name) is not None
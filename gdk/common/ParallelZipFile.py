@@ -0,0 +1,114 @@
+import shutil
+import tempfile
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Size of the chunks read from a file while it is deflated.
+READ_CHUNK_SIZE = 1024 * 1024
+# Compressed entries larger than this are spooled to a temporary file instead of being held in memory.
+MAX_IN_MEMORY_ENTRY_SIZE = 16 * 1024 * 1024
+
+
+class ParallelZipFile(zipfile.ZipFile):
+    """
+    Zip file writer that deflates file entries in a pool of worker threads.
+
+    Files passed to `write` are deflated by the workers while the calling thread keeps walking the source tree. The
+    compressed entries are appended to the archive in the order they were written, so the archive has the same entries,
+    compressed data and central directory as the one created by `zipfile.ZipFile` with `ZIP_DEFLATED` compression.
+
+    At most two entries per job are held in flight at a time, and large compressed entries are spooled to disk, which keeps
+    the memory used by the writer bounded.
+    """
+
+    def __init__(self, file, jobs):
+        super().__init__(file, "w", compression=zipfile.ZIP_DEFLATED)
+        self._executor = ThreadPoolExecutor(max_workers=jobs)
+        self._pending = deque()
+        self._max_pending = jobs * 2
+
+    def write(self, filename, arcname=None, compress_type=None, compresslevel=None):
+        """
+        Queues the file to be deflated by a worker. Directories are queued as they are so that the entries keep their
+        order in the archive.
+        """
+        zinfo = zipfile.ZipInfo.from_file(filename, arcname)
+        if zinfo.is_dir():
+            self._pending.append((filename, zinfo, None))
+        else:
+            zinfo.compress_type = zipfile.ZIP_DEFLATED
+            self._pending.append((filename, zinfo, self._executor.submit(self._deflate, filename, zinfo)))
+
+        while len(self._pending) > self._max_pending:
+            self._write_next_entry()
+
+    def close(self):
+        try:
+            while self._pending:
+                self._write_next_entry()
+        finally:
+            self._executor.shutdown(wait=True)
+            super().close()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            # Entries queued before the failure are not written to an archive that is going to be discarded.
+            for _, _, future in self._pending:
+                if future is not None:
+                    future.cancel()
+            self._pending.clear()
+        self.close()
+
+    def _write_next_entry(self):
+        filename, zinfo, future = self._pending.popleft()
+        if future is None:
+            super().write(filename, zinfo.filename)
+            return
+
+        compressed_data = future.result()
+        try:
+            self._write_compressed_entry(zinfo, compressed_data)
+        finally:
+            compressed_data.close()
+
+    def _write_compressed_entry(self, zinfo, compressed_data):
+        zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT
+        with self._lock:
+            self._writecheck(zinfo)
+            self._didModify = True
+            zinfo.header_offset = self.fp.tell()
+            self.fp.write(zinfo.FileHeader(zip64))
+            shutil.copyfileobj(compressed_data, self.fp, READ_CHUNK_SIZE)
+            self.filelist.append(zinfo)
+            self.NameToInfo[zinfo.filename] = zinfo
+            self.start_dir = self.fp.tell()
+
+    def _deflate(self, filename, zinfo):
+        """
+        Deflates the file with the same settings used by `zipfile.ZipFile` and returns the compressed data. The size and CRC
+        of the file are updated on its zip info.
+        """
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+        compressed_data = tempfile.SpooledTemporaryFile(max_size=MAX_IN_MEMORY_ENTRY_SIZE)
+        crc = 0
+        file_size = 0
+        try:
+            with open(filename, "rb") as source:
+                chunk = source.read(READ_CHUNK_SIZE)
+                while chunk:
+                    file_size += len(chunk)
+                    crc = zlib.crc32(chunk, crc)
+                    compressed_data.write(compressor.compress(chunk))
+                    chunk = source.read(READ_CHUNK_SIZE)
+            compressed_data.write(compressor.flush())
+        except Exception:
+            compressed_data.close()
+            raise
+
+        zinfo.file_size = file_size
+        zinfo.CRC = crc
+        zinfo.compress_size = compressed_data.tell()
+        compressed_data.seek(0)
+        return compressed_data
@@ -1,19 +1,15 @@
-import json
 import jsonschema
 
+from gdk.common.SchemaValidator import SchemaValidator
+
 
 class RecipeValidator:
     def __init__(self, schema_file):
-        self._setup_schema(schema_file)
+        self._validator = SchemaValidator.get(schema_file, jsonschema.validators.Draft7Validator)
 
     def validate_recipe(self, recipe):
         processed_recipe = self._keys_to_lower(recipe)
-        jsonschema.validate(instance=processed_recipe, schema=self.schema, cls=jsonschema.validators.Draft7Validator)
-
-    def _setup_schema(self, schema_file):
-        with open(schema_file, 'r') as file:
-            self.schema = json.loads(file.read())
-            jsonschema.Draft7Validator.check_schema(schema=self.schema)
+        self._validator.validate(processed_recipe)
 
     def _keys_to_lower(self, obj):
         if type(obj) is dict:
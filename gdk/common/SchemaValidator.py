@@ -0,0 +1,89 @@
+import hashlib
+import json
+import logging
+import threading
+
+import jsonschema
+
+import gdk.common.consts as consts
+from gdk.common.DiskCache import DiskCache
+
+
+class SchemaValidator:
+    """
+    Validates documents against a json schema with a validator that is compiled once per process.
+
+    The hashes of the documents that are valid are cached on disk with the hash of the schema, so an unchanged document is
+    not validated again by later commands. Invalid documents are always validated so that their errors are reported.
+    """
+
+    _validators = {}
+    _lock = threading.Lock()
+
+    def __init__(self, schema_file, validator_class=None) -> None:
+        with open(schema_file, "r") as f:
+            schema_content = f.read()
+        schema = json.loads(schema_content)
+        validator_class = validator_class or jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        self._validator = validator_class(schema)
+        self._cache_key = "{}:{}".format(
+            validator_class.__name__, hashlib.sha256(schema_content.encode("utf-8")).hexdigest()
+        )
+
+    @classmethod
+    def get(cls, schema_file, validator_class=None) -> "SchemaValidator":
+        """
+        Returns the validator of the schema file, compiling it on first use.
+
+        Parameters
+        ----------
+            schema_file(Path): Path of the json schema file.
+            validator_class(type): Class of the jsonschema validator. Defaults to the one of the '$schema' of the schema.
+
+        Returns
+        -------
+            validator(SchemaValidator): Validator of the schema.
+
+        Raises SchemaError if the schema is invalid.
+        """
+        key = (str(schema_file), validator_class)
+        with cls._lock:
+            if key not in cls._validators:
+                cls._validators[key] = cls(schema_file, validator_class)
+            return cls._validators[key]
+
+    def validate(self, document) -> None:
+        """
+        Validates the document against the schema. Raises the same ValidationError as `jsonschema.validate`.
+
+        Parameters
+        ----------
+            document(dict): Document to validate.
+        """
+        document_hash = self._get_document_hash(document)
+        cache = DiskCache(consts.SCHEMA_VALIDATION_CACHE_NAME)
+        valid_documents = self._get_valid_documents(cache) if document_hash else []
+        if document_hash in valid_documents:
+            logging.debug("Skipping the validation of the unchanged document that is valid against the schema.")
+            return
+
+        error = jsonschema.exceptions.best_match(self._validator.iter_errors(document))
+        if error is not None:
+            raise error
+
+        if document_hash:
+            valid_documents = [h for h in valid_documents if h != document_hash] + [document_hash]
+            cache.set(self._cache_key, valid_documents[-consts.MAX_CACHED_VALID_DOCUMENTS:])
+
+    def _get_valid_documents(self, cache) -> list:
+        valid_documents = cache.get(self._cache_key)
+        return valid_documents if isinstance(valid_documents, list) else []
+
+    def _get_document_hash(self, document):
+        try:
+            serialized_document = json.dumps(document, sort_keys=True)
+        except (TypeError, ValueError):
+            # Documents with values that are not json types, like dates in yaml recipes, are always validated.
+            return None
+        return hashlib.sha256(serialized_document.encode("utf-8")).hexdigest()
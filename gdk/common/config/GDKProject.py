@@ -9,15 +9,19 @@ import gdk.common.exceptions.error_messages as error_messages
 
 
 class GDKProject:
+    # Recipe files found in project directories, by the path and the modification time of the directory. Adding, removing
+    # or renaming a file in the directory changes its modification time.
+    _recipe_files = {}
+
     def __init__(self):
         self._config = configuration.get_configuration()
         self._component = self._config.get("component")
         self._test = self._config.get("test-e2e", {})
         self._project_dir = utils.get_current_directory()
 
-        self.component_name = next(iter(self._component))
+        self.component_name = self._get_component_name()
         self.component_config = self._component.get(self.component_name)
-        self.test_config = TestConfiguration(self._test)
+        self._test_config = None
 
         component_version = self.component_config.get("version")
 
@@ -29,6 +33,26 @@ class GDKProject:
         )
         self.recipe_file = self._get_recipe_file()
 
+    def _get_component_name(self):
+        """
+        Returns the name of the component selected in a project with multiple components, or the only component.
+        """
+        selected_component = configuration.get_selected_component()
+        if selected_component:
+            return selected_component
+        if len(self._component) > 1:
+            raise Exception(error_messages.MULTIPLE_COMPONENTS_NOT_SUPPORTED)
+        return next(iter(self._component))
+
+    @property
+    def test_config(self) -> TestConfiguration:
+        """
+        Configuration of the 'test-e2e' commands. It is only read by the commands that use it.
+        """
+        if self._test_config is None:
+            self._test_config = TestConfiguration(self._test)
+        return self._test_config
+
     def _get_recipe_file(self):
         """
         Finds recipe file based on component name and its extension.
@@ -39,6 +63,8 @@ class GDKProject:
 
         Raises an exception if no recipe file is found in the current project directory.
 
+        The recipe file is only looked up again when the project directory changed since the last lookup in this process.
+
         Parameters
         ----------
             None
@@ -47,10 +73,19 @@ class GDKProject:
         -------
             recipe_file(Path): Path of the identified recipe file.
         """
+        project_dir = Path(utils.get_current_directory()).resolve()
+        cache_key = (project_dir, project_dir.stat().st_mtime_ns)
+        recipe_file = GDKProject._recipe_files.get(cache_key)
+        if recipe_file is None:
+            recipe_file = self._find_recipe_file(project_dir)
+            GDKProject._recipe_files[cache_key] = recipe_file
+        return recipe_file
+
+    def _find_recipe_file(self, project_dir):
         # Search for json files in current directory that contain component name and ends in .json.
         logging.debug("Looking for recipe file in the project directory.")
-        json_file = list(Path(utils.get_current_directory()).glob("recipe.json"))
-        yaml_file = list(Path(utils.get_current_directory()).glob("recipe.yaml"))
+        json_file = list(project_dir.glob("recipe.json"))
+        yaml_file = list(project_dir.glob("recipe.yaml"))
 
         if not json_file and not yaml_file:
             logging.error("Could not find 'recipe.json' or 'recipe.yaml' in the project directory.")
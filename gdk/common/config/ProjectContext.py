@@ -0,0 +1,72 @@
+import copy
+import hashlib
+import logging
+import threading
+from pathlib import Path
+
+
+class ProjectContext:
+    """
+    Parsed and validated configuration of a gdk project, shared by all the commands run in one invocation of the cli.
+
+    Commands like `gdk component publish` run other commands, and each of them reads the project configuration. The
+    context of a config file is created once and reused as long as the file does not change. When the modification time
+    or the size of the file changed, the file is hashed and it is only parsed and validated again if its content changed.
+    """
+
+    _contexts = {}
+    _lock = threading.Lock()
+
+    def __init__(self, config_file: Path, config: dict, stat_key: tuple, sha256: str) -> None:
+        self.config_file = config_file
+        self.sha256 = sha256
+        self._config = config
+        self._stat_key = stat_key
+
+    @property
+    def config(self) -> dict:
+        """
+        Copy of the project configuration, so that a command can change it without affecting the other commands.
+        """
+        return copy.deepcopy(self._config)
+
+    @classmethod
+    def get(cls, config_file: Path, load) -> "ProjectContext":
+        """
+        Returns the context of the config file, creating it when the file is read for the first time or changed.
+
+        Parameters
+        ----------
+            config_file(Path): Path of the project config file.
+            load(callable): Parses and validates the content of the config file and returns the configuration. Called with
+                the path and the content of the file.
+
+        Returns
+        -------
+            context(ProjectContext): Context of the config file.
+        """
+        stat = config_file.stat()
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        with cls._lock:
+            context = cls._contexts.get(config_file)
+            if context is not None and context._stat_key == stat_key:
+                return context
+
+            content = config_file.read_bytes()
+            sha256 = hashlib.sha256(content).hexdigest()
+            if context is not None and context.sha256 == sha256:
+                logging.debug("The content of the project config file '%s' did not change.", config_file.name)
+                context._stat_key = stat_key
+                return context
+
+            context = cls(config_file, load(config_file, content.decode("utf-8")), stat_key, sha256)
+            cls._contexts[config_file] = context
+            return context
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Forgets the contexts of all config files.
+        """
+        with cls._lock:
+            cls._contexts.clear()
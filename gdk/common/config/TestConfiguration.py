@@ -1,47 +1,84 @@
 import logging
 from packaging.version import Version
 
+import gdk.common.utils as utils
 from gdk.common.GithubUtils import GithubUtils
-from gdk.common.consts import GTF_REPO_OWNER, GTF_REPO_NAME
+from gdk.common.consts import GTF_REPO_OWNER, GTF_REPO_NAME, GTF_RELEASE_CACHE_TTL_SECONDS
+
+# Default value for when the latest GTF release cannot be discovered.
+DEFAULT_GTF_VERSION = "1.2.0"
 
 
 class TestConfiguration:
+    """
+    Configuration of the 'test-e2e' commands.
+
+    The latest GTF release is only discovered when the GTF version is used, so that commands which do not use it never call
+    the Github API. The discovered release is cached on disk, and only the cached release is used in offline mode.
+    """
+
     def __init__(self, test_config):
         self.test_build_system = "maven"
-        self.gtf_version = "1.2.0"  # Default value for when Github API call fails
         self.gtf_options = {}
         self.upgrade_suggestion_already_provided = False
-        self.latest_gtf_version = None
+        self._test_config = test_config
+        self._gtf_version = None
+        self._latest_gtf_version = None
+        self._latest_gtf_version_discovered = False
 
         self._set_test_config(test_config)
 
+    @property
+    def gtf_version(self):
+        if self._gtf_version is None:
+            self._gtf_version = self._get_gtf_version()
+        return self._gtf_version
+
+    @property
+    def latest_gtf_version(self):
+        if not self._latest_gtf_version_discovered:
+            self._latest_gtf_version = self._discover_latest_gtf_version()
+            self._latest_gtf_version_discovered = True
+        return self._latest_gtf_version
+
     def _set_test_config(self, test_config):
         self._set_build_config(test_config.get("build", {}))
-        self._set_gtf_config(test_config)
+        self.gtf_options = (test_config.get("gtf_options")
+                            if "gtf_options" in test_config
+                            else test_config.get("otf_options", {}))
 
     def _set_build_config(self, test_build_config):
         self.test_build_system = test_build_config.get("build_system", self.test_build_system)
 
-    def _set_gtf_config(self, test_config):
-        github_utils = GithubUtils()
+    def _discover_latest_gtf_version(self):
         try:
-            release_name = github_utils.get_latest_release_name(GTF_REPO_OWNER, GTF_REPO_NAME)
+            release_name = GithubUtils().get_cached_latest_release_name(
+                GTF_REPO_OWNER, GTF_REPO_NAME, GTF_RELEASE_CACHE_TTL_SECONDS, offline=utils.is_offline()
+            )
             if release_name is not None:
-                self.gtf_version = release_name
-                self.latest_gtf_version = release_name
-                logging.debug("Discovered %s as latest GTF release name.", self.gtf_version)
+                logging.debug("Discovered %s as latest GTF release name.", release_name)
             else:
-                logging.debug("GTF release name was found to be None. Using %s as the default value.", self.gtf_version)
+                logging.debug("GTF release name was found to be None.")
+            return release_name
         except Exception as e:
-            logging.debug("Unable to get the latest GTF release name. Using %s as the default value.", self.gtf_version)
+            logging.debug("Unable to get the latest GTF release name.")
             logging.debug("Exception information for GTF release name API call: %s", str(e))
-        self.gtf_version = (test_config.get("gtf_version")
-                            if "gtf_version" in test_config
-                            else test_config.get("otf_version", self.gtf_version))
+            return None
+
+    def _get_gtf_version(self):
+        test_config = self._test_config
+        if "gtf_version" in test_config:
+            gtf_version = test_config.get("gtf_version")
+        elif "otf_version" in test_config:
+            gtf_version = test_config.get("otf_version")
+        else:
+            gtf_version = self.latest_gtf_version or DEFAULT_GTF_VERSION
+            if gtf_version == DEFAULT_GTF_VERSION:
+                logging.debug("Using %s as the default GTF version.", gtf_version)
         try:
             # We have handling later to determine if user-provided version is incorrect, so if they are not proper
             # versions to qualify for this warning, catch the error and just pass
-            if Version(self.gtf_version) < Version(self.latest_gtf_version):
+            if Version(gtf_version) < Version(self.latest_gtf_version):
                 logging.info(
                     f"The current latest version of GTF is {self.latest_gtf_version}. Please consider updating your "
                     "gdk-config.json to use the latest version."
@@ -49,6 +86,4 @@ class TestConfiguration:
                 self.upgrade_suggestion_already_provided = True
         except Exception as e:
             logging.debug("Not providing GTF update suggestion due to caught version error: %s", str(e))
-        self.gtf_options = (test_config.get("gtf_options")
-                            if "gtf_options" in test_config
-                            else test_config.get("otf_options", {}))
+        return gtf_version
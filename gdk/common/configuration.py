@@ -6,13 +6,21 @@ import gdk.common.consts as consts
 import gdk.common.exceptions.error_messages as error_messages
 import gdk.common.utils as utils
 import jsonschema
+from gdk.common.SchemaValidator import SchemaValidator
 from packaging.version import Version
 
 
+# Config file and component of a project with multiple components that are used by the build of one of its components.
+_selected_config_file = None
+_selected_component = None
+
+
 def get_configuration():
     """
     Loads the configuration from the greengrass project config file as a json object.
 
+    The config file is only parsed and validated again when it changed since it was last loaded in this process.
+
     Throws ValidationError if the config file not valid as per schema.
 
     Parameters
@@ -23,9 +31,28 @@ def get_configuration():
     -------
        config_data(dict): Greengrass project configuration as a dictionary object if the config is valid.
     """
-    project_config_file = _get_project_config_file()
-    with open(project_config_file, "r") as config_file:
-        config_data = json.loads(config_file.read())
+    return get_project_context().config
+
+
+def get_project_context():
+    """
+    Returns the context of the greengrass project config file that is shared by all commands in this process.
+
+    Parameters
+    ----------
+        None
+
+    Returns
+    -------
+       context(ProjectContext): Context of the project config file.
+    """
+    from gdk.common.config.ProjectContext import ProjectContext
+
+    return ProjectContext.get(_get_project_config_file(), _load_configuration)
+
+
+def _load_configuration(project_config_file, content):
+    config_data = json.loads(content)
     try:
         validate_cli_version(config_data)
         validate_configuration(config_data)
@@ -52,10 +79,8 @@ def validate_configuration(data):
     """
 
     config_schema_file = utils.get_static_file_path(consts.config_schema_file)
-    with open(config_schema_file, "r") as schemaFile:
-        schema = json.loads(schemaFile.read())
     logging.debug("Validating the configuration file.")
-    jsonschema.validate(data, schema)
+    SchemaValidator.get(config_schema_file).validate(data)
 
 
 def validate_cli_version(config_data):
@@ -75,6 +100,33 @@ def validate_cli_version(config_data):
     )
 
 
+def select_component(config_file, component_name):
+    """
+    Selects the component of a project with multiple components that the commands in this process use.
+
+    The component is built in its own directory, so the project config file is not looked up in the current directory.
+
+    Parameters
+    ----------
+        config_file(pathlib.Path): Path of the project config file.
+        component_name(string): Name of the component in the project configuration.
+
+    Returns
+    -------
+        None
+    """
+    global _selected_config_file, _selected_component
+    _selected_config_file = config_file
+    _selected_component = component_name
+
+
+def get_selected_component():
+    """
+    Returns the name of the component selected with `select_component`. None if no component is selected.
+    """
+    return _selected_component
+
+
 def _get_project_config_file():
     """
     Returns path of the config file present in the greengrass project directory.
@@ -91,7 +143,10 @@ def _get_project_config_file():
     -------
        config_file(pathlib.Path): Path of the config file.
     """
-    config_file = Path(utils.get_current_directory()).joinpath(consts.cli_project_config_file).resolve()
+    if _selected_config_file is not None:
+        config_file = Path(_selected_config_file)
+    else:
+        config_file = Path(utils.get_current_directory()).joinpath(consts.cli_project_config_file).resolve()
     if not utils.file_exists(config_file):
         raise Exception(error_messages.CONFIG_FILE_NOT_EXISTS)
     return config_file
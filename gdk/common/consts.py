@@ -23,7 +23,40 @@ recipe_schema_file = "recipe_schema.json"
 cli_model_file = "cli_model.json"
 cli_project_config_file = "gdk-config.json"
 greengrass_build_dir = "greengrass-build"
+# Folder in the greengrass-build folder of a project with multiple components that contains the log of each build.
+BUILD_LOGS_DIR = "logs"
 E2E_TESTS_DIR_NAME = "gg-e2e-tests"
+BUILD_MANIFEST_FILE = "build-manifest.json"
+# File in the greengrass-build folder with the digests of the artifacts of the last build.
+ARTIFACT_DIGESTS_FILE = "artifact-digests.json"
+# Folders that are never inputs of a component build.
+BUILD_CACHE_EXCLUDED_DIRS = [greengrass_build_dir, ".git", ".hg", ".svn", ".gradle"]
+# Folders that are not searched for the build files of the modules in a project.
+MODULE_SEARCH_EXCLUDED_DIRS = BUILD_CACHE_EXCLUDED_DIRS + ["zip-build", "node_modules"]
+# Location of the shared build cache. Overrides the location in the project configuration.
+GDK_BUILD_CACHE_ENV_KEY = "GDK_BUILD_CACHE"
+# Key of the object metadata in which the SHA-256 checksum of a published artifact is stored.
+ARTIFACT_CHECKSUM_METADATA_KEY = "gdk-sha256"
+# Layouts of the published artifacts in the s3 bucket. Versioned artifacts are stored under the component version and
+# content addressed artifacts are stored once under their SHA-256 checksum.
+ARTIFACT_LAYOUT_VERSIONED = "versioned"
+ARTIFACT_LAYOUT_CONTENT_ADDRESSED = "content-addressed"
+# Directory of the caches kept by the cli between commands. Defaults to '.gdk/cache' in the home directory.
+GDK_CACHE_DIR_ENV_KEY = "GDK_CACHE_DIR"
+COMPONENT_VERSIONS_CACHE_NAME = "component-versions"
+GITHUB_RELEASES_CACHE_NAME = "github-releases"
+GTF_RELEASE_CACHE_TTL_SECONDS = 24 * 60 * 60
+# Set to 'true' to stop the cli from calling the Github API. Only the results cached by earlier commands are used.
+GDK_OFFLINE_ENV_KEY = "GDK_OFFLINE"
+# Set to 'true' to disable the check for a new version of the cli.
+GDK_DISABLE_UPDATE_CHECK_ENV_KEY = "GDK_DISABLE_UPDATE_CHECK"
+# Hours after which the latest version of the cli is fetched again.
+GDK_UPDATE_CHECK_TTL_HOURS_ENV_KEY = "GDK_UPDATE_CHECK_TTL_HOURS"
+DEFAULT_UPDATE_CHECK_TTL_HOURS = 24
+CLI_VERSION_CACHE_NAME = "cli-version"
+# Hashes of the documents that passed the validation against each schema, most recent last.
+SCHEMA_VALIDATION_CACHE_NAME = "schema-validation"
+MAX_CACHED_VALID_DOCUMENTS = 32
 
 # URLS
 templates_list_url = (
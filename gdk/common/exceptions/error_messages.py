@@ -6,7 +6,31 @@ CONFIG_SCHEMA_FILE_NOT_EXISTS = "Configuration validation failed. Config schema
 PROJECT_RECIPE_FILE_NOT_FOUND = (
     "No valid component recipe is found. Please include a valid recipe file of the component to build with default."
 )
+MULTIPLE_COMPONENTS_NOT_SUPPORTED = (
+    "The project configuration has multiple components. Only the 'gdk component build' and 'gdk component publish' commands"
+    " support projects with multiple components."
+)
+COMPONENT_DIRS_CONFLICT = (
+    "Components '{}' and '{}' are in the same directory '{}'. Set a different 'path' for each component of a project with"
+    " multiple components."
+)
+COMPONENT_DIR_IS_PROJECT_DIR = (
+    "Component '{}' is in the project directory. Set the 'path' of each component of a project with multiple components to"
+    " its own directory."
+)
+COMPONENT_DEPENDENCY_CYCLE = (
+    "Components of the project depend on each other in a cycle: {}. Please remove one of the dependencies and try again."
+)
+COMPONENT_DEPENDENCY_VERSION_NOT_FOUND = (
+    "Component '{}' depends on the version '{}' of the component '{}' in the project, but the project has its version '{}'."
+    " Please correct the version requirement in the recipe or the version in the project configuration and try again."
+)
+COMPONENT_DIR_NOT_FOUND = "Directory '{}' of the component '{}' does not exist. Please correct its 'path' and try again."
 PROJECT_CONFIG_FILE_INVALID = "Project configuration file '{}' is invalid. Please correct its format and try again. Error: {} "
+ARTIFACT_IN_MULTIPLE_BUILD_FOLDERS = (
+    "Artifact '{}' of the recipe is found in multiple build folders {}. Please give the artifacts of the modules different"
+    " names so that the artifact of the component can be identified."
+)
 PROJECT_RECIPE_FILE_INVALID = (
     "Project recipe file '{}' is invalid. Please correct its format and try again.\nFor more information regarding " +
     "component recipes refer to the docs here: https://docs.aws.amazon.com/greengrass/v2/developerguide/" +
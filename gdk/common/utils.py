@@ -1,13 +1,24 @@
+import contextlib
+import hashlib
+import json
 import logging
+import os
 import shutil
+import threading
+import uuid
 from pathlib import Path
 
-import requests
-from packaging.version import Version
-
 import gdk
 import gdk._version as version
-from gdk.common.consts import MAX_RECIPE_FILE_SIZE_BYTES
+from gdk.common.consts import (
+    CLI_VERSION_CACHE_NAME,
+    DEFAULT_UPDATE_CHECK_TTL_HOURS,
+    GDK_CACHE_DIR_ENV_KEY,
+    GDK_DISABLE_UPDATE_CHECK_ENV_KEY,
+    GDK_OFFLINE_ENV_KEY,
+    GDK_UPDATE_CHECK_TTL_HOURS_ENV_KEY,
+    MAX_RECIPE_FILE_SIZE_BYTES,
+)
 
 
 def get_static_file_path(file_name):
@@ -109,8 +120,10 @@ def clean_dir(dir):
 
 
 def get_latest_cli_version():
+    import requests
+
     try:
-        response = requests.get(latest_cli_version_file)
+        response = requests.get(latest_cli_version_file, timeout=CLI_VERSION_REQUEST_TIMEOUT_SECONDS)
         if response.status_code == 200:
             version_string = response.text.splitlines()[0]
             l_version = version_string.split("__version__ = ")[1].strip('"')
@@ -123,13 +136,62 @@ def get_latest_cli_version():
 
 
 def cli_version_check():
-    latest_cli_version = get_latest_cli_version()
+    """
+    Suggests updating the cli when a newer version is available.
+
+    The check never blocks the command. The latest version is read from the cache of an earlier check and it is fetched in
+    a background thread when the cached version is older than the time to live set by GDK_UPDATE_CHECK_TTL_HOURS. The
+    check is disabled by setting GDK_DISABLE_UPDATE_CHECK to 'true' and in offline mode.
+
+    The time of the check is cached before the request is sent, so commands that exit before the request finishes or
+    requests that fail do not check again until the time to live expires.
+    """
+    from packaging.version import Version
+
+    from gdk.common.DiskCache import DiskCache
+
+    if _is_env_var_true(GDK_DISABLE_UPDATE_CHECK_ENV_KEY) or is_offline():
+        logging.debug("Skipping the check for a new version of the cli.")
+        return
+
+    cache = DiskCache(CLI_VERSION_CACHE_NAME)
+    ttl_seconds = get_update_check_ttl_seconds()
+    checked_recently = cache.get(CLI_VERSION_CHECK_CACHE_KEY, ttl_seconds) is not None
+    if cache.get(LATEST_CLI_VERSION_CACHE_KEY, ttl_seconds) is None and not checked_recently:
+        cache.set(CLI_VERSION_CHECK_CACHE_KEY, True)
+        threading.Thread(target=_refresh_latest_cli_version, args=(cache,), daemon=True).start()
+
+    latest_cli_version = cache.get(LATEST_CLI_VERSION_CACHE_KEY)
+    if latest_cli_version is None:
+        return
     update_command = f"pip3 install git+https://github.com/aws-greengrass/aws-greengrass-gdk-cli.git@v{latest_cli_version}"
-    if Version(cli_version) < Version(latest_cli_version):
-        logging.info(
-            f"New version of GDK CLI - {latest_cli_version} is available. Please update the cli using the command"
-            f" `{update_command}`.\n"
-        )
+    try:
+        if Version(cli_version) < Version(latest_cli_version):
+            logging.info(
+                f"New version of GDK CLI - {latest_cli_version} is available. Please update the cli using the command"
+                f" `{update_command}`.\n"
+            )
+    except Exception as e:
+        logging.debug("Ignoring the invalid latest version of the cli '%s'. Error: %s", latest_cli_version, e)
+
+
+def get_update_check_ttl_seconds() -> float:
+    """
+    Returns the time to live of the cached latest version of the cli, set in hours by GDK_UPDATE_CHECK_TTL_HOURS.
+    """
+    ttl_hours = os.environ.get(GDK_UPDATE_CHECK_TTL_HOURS_ENV_KEY, "").strip()
+    if ttl_hours:
+        try:
+            return max(float(ttl_hours), 0) * 60 * 60
+        except ValueError:
+            logging.debug("Ignoring the invalid value '%s' of %s.", ttl_hours, GDK_UPDATE_CHECK_TTL_HOURS_ENV_KEY)
+    return DEFAULT_UPDATE_CHECK_TTL_HOURS * 60 * 60
+
+
+def _refresh_latest_cli_version(cache) -> None:
+    # Versions that could not be fetched are cached as the installed version, so that failing requests are not retried on
+    # every command.
+    cache.set(LATEST_CLI_VERSION_CACHE_KEY, get_latest_cli_version())
 
 
 def get_next_patch_version(version_number: str) -> str:
@@ -147,19 +209,177 @@ def get_current_directory() -> Path:
     return Path(".").resolve()
 
 
+def find_files(root, names, excluded_dirs=()) -> dict:
+    """
+    Finds the files with any of the names in the directory tree with a single walk. Symbolic links to directories are not
+    followed.
+
+    Parameters
+    ----------
+        root(Path): Directory to search.
+        names(list): Names of the files to find.
+        excluded_dirs(list): Names of the directories that are not searched, at any depth.
+
+    Returns
+    -------
+        (dict): Sorted paths of the files found for each name.
+    """
+    excluded_dirs = set(excluded_dirs)
+    found = {name: [] for name in names}
+    directories = [str(root)]
+    while directories:
+        directory = directories.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in excluded_dirs:
+                            directories.append(entry.path)
+                    elif entry.name in found and entry.is_file():
+                        found[entry.name].append(Path(entry.path))
+        except OSError as e:
+            logging.debug("Could not list the directory '%s'. Error: %s", directory, e)
+    return {name: sorted(paths) for name, paths in found.items()}
+
+
 def is_recipe_size_valid(file_path):
     file_size = Path(file_path).stat().st_size
     return file_size <= MAX_RECIPE_FILE_SIZE_BYTES, file_size
 
 
+def get_file_sha256(file_path) -> str:
+    """
+    Computes the SHA-256 digest of the file without reading it into memory at once.
+
+    Parameters
+    ----------
+        file_path(Path): Path of the file to hash.
+
+    Returns
+    -------
+        (str): Hex digest of the file content.
+    """
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        chunk = f.read(HASH_CHUNK_SIZE)
+        while chunk:
+            sha256.update(chunk)
+            chunk = f.read(HASH_CHUNK_SIZE)
+    return sha256.hexdigest()
+
+
+@contextlib.contextmanager
+def atomic_write(file_path, mode="w"):
+    """
+    Opens a temporary file next to the file for writing and replaces the file with it when the block completes, so
+    concurrent readers never see a partially written file. The temporary file is removed when the block fails.
+
+    Parameters
+    ----------
+        file_path(Path): Path of the file to write.
+        mode(string): Mode in which the temporary file is opened, 'w' for text or 'wb' for binary content.
+    """
+    file_path = Path(file_path)
+    temporary_file = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(temporary_file, mode, encoding=None if "b" in mode else "utf-8") as f:
+            yield f
+        os.replace(temporary_file, file_path)
+    except BaseException:
+        if temporary_file.exists():
+            temporary_file.unlink()
+        raise
+
+
+def read_versioned_json(file_path, version: int, key: str) -> dict:
+    """
+    Reads the entries of a JSON cache file written by `write_versioned_json`.
+
+    Caches are only an optimization, so a file that cannot be read or that was written with another version of its format
+    is treated as empty.
+
+    Returns
+    -------
+        entries(dict): Entries stored with the key in the file. Empty if the file cannot be read.
+    """
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            content = json.loads(f.read())
+    except (OSError, ValueError) as e:
+        logging.debug("Could not read the cache '%s'. Error: %s", file_path, e)
+        return {}
+    if not isinstance(content, dict) or content.get("version") != version:
+        return {}
+    entries = content.get(key)
+    return entries if isinstance(entries, dict) else {}
+
+
+def write_versioned_json(file_path, version: int, key: str, entries: dict) -> None:
+    """
+    Writes the entries of a JSON cache file with the version of its format. The file is replaced atomically and failures
+    to write it are ignored.
+    """
+    try:
+        with atomic_write(file_path) as f:
+            f.write(json.dumps({"version": version, key: entries}))
+    except OSError as e:
+        logging.debug("Could not write the cache '%s'. Error: %s", file_path, e)
+
+
+def format_size(size: int) -> str:
+    """
+    Formats a number of bytes as a human readable size, like '3.5 MB'.
+    """
+    if size < 1024:
+        return f"{size} B"
+    for unit in ["KB", "MB", "GB"]:
+        size /= 1024
+        if size < 1024 or unit == "GB":
+            return f"{size:.1f} {unit}"
+
+
+def get_cache_dir() -> Path:
+    """
+    Returns the directory of the caches kept by the cli between commands. The GDK_CACHE_DIR environment variable overrides
+    the default directory '.gdk/cache' in the home directory.
+    """
+    cache_dir = os.environ.get(GDK_CACHE_DIR_ENV_KEY, "").strip()
+    if cache_dir:
+        return Path(cache_dir).expanduser()
+    return Path.home().joinpath(".gdk", "cache")
+
+
+def is_offline() -> bool:
+    """
+    Returns True if the GDK_OFFLINE environment variable is set to 'true', '1' or 'yes'.
+    """
+    return _is_env_var_true(GDK_OFFLINE_ENV_KEY)
+
+
+def _is_env_var_true(name) -> bool:
+    return os.environ.get(name, "").strip().lower() in ["true", "1", "yes"]
+
+
 def convertToLowercase(value):
     return str.lower(value)
 
 
+def positiveInteger(value):
+    number = int(value)
+    if number < 1:
+        raise ValueError(f"{value} is not a positive integer")
+    return number
+
+
 error_line = "\n=============================== ERROR ===============================\n"
 help_line = "\n=============================== HELP ===============================\n"
 current_directory = Path(".").resolve()
 doc_link_device_role = "https://docs.aws.amazon.com/greengrass/v2/developerguide/device-service-role.html"
 cli_version = version.__version__
 latest_cli_version_file = "https://raw.githubusercontent.com/aws-greengrass/aws-greengrass-gdk-cli/main/gdk/_version.py"
+LATEST_CLI_VERSION_CACHE_KEY = "latest_version"
+# Key of the time of the last check for a new version of the cli, whether or not it succeeded.
+CLI_VERSION_CHECK_CACHE_KEY = "last_check"
+CLI_VERSION_REQUEST_TIMEOUT_SECONDS = 5
 s3_prefix = "s3://"
+HASH_CHUNK_SIZE = 1024 * 1024
@@ -3,8 +3,10 @@ import pytest
 from unittest import TestCase
 from gdk.common.config.GDKProject import GDKProject
 from gdk.common.GithubUtils import GithubUtils
+import gdk.common.configuration as configuration
 
 import gdk.common.exceptions.error_messages as error_messages
+import json
 import os
 
 import shutil
@@ -14,7 +16,7 @@ class GDKProjectTest(TestCase):
     @pytest.fixture(autouse=True)
     def __inject_fixtures(self, mocker, tmpdir):
         self.mocker = mocker
-        self.mocker.patch.object(GithubUtils, "get_latest_release_name", return_value="1.2.0")
+        self.mock_get_latest_release = self.mocker.patch.object(GithubUtils, "get_latest_release_name", return_value="1.2.0")
         self.tmpdir = Path(tmpdir).resolve()
         self.c_dir = Path(".").resolve()
         os.chdir(self.tmpdir)
@@ -82,6 +84,34 @@ class GDKProjectTest(TestCase):
         assert gdk_config.test_config.gtf_version == "1.0.0"
         assert gdk_config.test_config.gtf_options == {"tags": "testtags"}
 
+    def test_GIVEN_project_WHEN_read_component_config_THEN_do_not_discover_gtf_release(self):
+        shutil.copy(
+            self.c_dir.joinpath("integration_tests/test_data/config").joinpath("config.json").resolve(),
+            self.tmpdir.joinpath("gdk-config.json"),
+        )
+        self.tmpdir.joinpath("recipe.json").touch()
+
+        gdk_config = GDKProject()
+        assert gdk_config.component_name == "abc"
+        assert gdk_config.test_config.test_build_system == "maven"
+        assert not self.mock_get_latest_release.called
+
+        assert gdk_config.test_config.gtf_version == "1.2.0"
+        assert GDKProject().test_config.gtf_version == "1.2.0"
+        # The latest release is cached on disk between commands.
+        assert self.mock_get_latest_release.call_count == 1
+
+    def test_GIVEN_offline_and_no_cached_release_WHEN_read_test_config_THEN_use_default_gtf_version(self):
+        shutil.copy(
+            self.c_dir.joinpath("integration_tests/test_data/config").joinpath("config.json").resolve(),
+            self.tmpdir.joinpath("gdk-config.json"),
+        )
+        self.tmpdir.joinpath("recipe.json").touch()
+        self.mocker.patch.dict(os.environ, {"GDK_OFFLINE": "true"})
+
+        assert GDKProject().test_config.gtf_version == "1.2.0"
+        assert not self.mock_get_latest_release.called
+
     def test_GIVEN_project_WHEN_recipe_not_exists_THEN_raise_exception(self):
         # neither recipe.json nor recipe.yaml exists
         shutil.copy(
@@ -116,3 +146,66 @@ class GDKProjectTest(TestCase):
         with pytest.raises(Exception) as e:
             GDKProject()
         assert error_messages.PROJECT_RECIPE_FILE_NOT_FOUND in e.value.args[0]
+
+    def test_GIVEN_project_WHEN_read_config_twice_THEN_parse_config_and_find_recipe_once(self):
+        shutil.copy(
+            self.c_dir.joinpath("integration_tests/test_data/config").joinpath("config_without_test.json").resolve(),
+            self.tmpdir.joinpath("gdk-config.json"),
+        )
+        self.tmpdir.joinpath("recipe.yaml").touch()
+        spy_validate = self.mocker.spy(configuration, "validate_configuration")
+        spy_find_recipe_file = self.mocker.spy(GDKProject, "_find_recipe_file")
+
+        first_config = GDKProject()
+        second_config = GDKProject()
+
+        assert second_config.component_config == first_config.component_config
+        assert second_config.recipe_file == first_config.recipe_file
+        assert spy_validate.call_count == 1
+        assert spy_find_recipe_file.call_count == 1
+
+    def test_GIVEN_project_read_WHEN_recipe_replaced_THEN_find_new_recipe(self):
+        shutil.copy(
+            self.c_dir.joinpath("integration_tests/test_data/config").joinpath("config_without_test.json").resolve(),
+            self.tmpdir.joinpath("gdk-config.json"),
+        )
+        self.tmpdir.joinpath("recipe.yaml").touch()
+        assert GDKProject().recipe_file == self.tmpdir.joinpath("recipe.yaml")
+
+        self.tmpdir.joinpath("recipe.yaml").rename(self.tmpdir.joinpath("recipe.json"))
+
+        assert GDKProject().recipe_file == self.tmpdir.joinpath("recipe.json")
+
+    def test_GIVEN_project_with_multiple_components_WHEN_read_config_THEN_raise_exception(self):
+        self.write_multi_component_config()
+
+        with pytest.raises(Exception) as e:
+            GDKProject()
+        assert error_messages.MULTIPLE_COMPONENTS_NOT_SUPPORTED in e.value.args[0]
+
+    def test_GIVEN_project_with_multiple_components_WHEN_component_selected_THEN_read_selected_component(self):
+        config_file = self.write_multi_component_config()
+        self.tmpdir.joinpath("b").mkdir()
+        self.tmpdir.joinpath("b/recipe.yaml").touch()
+        os.chdir(self.tmpdir.joinpath("b"))
+
+        configuration.select_component(config_file, "b")
+        try:
+            gdk_config = GDKProject()
+        finally:
+            configuration.select_component(None, None)
+
+        assert gdk_config.component_name == "b"
+        assert gdk_config.component_config["path"] == "b"
+        assert gdk_config.gg_build_dir == self.tmpdir.joinpath("b/greengrass-build")
+        assert gdk_config.recipe_file == self.tmpdir.joinpath("b/recipe.yaml")
+
+    def write_multi_component_config(self):
+        config = json.loads(
+            self.c_dir.joinpath("integration_tests/test_data/config").joinpath("config_without_test.json").read_text()
+        )
+        component = config["component"].pop("abc")
+        config["component"] = {"a": dict(component, path="a"), "b": dict(component, path="b")}
+        config_file = self.tmpdir.joinpath("gdk-config.json")
+        config_file.write_text(json.dumps(config))
+        return config_file
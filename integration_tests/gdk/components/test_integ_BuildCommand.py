@@ -1,3 +1,5 @@
+import base64
+import hashlib
 from unittest import TestCase
 import pytest
 import logging
@@ -5,8 +7,11 @@ from pathlib import Path
 import os
 import shutil
 from gdk.commands.component.BuildCommand import BuildCommand
+from gdk.commands.component import component
 import json
 import platform
+import yaml
+import zipfile
 from gdk.common.CaseInsensitive import CaseInsensitiveRecipeFile
 import boto3
 from botocore.stub import Stubber
@@ -51,6 +56,90 @@ class ComponentBuildCommandIntegTest(TestCase):
         with open(build_recipe_file, "r") as f:
             assert f"s3://BUCKET_NAME/COMPONENT_NAME/COMPONENT_VERSION/{self.tmpdir.name}.zip" in f.read()
 
+    def test_GIVEN_zip_build_system_WHEN_build_THEN_set_artifact_digest_in_recipe(self):
+        self.zip_test_data()
+        BuildCommand({}).run()
+        artifact_file = self.tmpdir.joinpath(f"greengrass-build/artifacts/abc/NEXT_PATCH/{self.tmpdir.name}.zip")
+        build_recipe_file = self.tmpdir.joinpath("greengrass-build/recipes/recipe.yaml")
+
+        artifact = CaseInsensitiveRecipeFile().read(build_recipe_file)["Manifests"][0]["Artifacts"][0]
+        assert artifact["Algorithm"] == "SHA-256"
+        assert artifact["Digest"] == base64.b64encode(hashlib.sha256(artifact_file.read_bytes()).digest()).decode("ascii")
+        assert self.tmpdir.joinpath("greengrass-build/artifact-digests.json").exists()
+
+    def test_GIVEN_previous_build_WHEN_build_THEN_replace_outputs_and_keep_other_content(self):
+        self.zip_test_data()
+        gg_build_dir = self.tmpdir.joinpath("greengrass-build")
+        gg_build_dir.joinpath("gg-e2e-tests/target").mkdir(parents=True)
+        gg_build_dir.joinpath("gg-e2e-tests/target/tests.jar").touch()
+        gg_build_dir.joinpath("greengrass-nucleus-latest.zip").touch()
+        gg_build_dir.joinpath("artifacts/abc/NEXT_PATCH").mkdir(parents=True)
+        gg_build_dir.joinpath("artifacts/abc/NEXT_PATCH/removed.py").touch()
+        gg_build_dir.joinpath("artifacts/abc/1.0.0").mkdir(parents=True)
+        gg_build_dir.joinpath("artifacts/abc/1.0.0/old.zip").touch()
+
+        BuildCommand({"no_cache": True}).run()
+
+        assert gg_build_dir.joinpath(f"artifacts/abc/NEXT_PATCH/{self.tmpdir.name}.zip").exists()
+        assert gg_build_dir.joinpath("recipes/recipe.yaml").exists()
+        assert not gg_build_dir.joinpath("artifacts/abc/NEXT_PATCH/removed.py").exists()
+        assert not gg_build_dir.joinpath("artifacts/abc/1.0.0").exists()
+        assert gg_build_dir.joinpath("gg-e2e-tests/target/tests.jar").exists()
+        assert gg_build_dir.joinpath("greengrass-nucleus-latest.zip").exists()
+
+        BuildCommand({"clean": True}).run()
+
+        assert gg_build_dir.joinpath(f"artifacts/abc/NEXT_PATCH/{self.tmpdir.name}.zip").exists()
+        assert not gg_build_dir.joinpath("gg-e2e-tests").exists()
+        assert not gg_build_dir.joinpath("greengrass-nucleus-latest.zip").exists()
+
+    def test_GIVEN_zip_build_system_WHEN_build_in_stream_mode_or_with_jobs_THEN_archive_matches_copy_mode(self):
+        self.zip_test_data()
+        self.tmpdir.joinpath("src", "nested").mkdir()
+        self.tmpdir.joinpath("src", "nested", "module.py").write_text("print('hello')")
+        self.tmpdir.joinpath("src", "main.py").write_text("import nested")
+        self.tmpdir.joinpath(".env").touch()
+
+        copy_mode_entries = self.build_zip_with_options({"excludes": ["**/node_modules", "**/test*"], "zip_mode": "copy"})
+        stream_mode_entries = self.build_zip_with_options({"excludes": ["**/node_modules", "**/test*"], "zip_mode": "stream"})
+        parallel_copy_mode_entries = self.build_zip_with_options(
+            {"excludes": ["**/node_modules", "**/test*"], "zip_mode": "copy", "zip_jobs": 4}
+        )
+        parallel_stream_mode_entries = self.build_zip_with_options(
+            {"excludes": ["**/node_modules", "**/test*"], "zip_mode": "stream", "zip_jobs": 4}
+        )
+
+        assert stream_mode_entries == copy_mode_entries
+        assert parallel_copy_mode_entries == copy_mode_entries
+        assert parallel_stream_mode_entries == copy_mode_entries
+        stream_mode_names = [entry[0] for entry in stream_mode_entries]
+        assert "src/nested/module.py" in stream_mode_names
+        assert ".env" in stream_mode_names
+        assert "src/test_subdir.txt" not in stream_mode_names
+        assert not self.tmpdir.joinpath(f"zip-build/{self.tmpdir.name}").exists()
+
+    def test_GIVEN_zip_build_system_WHEN_build_again_without_changes_THEN_build_is_skipped(self):
+        self.caplog.set_level(logging.INFO)
+        self.zip_test_data()
+        BuildCommand({}).run()
+        artifact = self.tmpdir.joinpath(f"greengrass-build/artifacts/abc/NEXT_PATCH/{self.tmpdir.name}.zip")
+        artifact_mtime = artifact.stat().st_mtime_ns
+
+        BuildCommand({}).run()
+        assert "is up to date with its last build. Skipping the build." in self.caplog.text
+        assert artifact.stat().st_mtime_ns == artifact_mtime
+
+        self.caplog.clear()
+        self.tmpdir.joinpath("hello_world.py").write_text("print('changed')")
+        BuildCommand({}).run()
+        assert "Skipping the build." not in self.caplog.text
+        with zipfile.ZipFile(artifact) as zfile:
+            assert zfile.read("hello_world.py") == b"print('changed')"
+
+        self.caplog.clear()
+        BuildCommand({"no_cache": True}).run()
+        assert "Skipping the build." not in self.caplog.text
+
     def test_GIVEN_zip_build_system_WHEN_excludes_provided_with_old_patterns_THEN_warn_in_logs(self):
         self.caplog.set_level(logging.WARNING)
         self.zip_old_excludes_test_data()
@@ -100,6 +189,24 @@ class ComponentBuildCommandIntegTest(TestCase):
         assert self.tmpdir.joinpath("greengrass-build/artifacts/abc/NEXT_PATCH/" + self.tmpdir.name + ".zip").exists()
         assert not build_recipe_file.exists()
 
+    def test_GIVEN_previous_build_WHEN_build_fails_THEN_remove_previous_outputs(self):
+        self.zip_test_data()
+        gg_build_dir = self.tmpdir.joinpath("greengrass-build")
+        gg_build_dir.joinpath("artifacts/abc/NEXT_PATCH").mkdir(parents=True)
+        gg_build_dir.joinpath("artifacts/abc/NEXT_PATCH/previous.py").touch()
+        gg_build_dir.joinpath("recipes").mkdir(parents=True)
+        gg_build_dir.joinpath("recipes/recipe.yaml").touch()
+        gg_build_dir.joinpath("build-manifest.json").touch()
+        self.mocker.patch("gdk.build_system.Zip.Zip.build", side_effect=Exception("zip failed"))
+
+        with pytest.raises(Exception) as e:
+            BuildCommand({}).run()
+
+        assert "zip failed" in e.value.args[0]
+        assert not gg_build_dir.joinpath("artifacts/abc/NEXT_PATCH/previous.py").exists()
+        assert not gg_build_dir.joinpath("recipes/recipe.yaml").exists()
+        assert not gg_build_dir.joinpath("build-manifest.json").exists()
+
     def test_GIVEN_maven_build_system_WHEN_build_with_artifacts_on_s3_THEN_build_succeeds(self):
         # Prepare test data
         self.maven_test_data()
@@ -114,7 +221,7 @@ class ComponentBuildCommandIntegTest(TestCase):
 
         # Prepare s3 stub
         client = boto3.client("s3", region_name="us-east-1")
-        self.mocker.patch("boto3.client", return_value=client)
+        self.mocker.patch("boto3.Session.client", return_value=client)
         s3_client_stub = Stubber(client)
         s3_client_stub.add_response(
             "head_object",
@@ -198,6 +305,65 @@ class ComponentBuildCommandIntegTest(TestCase):
         build_recipe_file = self.tmpdir.joinpath("greengrass-build/recipes/recipe.yaml").resolve()
         assert not build_recipe_file.exists()
 
+    def test_GIVEN_project_with_multiple_components_WHEN_build_THEN_build_each_component_in_its_directory(self):
+        self.multi_component_test_data(["com.example.A", "com.example.B"])
+        self.caplog.set_level(logging.INFO)
+
+        component.build({"jobs": 2})
+
+        for name, path in [("com.example.A", "a"), ("com.example.B", "b")]:
+            component_dir = self.tmpdir.joinpath(path)
+            assert component_dir.joinpath(f"greengrass-build/artifacts/{name}/1.0.0/{path}.zip").exists()
+            assert component_dir.joinpath("greengrass-build/recipes/recipe.yaml").exists()
+            log_file = self.tmpdir.joinpath(f"greengrass-build/logs/build/{name}.log")
+            assert f"Building the component '{name}'" in log_file.read_text()
+        assert "Built 2 of 2 components" in self.caplog.text
+
+    def test_GIVEN_project_with_multiple_components_WHEN_build_of_one_fails_THEN_build_others_and_raise_exception(self):
+        self.multi_component_test_data(["com.example.A", "com.example.B"])
+        self.caplog.set_level(logging.INFO)
+        self.tmpdir.joinpath("b", "recipe.yaml").unlink()
+
+        with pytest.raises(Exception) as e:
+            component.build({})
+
+        assert "Failed to build the components ['com.example.B']" in e.value.args[0]
+        assert self.tmpdir.joinpath("a/greengrass-build/artifacts/com.example.A/1.0.0/a.zip").exists()
+        assert "Built 1 of 2 components" in self.caplog.text
+        log_file = self.tmpdir.joinpath("greengrass-build/logs/build/com.example.B.log")
+        assert "No valid component recipe is found" in log_file.read_text()
+
+    def test_GIVEN_components_with_dependencies_WHEN_build_THEN_build_dependencies_first(self):
+        self.multi_component_test_data(["com.example.A", "com.example.B", "com.example.C"])
+        self.caplog.set_level(logging.INFO)
+        for path, dependency in [("b", "com.example.A"), ("c", "com.example.B")]:
+            recipe_file = self.tmpdir.joinpath(path, "recipe.yaml")
+            recipe = yaml.safe_load(recipe_file.read_text())
+            recipe["ComponentDependencies"] = {dependency: {"VersionRequirement": "^1.0.0"}}
+            recipe_file.write_text(yaml.dump(recipe))
+
+        component.build({"jobs": 3})
+
+        for name, path in [("com.example.A", "a"), ("com.example.B", "b"), ("com.example.C", "c")]:
+            assert self.tmpdir.joinpath(path, f"greengrass-build/artifacts/{name}/1.0.0/{path}.zip").exists()
+        assert "Built 3 of 3 components" in self.caplog.text
+        assert "Critical path" in self.caplog.text
+        assert "com.example.A -> com.example.B -> com.example.C" in self.caplog.text
+
+    def test_GIVEN_components_with_dependency_cycle_WHEN_build_THEN_raise_exception_before_build(self):
+        self.multi_component_test_data(["com.example.A", "com.example.B"])
+        for path, dependency in [("a", "com.example.B"), ("b", "com.example.A")]:
+            recipe_file = self.tmpdir.joinpath(path, "recipe.yaml")
+            recipe = yaml.safe_load(recipe_file.read_text())
+            recipe["ComponentDependencies"] = {dependency: {}}
+            recipe_file.write_text(yaml.dump(recipe))
+
+        with pytest.raises(Exception) as e:
+            component.build({})
+
+        assert "cycle: com.example.A -> com.example.B -> com.example.A" in e.value.args[0]
+        assert not self.tmpdir.joinpath("greengrass-build").exists()
+
     def zip_test_data(self):
         shutil.copy(
             self.c_dir.joinpath("integration_tests/test_data/config/config.json"), self.tmpdir.joinpath("gdk-config.json")
@@ -222,6 +388,35 @@ class ComponentBuildCommandIntegTest(TestCase):
         self.tmpdir.joinpath("src", "node_modules").mkdir()
         self.tmpdir.joinpath("src", "node_modules", "excluded_file.txt").touch()
 
+    def build_zip_with_options(self, options):
+        gdk_config = self.tmpdir.joinpath("gdk-config.json")
+        with open(gdk_config, "r") as f:
+            config = json.loads(f.read())
+        config["component"]["abc"]["build"]["options"] = options
+        with open(gdk_config, "w") as f:
+            f.write(json.dumps(config))
+
+        BuildCommand({}).run()
+
+        archive = self.tmpdir.joinpath(f"greengrass-build/artifacts/abc/NEXT_PATCH/{self.tmpdir.name}.zip")
+        with zipfile.ZipFile(archive) as zfile:
+            return [(info.filename, info.file_size, info.CRC) for info in zfile.infolist()]
+
+    def multi_component_test_data(self, component_names):
+        with open(self.c_dir.joinpath("integration_tests/test_data/config/config.json"), "r") as f:
+            config = json.loads(f.read())
+        component_config = config["component"].pop("abc")
+        component_config["version"] = "1.0.0"
+        for component_name, path in zip(component_names, ["a", "b", "c"]):
+            config["component"][component_name] = dict(component_config, path=path)
+            component_dir = self.tmpdir.joinpath(path)
+            component_dir.mkdir()
+            component_dir.joinpath("hello_world.py").touch()
+            recipe = self.c_dir.joinpath("integration_tests/test_data/recipes/hello_world_recipe.yaml").read_text()
+            component_dir.joinpath("recipe.yaml").write_text(recipe.replace("$GG_ARTIFACT", f"{path}.zip"))
+        with open(self.tmpdir.joinpath("gdk-config.json"), "w") as f:
+            f.write(json.dumps(config))
+
     def zip_test_data_invalid_recipe(self):
         shutil.copy(
             self.c_dir.joinpath("integration_tests/test_data/config/config.json"), self.tmpdir.joinpath("gdk-config.json")
@@ -1,3 +1,4 @@
+import hashlib
 from pathlib import Path
 
 import boto3
@@ -38,8 +39,6 @@ class ComponentPublishCommandIntegTest(TestCase):
             elif args[0] == "s3":
                 return self.s3_client
 
-        self.mocker.patch("boto3.client", _clients)
-
         self.gg_client_stub = Stubber(self.gg_client)
         self.sts_client_stub = Stubber(self.sts_client)
 
@@ -54,6 +53,7 @@ class ComponentPublishCommandIntegTest(TestCase):
         )
         boto3_ses = Mock()
         boto3_ses.get_partition_for_region.return_value = "aws"
+        boto3_ses.client = Mock(side_effect=_clients)
         self.mocker.patch("boto3.Session", return_value=boto3_ses)
 
     def test_GIVEN_no_artifacts_and_NEXT_PATCH_WHEN_publish_THEN_create_a_component_with_recipe(self):
@@ -70,7 +70,6 @@ class ComponentPublishCommandIntegTest(TestCase):
                         "arn": f"arn:aws:greengrass:us-east-1:{account_num}:components:abc",
                     },
                 ],
-                "nextToken": "string",
             },
             {"arn": f"arn:aws:greengrass:us-east-1:{account_num}:components:abc"},
         )
@@ -135,7 +134,7 @@ class ComponentPublishCommandIntegTest(TestCase):
             str(self.tmpdir.joinpath("greengrass-build/artifacts/abc/2.0.0/hello_world.py").resolve()),
             "some-bucket",
             "abc/2.0.0/hello_world.py",
-            ExtraArgs={"ACL": "ABC"},
+            ExtraArgs={"ACL": "ABC", "Metadata": {"gdk-sha256": hashlib.sha256(b"").hexdigest()}},
         )
 
     def test_GIVEN_component_does_not_exist_WHEN_publish_with_NEXT_PATCH_THEN_create_1_0_0_component(self):
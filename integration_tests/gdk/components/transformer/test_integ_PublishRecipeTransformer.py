@@ -57,7 +57,7 @@ class ComponentPublishRecipeTransformerIntegTest(TestCase):
             elif args[0] == "s3":
                 return self.s3_client
 
-        self.mocker.patch("boto3.client", _clients)
+        self.mocker.patch("boto3.Session.client", side_effect=_clients)
 
         self.gg_client_stub = Stubber(self.gg_client)
         self.sts_client_stub = Stubber(self.sts_client)
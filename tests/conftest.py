@@ -0,0 +1,11 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def gdk_cache_dir(tmp_path_factory, monkeypatch):
+    """
+    Keeps the caches written by the cli during tests out of the home directory.
+    """
+    cache_dir = tmp_path_factory.mktemp("gdk-cache")
+    monkeypatch.setenv("GDK_CACHE_DIR", str(cache_dir))
+    return cache_dir
@@ -0,0 +1,92 @@
+from unittest.mock import Mock
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+from gdk.aws_clients.ClientRegistry import ClientRegistry
+
+
+@pytest.fixture()
+def mock_boto3_client(mocker):
+    real_client = boto3.session.Session.client
+
+    def _client(session, service_name, region_name=None, endpoint_url=None):
+        return real_client(session, service_name, region_name=region_name or "us-east-1", endpoint_url=endpoint_url)
+
+    return mocker.patch("boto3.session.Session.client", side_effect=_client, autospec=True)
+
+
+def test_GIVEN_same_service_and_region_WHEN_get_client_THEN_reuse_client(mock_boto3_client):
+    clients = ClientRegistry()
+
+    s3_client = clients.client("s3", "us-east-1")
+
+    assert clients.client("s3", "us-east-1") is s3_client
+    assert clients.client("s3", "us-west-2") is not s3_client
+    assert clients.client("greengrassv2", "us-east-1") is not s3_client
+    assert mock_boto3_client.call_count == 3
+    assert clients.clients_created == 3
+
+
+def test_GIVEN_clients_WHEN_make_api_calls_THEN_count_api_calls(mock_boto3_client):
+    clients = ClientRegistry()
+    s3_client = clients.client("s3", "us-east-1")
+    stubber = Stubber(s3_client)
+    stubber.add_response("head_object", {}, {"Bucket": "bucket", "Key": "a"})
+    stubber.add_response("head_object", {}, {"Bucket": "bucket", "Key": "b"})
+    stubber.add_response("get_bucket_location", {}, {"Bucket": "bucket"})
+
+    with stubber:
+        s3_client.head_object(Bucket="bucket", Key="a")
+        s3_client.head_object(Bucket="bucket", Key="b")
+        s3_client.get_bucket_location(Bucket="bucket")
+
+    assert clients.api_calls == {"s3:HeadObject": 2, "s3:GetBucketLocation": 1}
+
+
+def test_WHEN_get_account_number_THEN_call_sts_once(mock_boto3_client):
+    clients = ClientRegistry()
+    stubber = Stubber(clients.client("sts"))
+    stubber.add_response("get_caller_identity", {"Account": "123456789012"})
+
+    with stubber:
+        assert clients.get_account_number() == "123456789012"
+        assert clients.get_account_number() == "123456789012"
+
+    stubber.assert_no_pending_responses()
+
+
+def test_GIVEN_clients_WHEN_get_partition_for_region_THEN_use_one_session(mocker, mock_boto3_client):
+    spy_session = mocker.spy(boto3, "Session")
+    clients = ClientRegistry()
+
+    clients.client("s3", "us-east-1")
+    clients.client("s3", "us-east-1", "http://localhost:9000")
+    clients.get_partition_for_region("us-east-1")
+
+    assert spy_session.call_count == 1
+    assert mock_boto3_client.call_count == 2
+    assert {c[0][0] for c in mock_boto3_client.call_args_list} == {clients._session}
+
+
+def test_WHEN_get_partition_for_region_THEN_create_session_once(mocker):
+    session = Mock()
+    session.get_partition_for_region.return_value = "aws-cn"
+    mock_session = mocker.patch("boto3.Session", return_value=session)
+    clients = ClientRegistry()
+
+    assert clients.get_partition_for_region("cn-north-1") == "aws-cn"
+    assert clients.get_partition_for_region("cn-north-1") == "aws-cn"
+    assert mock_session.call_count == 1
+
+
+def test_WHEN_log_statistics_THEN_log_clients_and_api_calls(mocker):
+    mock_log = mocker.patch("logging.debug")
+    clients = ClientRegistry()
+    clients.clients_created = 2
+    clients.api_calls.update({"s3:HeadObject": 2, "sts:GetCallerIdentity": 1})
+
+    clients.log_statistics()
+
+    assert mock_log.call_args[0][1:] == (2, 3, "s3:HeadObject x2, sts:GetCallerIdentity x1")
@@ -21,7 +21,7 @@ class Greengrassv2ClientTest(TestCase):
             "component_version": "1.0.0",
         }
         self.client = boto3.client("greengrassv2", region_name="region")
-        self.mocker.patch("boto3.client", return_value=self.client)
+        self.mocker.patch("boto3.Session.client", return_value=self.client)
         self.mock_ggv2_client = Stubber(self.client)
         self.mock_ggv2_client.activate()
 
@@ -50,6 +50,89 @@ class Greengrassv2ClientTest(TestCase):
             ggv2.get_highest_cloud_component_version(c_arn)
         assert "An error occurred (500) when calling the ListComponentVersions operation" in e.value.args[0]
 
+    def test_get_highest_component_version_from_all_pages(self):
+        ggv2 = Greengrassv2Client("region")
+        c_arn = "arn:aws:greengrass:test-region:1234:components:c_name"
+        self.mock_ggv2_client.add_response(
+            "list_component_versions",
+            {"componentVersions": versions("1.9.0", "1.10.0-beta.1"), "nextToken": "page-2"},
+            {"arn": c_arn},
+        )
+        self.mock_ggv2_client.add_response(
+            "list_component_versions",
+            {"componentVersions": versions("1.10.0", "1.2.0")},
+            {"arn": c_arn, "nextToken": "page-2"},
+        )
+
+        assert ggv2.get_highest_cloud_component_version(c_arn) == "1.10.0"
+        self.mock_ggv2_client.assert_no_pending_responses()
+
+    def test_get_highest_component_version_with_cached_versions(self):
+        c_arn = "arn:aws:greengrass:test-region:1234:components:c_name"
+        self.mock_ggv2_client.add_response(
+            "list_component_versions",
+            {"componentVersions": versions("2.0.0", "1.0.1"), "nextToken": "page-2"},
+            {"arn": c_arn},
+        )
+        self.mock_ggv2_client.add_response(
+            "list_component_versions", {"componentVersions": versions("1.5.0")}, {"arn": c_arn, "nextToken": "page-2"}
+        )
+        assert Greengrassv2Client("region").get_highest_cloud_component_version(c_arn) == "2.0.0"
+
+        # Only the first page is listed when the newest and the highest cached versions are on it.
+        self.mock_ggv2_client.add_response(
+            "list_component_versions",
+            {"componentVersions": versions("2.0.1", "2.0.0", "1.0.1"), "nextToken": "page-2"},
+            {"arn": c_arn},
+        )
+        assert Greengrassv2Client("region").get_highest_cloud_component_version(c_arn) == "2.0.1"
+        self.mock_ggv2_client.assert_no_pending_responses()
+
+    def test_get_highest_component_version_with_deleted_cached_highest_version(self):
+        c_arn = "arn:aws:greengrass:test-region:1234:components:c_name"
+        ggv2 = Greengrassv2Client("region")
+        ggv2._version_cache.set(c_arn, {"highest_version": "2.0.0", "newest_version": "1.0.1"})
+
+        # The cached highest version is not listed with the newest cached version, so every version is listed again.
+        self.mock_ggv2_client.add_response(
+            "list_component_versions",
+            {"componentVersions": versions("1.0.2", "1.0.1"), "nextToken": "page-2"},
+            {"arn": c_arn},
+        )
+        self.mock_ggv2_client.add_response(
+            "list_component_versions", {"componentVersions": versions("1.5.0")}, {"arn": c_arn, "nextToken": "page-2"}
+        )
+
+        assert ggv2.get_highest_cloud_component_version(c_arn) == "1.5.0"
+        self.mock_ggv2_client.assert_no_pending_responses()
+
+    def test_get_highest_component_version_with_stale_cached_versions(self):
+        c_arn = "arn:aws:greengrass:test-region:1234:components:c_name"
+        self.mock_ggv2_client.add_response(
+            "list_component_versions", {"componentVersions": versions("3.0.0")}, {"arn": c_arn}
+        )
+        assert Greengrassv2Client("region").get_highest_cloud_component_version(c_arn) == "3.0.0"
+
+        # The newest cached version was deleted, so every version is listed again.
+        self.mock_ggv2_client.add_response(
+            "list_component_versions", {"componentVersions": versions("1.0.0"), "nextToken": "page-2"}, {"arn": c_arn}
+        )
+        self.mock_ggv2_client.add_response(
+            "list_component_versions", {"componentVersions": versions("1.5.0")}, {"arn": c_arn, "nextToken": "page-2"}
+        )
+        assert Greengrassv2Client("region").get_highest_cloud_component_version(c_arn) == "1.5.0"
+        self.mock_ggv2_client.assert_no_pending_responses()
+
+    def test_get_highest_component_version_with_invalid_cached_versions(self):
+        c_arn = "arn:aws:greengrass:test-region:1234:components:c_name"
+        ggv2 = Greengrassv2Client("region")
+        ggv2._version_cache.set(c_arn, {"highest_version": "not-a-version", "newest_version": "1.0.0"})
+        self.mock_ggv2_client.add_response(
+            "list_component_versions", {"componentVersions": versions("1.0.0", "1.0.2")}, {"arn": c_arn}
+        )
+
+        assert ggv2.get_highest_cloud_component_version(c_arn) == "1.0.2"
+
     def test_create_gg_component(self):
         ggv2 = Greengrassv2Client("region")
         response = {
@@ -76,3 +159,7 @@ class Greengrassv2ClientTest(TestCase):
             assert "An error occurred (400) when calling the CreateComponentVersion operation" in e.value.args[0]
 
         self.mock_ggv2_client.assert_no_pending_responses()
+
+
+def versions(*component_versions):
+    return [{"componentVersion": version} for version in component_versions]
@@ -13,11 +13,11 @@ class S3ClientTest(TestCase):
     def __inject_fixtures(self, mocker):
         self.mocker = mocker
         self.mock_project_config = {}
-        self.mock_s3_client = self.mocker.patch("boto3.client", return_value=boto3.client("s3"))
+        self.mock_s3_client = self.mocker.patch("boto3.Session.client", return_value=boto3.client("s3"))
         self.service_clients = {"s3_client": self.mock_s3_client}
 
         self.client = boto3.client("s3", region_name="region")
-        self.mocker.patch("boto3.client", return_value=self.client)
+        self.mocker.patch("boto3.Session.client", return_value=self.client)
         self.s3_client_stub = Stubber(self.client)
         self.s3_client_stub.activate()
 
@@ -154,3 +154,37 @@ class S3ClientTest(TestCase):
         s3_client_utils = S3Client(region)
 
         assert not s3_client_utils.s3_artifact_exists(s3_uri)
+
+    def test_GIVEN_artifact_with_checksum_WHEN_get_checksum_THEN_return_checksum(self):
+        self.s3_client_stub.add_response(
+            "head_object",
+            {"Metadata": {"gdk-sha256": "abc"}},
+            {"Bucket": "bucket", "Key": "component/1.0.0/artifact.zip"},
+        )
+
+        assert S3Client("region").get_artifact_checksum("bucket", "component/1.0.0/artifact.zip") == "abc"
+
+    def test_GIVEN_artifact_not_exists_WHEN_get_checksum_THEN_return_none(self):
+        self.s3_client_stub.add_client_error("head_object", service_error_code="404", http_status_code=404)
+
+        assert S3Client("region").get_artifact_checksum("bucket", "component/1.0.0/artifact.zip") is None
+
+    def test_WHEN_copy_artifact_THEN_copy_with_replaced_metadata(self):
+        mock_copy = self.mocker.patch.object(self.client, "copy")
+
+        S3Client("region").copy_artifact("bucket", "c/1.0.0/a.zip", "c/1.0.1/a.zip", {"Metadata": {"gdk-sha256": "abc"}})
+
+        assert mock_copy.call_args == call(
+            {"Bucket": "bucket", "Key": "c/1.0.0/a.zip"},
+            "bucket",
+            "c/1.0.1/a.zip",
+            ExtraArgs={"Metadata": {"gdk-sha256": "abc"}, "MetadataDirective": "REPLACE"},
+        )
+
+    def test_GIVEN_copy_fails_WHEN_copy_artifact_THEN_raise_exception(self):
+        self.mocker.patch.object(self.client, "copy", side_effect=Exception("copy failed"))
+
+        with pytest.raises(Exception) as e:
+            S3Client("region").copy_artifact("bucket", "c/1.0.0/a.zip", "c/1.0.1/a.zip", {})
+
+        assert "copy failed" in e.value.args[0]
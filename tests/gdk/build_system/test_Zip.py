@@ -1,6 +1,7 @@
 import pytest
 from pathlib import Path
 from unittest import TestCase
+from unittest.mock import ANY
 
 from gdk.build_system.Zip import Zip
 from gdk.commands.component.config.ComponentBuildConfiguration import ComponentBuildConfiguration
@@ -49,11 +50,123 @@ class ZipTests(TestCase):
             "**/node_modules",
         ] == zip.get_ignored_file_patterns(config)
 
-    def test_generate_ignore_list_from_globs(self):
+    def test_generate_ignore_function_from_globs(self):
         zip = Zip()
-        self.mocker.patch("glob.glob", side_effect=[set(['a']), set(['b', '1']), set(['c'])])
-        ignore_set = zip.generate_ignore_list_from_globs("/path/to/root", ["glob", "glob2", "glob3"])
-        assert ignore_set == {'a', 'b', '1', 'c'}
+        self.mocker.patch("os.path.isdir", return_value=False)
+        root = Path("/path/to/root")
+        ignore = zip.generate_ignore_function_from_globs(root, ["gdk-config.json", "**/test*", "src/*.txt"])
+
+        assert ignore(str(root), ["gdk-config.json", "tests", "main.py"]) == {"gdk-config.json", "tests"}
+        assert ignore(str(root.joinpath("src")), ["gdk-config.json", "test_main.py", "notes.txt"]) == {
+            "test_main.py",
+            "notes.txt",
+        }
+        assert ignore(str(root.joinpath("src", "nested")), ["notes.txt", "test_nested.py"]) == {"test_nested.py"}
+
+    def test_generate_ignore_function_from_globs_does_not_list_directories(self):
+        zip = Zip()
+        mock_glob = self.mocker.patch("glob.glob")
+        mock_walk = self.mocker.patch("os.walk")
+        ignore = zip.generate_ignore_function_from_globs(Path("/path/to/root"), ["**/node_modules", "**/.*"])
+
+        assert ignore("/path/to/root", ["node_modules", ".git", "src"]) == {"node_modules", ".git"}
+        assert not mock_glob.called
+        assert not mock_walk.called
+
+    def test_zip_mode_defaults_to_copy(self):
+        build_config = ComponentBuildConfiguration({})
+        assert Zip().get_zip_mode(build_config) == "copy"
+
+    def test_zip_mode_stream(self):
+        con = config()
+        con["component"]["com.example.PythonLocalPubSub"]["build"] = {"build_system": "zip", "options": {"zip_mode": "stream"}}
+        self.mocker.patch("gdk.common.configuration.get_configuration", return_value=con)
+        build_config = ComponentBuildConfiguration({})
+        assert Zip().get_zip_mode(build_config) == "stream"
+
+    def test_zip_ignore_list_keeps_default_excludes_for_each_zip_mode(self):
+        for zip_mode in ["copy", "stream"]:
+            con = config()
+            con["component"]["com.example.PythonLocalPubSub"]["build"] = {
+                "build_system": "zip",
+                "options": {"zip_mode": zip_mode},
+            }
+            self.mocker.patch("gdk.common.configuration.get_configuration", return_value=con)
+            assert [
+                "gdk-config.json",
+                "greengrass-build",
+                "recipe.json",
+                "**/test*",
+                "**/.*",
+                "**/node_modules",
+            ] == Zip().get_ignored_file_patterns(ComponentBuildConfiguration({}))
+
+    def test_zip_ignore_list_without_default_excludes_when_other_options_are_set(self):
+        for options in [{"zip_name": "x"}, {"zip_name": "x", "zip_mode": "stream", "zip_jobs": 2}]:
+            con = config()
+            con["component"]["com.example.PythonLocalPubSub"]["build"] = {"build_system": "zip", "options": options}
+            self.mocker.patch("gdk.common.configuration.get_configuration", return_value=con)
+            assert ["gdk-config.json", "greengrass-build", "recipe.json"] == Zip().get_ignored_file_patterns(
+                ComponentBuildConfiguration({})
+            )
+
+    def test_build_in_stream_mode_does_not_copy(self):
+        con = config()
+        con["component"]["com.example.PythonLocalPubSub"]["build"] = {"build_system": "zip", "options": {"zip_mode": "stream"}}
+        self.mocker.patch("gdk.common.configuration.get_configuration", return_value=con)
+        mock_clean_dir = self.mocker.patch("gdk.common.utils.clean_dir", return_value=None)
+        mock_copytree = self.mocker.patch("shutil.copytree")
+        mock_make_archive = self.mocker.patch("shutil.make_archive")
+        mock_stream_archive = self.mocker.patch.object(Zip, "stream_archive")
+        Zip().build(project_config=ComponentBuildConfiguration({}))
+
+        zip_build_path = Path(".").resolve().joinpath("zip-build")
+        mock_clean_dir.assert_called_once_with(zip_build_path)
+        assert not mock_copytree.called
+        assert not mock_make_archive.called
+        mock_stream_archive.assert_called_once_with(Path(".").resolve(), zip_build_path, Path(".").resolve().name, ANY, 1)
+
+    def test_zip_jobs_defaults_to_one(self):
+        build_config = ComponentBuildConfiguration({})
+        assert Zip().get_zip_jobs(build_config) == 1
+
+    def test_zip_jobs_from_build_options(self):
+        con = config()
+        con["component"]["com.example.PythonLocalPubSub"]["build"] = {"build_system": "zip", "options": {"zip_jobs": 8}}
+        self.mocker.patch("gdk.common.configuration.get_configuration", return_value=con)
+        build_config = ComponentBuildConfiguration({})
+        assert Zip().get_zip_jobs(build_config) == 8
+
+    def test_zip_ignore_list_keeps_default_excludes_with_zip_jobs(self):
+        con = config()
+        con["component"]["com.example.PythonLocalPubSub"]["build"] = {"build_system": "zip", "options": {"zip_jobs": 4}}
+        self.mocker.patch("gdk.common.configuration.get_configuration", return_value=con)
+        assert [
+            "gdk-config.json",
+            "greengrass-build",
+            "recipe.json",
+            "**/test*",
+            "**/.*",
+            "**/node_modules",
+        ] == Zip().get_ignored_file_patterns(ComponentBuildConfiguration({}))
+
+    def test_build_in_copy_mode_with_jobs_uses_parallel_writer(self):
+        con = config()
+        con["component"]["com.example.PythonLocalPubSub"]["build"] = {"build_system": "zip", "options": {"zip_jobs": 4}}
+        self.mocker.patch("gdk.common.configuration.get_configuration", return_value=con)
+        self.mocker.patch("gdk.common.utils.clean_dir", return_value=None)
+        mock_copytree = self.mocker.patch("shutil.copytree")
+        mock_make_archive = self.mocker.patch("shutil.make_archive")
+        mock_write_archive = self.mocker.patch.object(Zip, "write_archive")
+        Zip().build(project_config=ComponentBuildConfiguration({}))
+
+        zip_build_path = Path(".").resolve().joinpath("zip-build")
+        project_name = Path(".").resolve().name
+        assert mock_copytree.called
+        assert not mock_make_archive.called
+        mock_write_archive.assert_called_once_with(
+            zip_build_path.joinpath(project_name), zip_build_path.joinpath(f"{project_name}.zip"), None, 4
+        )
 
 
 def config():
@@ -29,7 +29,17 @@ def configuration_base(options: dict) -> dict:
 
 @pytest.mark.parametrize(
     "options",
-    [None, {"excludes": ["*.ts"]}, dict()],
+    [None, {"excludes": ["*.ts"]}, dict(), {"zip_mode": "stream"}, {"zip_jobs": 4}],
 )
 def test_valid_configuration_options(options):
     validate_configuration(configuration_base(options))
+
+
+def test_invalid_zip_mode_option():
+    with pytest.raises(Exception):
+        validate_configuration(configuration_base({"zip_mode": "unknown"}))
+
+
+def test_invalid_zip_jobs_option():
+    with pytest.raises(Exception):
+        validate_configuration(configuration_base({"zip_jobs": 0}))
@@ -0,0 +1,228 @@
+import json
+import os
+import tarfile
+
+import pytest
+
+from gdk.commands.component.cache.BuildCache import BuildCache
+from gdk.commands.component.cache.LocalBuildCacheBackend import LocalBuildCacheBackend
+from gdk.commands.component.config.ComponentBuildConfiguration import ComponentBuildConfiguration
+
+
+@pytest.fixture()
+def project(mocker, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    mocker.patch("gdk.common.GithubUtils.GithubUtils.get_latest_release_name", return_value="1.2.0")
+    mocker.patch("gdk.common.configuration.get_configuration", return_value=config())
+    tmp_path.joinpath("recipe.json").write_text(json.dumps({"RecipeFormatVersion": "2020-01-25"}))
+    tmp_path.joinpath("main.py").write_text("print('hello')")
+    tmp_path.joinpath("src").mkdir()
+    tmp_path.joinpath("src", "module.py").write_text("value = 1")
+    return tmp_path
+
+
+def build(project_config):
+    project_config.gg_build_recipes_dir.mkdir(parents=True, exist_ok=True)
+    project_config.gg_build_component_artifacts_dir.mkdir(parents=True, exist_ok=True)
+    project_config.gg_build_recipes_dir.joinpath("recipe.json").write_text("{}")
+    project_config.gg_build_component_artifacts_dir.joinpath("artifact.zip").write_text("zip")
+
+
+def test_GIVEN_no_previous_build_WHEN_check_cache_THEN_not_up_to_date(project):
+    assert not BuildCache(ComponentBuildConfiguration({})).is_up_to_date()
+
+
+def test_GIVEN_previous_build_with_same_inputs_WHEN_check_cache_THEN_up_to_date(project):
+    project_config = ComponentBuildConfiguration({})
+    cache = BuildCache(project_config)
+    assert not cache.is_up_to_date()
+    build(project_config)
+    cache.save()
+
+    assert BuildCache(ComponentBuildConfiguration({})).is_up_to_date()
+
+
+def test_GIVEN_project_file_changed_WHEN_check_cache_THEN_not_up_to_date(project):
+    project_config = ComponentBuildConfiguration({})
+    build(project_config)
+    BuildCache(project_config).save()
+
+    project.joinpath("src", "module.py").write_text("value = 2")
+
+    assert not BuildCache(ComponentBuildConfiguration({})).is_up_to_date()
+
+
+def test_GIVEN_project_file_added_WHEN_check_cache_THEN_not_up_to_date(project):
+    project_config = ComponentBuildConfiguration({})
+    build(project_config)
+    BuildCache(project_config).save()
+
+    project.joinpath("src", "new_module.py").write_text("value = 3")
+
+    assert not BuildCache(ComponentBuildConfiguration({})).is_up_to_date()
+
+
+def test_GIVEN_component_config_changed_WHEN_check_cache_THEN_not_up_to_date(mocker, project):
+    project_config = ComponentBuildConfiguration({})
+    build(project_config)
+    BuildCache(project_config).save()
+
+    changed_config = config()
+    changed_config["component"]["com.example.PythonLocalPubSub"]["build"]["options"] = {"zip_name": ""}
+    mocker.patch("gdk.common.configuration.get_configuration", return_value=changed_config)
+
+    assert not BuildCache(ComponentBuildConfiguration({})).is_up_to_date()
+
+
+def test_GIVEN_build_output_removed_WHEN_check_cache_THEN_not_up_to_date(project):
+    project_config = ComponentBuildConfiguration({})
+    build(project_config)
+    BuildCache(project_config).save()
+
+    project_config.gg_build_component_artifacts_dir.joinpath("artifact.zip").unlink()
+
+    assert not BuildCache(ComponentBuildConfiguration({})).is_up_to_date()
+
+
+def test_GIVEN_excluded_dirs_changed_WHEN_check_cache_THEN_up_to_date(project):
+    project_config = ComponentBuildConfiguration({})
+    build(project_config)
+    BuildCache(project_config, output_dirs=[project.joinpath("zip-build")]).save()
+
+    project.joinpath("zip-build").mkdir()
+    project.joinpath("zip-build", "output.zip").write_text("output")
+    project.joinpath(".git").mkdir()
+    project.joinpath(".git", "HEAD").write_text("ref")
+
+    assert BuildCache(ComponentBuildConfiguration({}), output_dirs=[project.joinpath("zip-build")]).is_up_to_date()
+
+
+def test_GIVEN_source_dir_named_like_output_dir_changed_WHEN_check_cache_THEN_not_up_to_date(project):
+    source_dir = project.joinpath("src", "main", "java", "com", "acme", "build")
+    source_dir.mkdir(parents=True)
+    source_dir.joinpath("A.java").write_text("class A {}")
+    project_config = ComponentBuildConfiguration({})
+    build(project_config)
+    BuildCache(project_config, output_dirs=[project.joinpath("build")]).save()
+
+    project.joinpath("build").mkdir()
+    project.joinpath("build", "output.jar").write_text("output")
+    assert BuildCache(ComponentBuildConfiguration({}), output_dirs=[project.joinpath("build")]).is_up_to_date()
+
+    source_dir.joinpath("A.java").write_text("class A { int value; }")
+    assert not BuildCache(ComponentBuildConfiguration({}), output_dirs=[project.joinpath("build")]).is_up_to_date()
+
+
+def test_GIVEN_unchanged_file_WHEN_check_cache_THEN_file_is_not_hashed_again(mocker, project):
+    project_config = ComponentBuildConfiguration({})
+    build(project_config)
+    BuildCache(project_config).save()
+
+    cache = BuildCache(ComponentBuildConfiguration({}))
+    spy_hash_file = mocker.spy(cache, "_hash_file")
+    os.utime(project.joinpath("main.py"), ns=(0, 0))
+
+    assert cache.is_up_to_date()
+    hashed_files = [call.args[0].name for call in spy_hash_file.call_args_list]
+    assert sorted(hashed_files) == ["main.py", "recipe.json"]
+
+
+def test_GIVEN_corrupt_manifest_WHEN_check_cache_THEN_not_up_to_date(project):
+    project_config = ComponentBuildConfiguration({})
+    build(project_config)
+    project_config.gg_build_dir.joinpath("build-manifest.json").write_text("not json")
+
+    assert not BuildCache(ComponentBuildConfiguration({})).is_up_to_date()
+
+
+def test_GIVEN_shared_backend_WHEN_save_THEN_store_outputs_by_inputs_hash(project, tmp_path_factory):
+    backend = LocalBuildCacheBackend(tmp_path_factory.mktemp("cache"))
+    project_config = ComponentBuildConfiguration({})
+    cache = BuildCache(project_config, backend=backend)
+    cache.is_up_to_date()
+    build(project_config)
+    cache.save()
+
+    archive = backend.directory.joinpath(f"{cache.manifest['inputs_hash']}.tar")
+    with tarfile.open(archive) as tar:
+        assert sorted(tar.getnames()) == sorted(cache.manifest["outputs"])
+
+
+def test_GIVEN_outputs_in_shared_backend_WHEN_restore_THEN_restore_outputs(project, tmp_path_factory):
+    backend = LocalBuildCacheBackend(tmp_path_factory.mktemp("cache"))
+    project_config = ComponentBuildConfiguration({})
+    cache = BuildCache(project_config, backend=backend)
+    cache.is_up_to_date()
+    build(project_config)
+    cache.save()
+    project_config.gg_build_component_artifacts_dir.joinpath("artifact.zip").unlink()
+    project_config.gg_build_component_artifacts_dir.joinpath("stale.zip").write_text("stale")
+
+    cache = BuildCache(ComponentBuildConfiguration({}), backend=backend)
+    assert not cache.is_up_to_date()
+    assert cache.restore()
+
+    assert project_config.gg_build_component_artifacts_dir.joinpath("artifact.zip").read_text() == "zip"
+    assert not project_config.gg_build_component_artifacts_dir.joinpath("stale.zip").exists()
+    assert BuildCache(ComponentBuildConfiguration({})).is_up_to_date()
+    assert backend.hits == 1
+
+
+def test_GIVEN_no_outputs_in_shared_backend_WHEN_restore_THEN_not_restored(project, tmp_path_factory):
+    backend = LocalBuildCacheBackend(tmp_path_factory.mktemp("cache"))
+    cache = BuildCache(ComponentBuildConfiguration({}), backend=backend)
+    cache.is_up_to_date()
+
+    assert not cache.restore()
+    assert backend.misses == 1
+
+
+def test_GIVEN_archive_with_unsafe_entry_WHEN_restore_THEN_not_restored(project, tmp_path_factory):
+    backend = LocalBuildCacheBackend(tmp_path_factory.mktemp("cache"))
+    cache = BuildCache(ComponentBuildConfiguration({}), backend=backend)
+    cache.is_up_to_date()
+    project.joinpath("outside.txt").write_text("outside")
+    with tarfile.open(backend.directory.joinpath(f"{cache.manifest['inputs_hash']}.tar"), "w") as tar:
+        tar.add(str(project.joinpath("outside.txt")), arcname="../outside.txt")
+
+    assert not cache.restore()
+    assert not cache.manifest_file.exists()
+
+
+def test_GIVEN_shared_backend_fails_WHEN_save_THEN_manifest_is_saved(mocker, project, tmp_path_factory):
+    backend = LocalBuildCacheBackend(tmp_path_factory.mktemp("cache"))
+    mocker.patch.object(backend, "store", side_effect=OSError("disk full"))
+    project_config = ComponentBuildConfiguration({})
+    cache = BuildCache(project_config, backend=backend)
+    cache.is_up_to_date()
+    build(project_config)
+    cache.save()
+
+    assert BuildCache(ComponentBuildConfiguration({})).is_up_to_date()
+
+
+def test_GIVEN_cache_config_changed_WHEN_check_cache_THEN_up_to_date(mocker, project):
+    project_config = ComponentBuildConfiguration({})
+    cache = BuildCache(project_config)
+    cache.is_up_to_date()
+    build(project_config)
+    cache.save()
+    cache_config = config()
+    cache_config["component"]["com.example.PythonLocalPubSub"]["build"]["cache"] = {"location": "/tmp/cache"}
+    mocker.patch("gdk.common.configuration.get_configuration", return_value=cache_config)
+
+    assert BuildCache(ComponentBuildConfiguration({})).is_up_to_date()
+
+
+def config():
+    return {
+        "component": {
+            "com.example.PythonLocalPubSub": {
+                "author": "<PLACEHOLDER_AUTHOR>",
+                "version": "NEXT_PATCH",
+                "build": {"build_system": "zip"},
+                "publish": {"bucket": "<PLACEHOLDER_BUCKET>", "region": "region"},
+            }
+        },
+        "gdk_version": "1.0.0",
+    }
@@ -0,0 +1,85 @@
+import os
+import time
+
+import pytest
+
+from gdk.commands.component.cache.LocalBuildCacheBackend import LocalBuildCacheBackend
+
+
+@pytest.fixture()
+def archive(tmp_path):
+    archive = tmp_path.joinpath("outputs.tar")
+    archive.write_bytes(b"a" * 100)
+    return archive
+
+
+def test_GIVEN_stored_archive_WHEN_fetch_THEN_return_archive(tmp_path, archive):
+    backend = LocalBuildCacheBackend(tmp_path.joinpath("cache"))
+    backend.store("key", archive)
+
+    fetched = backend.fetch("key", tmp_path)
+
+    assert fetched == tmp_path.joinpath("cache", "key.tar")
+    assert fetched.read_bytes() == archive.read_bytes()
+    assert (backend.hits, backend.misses, backend.stored) == (1, 0, 1)
+    assert (backend.bytes_fetched, backend.bytes_stored) == (100, 100)
+    assert [path.name for path in tmp_path.joinpath("cache").iterdir()] == ["key.tar"]
+
+
+def test_GIVEN_no_archive_WHEN_fetch_THEN_return_none(tmp_path):
+    backend = LocalBuildCacheBackend(tmp_path.joinpath("cache"))
+
+    assert backend.fetch("key", tmp_path) is None
+    assert (backend.hits, backend.misses) == (0, 1)
+
+
+def test_GIVEN_copy_fails_WHEN_store_THEN_remove_temporary_file(mocker, tmp_path, archive):
+    backend = LocalBuildCacheBackend(tmp_path.joinpath("cache"))
+    mocker.patch("shutil.copyfileobj", side_effect=OSError("disk full"))
+
+    with pytest.raises(OSError):
+        backend.store("key", archive)
+
+    assert list(tmp_path.joinpath("cache").iterdir()) == []
+    assert backend.stored == 0
+
+
+def test_GIVEN_cache_larger_than_max_size_WHEN_evict_THEN_evict_least_recently_used(tmp_path, archive):
+    backend = LocalBuildCacheBackend(tmp_path.joinpath("cache"), max_size_bytes=250)
+    now = time.time()
+    for index, key in enumerate(["old", "used", "new"]):
+        backend.store(key, archive)
+        os.utime(tmp_path.joinpath("cache", f"{key}.tar"), (now - 100 + index, now - 100 + index))
+    backend.fetch("old", tmp_path)
+
+    backend.evict()
+
+    assert sorted(path.name for path in tmp_path.joinpath("cache").iterdir()) == ["new.tar", "old.tar"]
+    assert backend.evicted == 1
+
+
+def test_GIVEN_max_age_WHEN_evict_THEN_evict_old_archives_and_stale_temporary_files(tmp_path, archive):
+    backend = LocalBuildCacheBackend(tmp_path.joinpath("cache"), max_age_seconds=60)
+    backend.store("old", archive)
+    backend.store("new", archive)
+    stale_file = tmp_path.joinpath("cache", ".key.123.tmp")
+    stale_file.write_text("partial")
+    two_days_ago = time.time() - 2 * 24 * 60 * 60
+    os.utime(tmp_path.joinpath("cache", "old.tar"), (two_days_ago, two_days_ago))
+    os.utime(stale_file, (two_days_ago, two_days_ago))
+
+    backend.evict()
+
+    assert [path.name for path in tmp_path.joinpath("cache").iterdir()] == ["new.tar"]
+    assert backend.evicted == 1
+
+
+def test_GIVEN_statistics_WHEN_log_statistics_THEN_log_hits_and_sizes(mocker, tmp_path):
+    backend = LocalBuildCacheBackend(tmp_path)
+    backend.hits = 2
+    backend.bytes_fetched = 3 * 1024 * 1024
+    mock_log = mocker.patch("logging.info")
+
+    backend.log_statistics()
+
+    assert mock_log.call_args[0][1:] == (str(tmp_path), 2, 0, 0, 0, "3.0 MB", "0 B")
@@ -0,0 +1,102 @@
+import datetime
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+from botocore.stub import Stubber
+
+from gdk.commands.component.cache.S3BuildCacheBackend import S3BuildCacheBackend
+
+
+@pytest.fixture()
+def s3_client(mocker):
+    s3_client = boto3.client("s3", region_name="us-east-1")
+    mocker.patch("boto3.Session.client", return_value=s3_client)
+    return s3_client
+
+
+def test_GIVEN_stored_archive_WHEN_fetch_THEN_download_archive(mocker, tmp_path, s3_client):
+    def download_file(bucket, key, file_name):
+        with open(file_name, "wb") as f:
+            f.write(b"a" * 10)
+
+    mock_download = mocker.patch.object(s3_client, "download_file", side_effect=download_file)
+    backend = S3BuildCacheBackend("bucket", "builds/")
+
+    archive = backend.fetch("key", tmp_path)
+
+    assert archive == tmp_path.joinpath("key.tar")
+    mock_download.assert_called_once_with("bucket", "builds/key.tar", str(archive))
+    assert (backend.hits, backend.misses, backend.bytes_fetched) == (1, 0, 10)
+
+
+def test_GIVEN_no_archive_WHEN_fetch_THEN_return_none(mocker, tmp_path, s3_client):
+    mocker.patch.object(
+        s3_client, "download_file", side_effect=ClientError({"Error": {"Code": "404"}}, "HeadObject")
+    )
+    backend = S3BuildCacheBackend("bucket")
+
+    assert backend.fetch("key", tmp_path) is None
+    assert (backend.hits, backend.misses) == (0, 1)
+
+
+def test_GIVEN_access_denied_WHEN_fetch_THEN_raise_exception(mocker, tmp_path, s3_client):
+    mocker.patch.object(
+        s3_client, "download_file", side_effect=ClientError({"Error": {"Code": "403"}}, "HeadObject")
+    )
+    backend = S3BuildCacheBackend("bucket")
+
+    with pytest.raises(ClientError):
+        backend.fetch("key", tmp_path)
+
+
+def test_GIVEN_archive_WHEN_store_THEN_upload_archive(mocker, tmp_path, s3_client):
+    mock_upload = mocker.patch.object(s3_client, "upload_file")
+    archive = tmp_path.joinpath("outputs.tar")
+    archive.write_bytes(b"a" * 10)
+    backend = S3BuildCacheBackend("bucket", "/builds")
+
+    backend.store("key", archive)
+
+    mock_upload.assert_called_once_with(str(archive), "bucket", "builds/key.tar")
+    assert (backend.stored, backend.bytes_stored) == (1, 10)
+    assert backend.location == "s3://bucket/builds/"
+
+
+def test_GIVEN_max_size_WHEN_evict_THEN_delete_least_recently_stored_objects(s3_client):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    stubber = Stubber(s3_client)
+    stubber.add_response(
+        "list_objects_v2",
+        {
+            "Contents": [
+                {"Key": "builds/old.tar", "Size": 100, "LastModified": now - datetime.timedelta(hours=2)},
+                {"Key": "builds/new.tar", "Size": 100, "LastModified": now - datetime.timedelta(hours=1)},
+                {"Key": "builds/other.txt", "Size": 100, "LastModified": now - datetime.timedelta(hours=3)},
+            ],
+            "IsTruncated": False,
+        },
+        {"Bucket": "bucket", "Prefix": "builds/"},
+    )
+    stubber.add_response(
+        "delete_objects",
+        {},
+        {"Bucket": "bucket", "Delete": {"Objects": [{"Key": "builds/old.tar"}], "Quiet": True}},
+    )
+    backend = S3BuildCacheBackend("bucket", "builds", max_size_bytes=150)
+
+    with stubber:
+        backend.evict()
+
+    stubber.assert_no_pending_responses()
+    assert backend.evicted == 1
+
+
+def test_GIVEN_no_limits_WHEN_evict_THEN_do_not_list_objects(s3_client):
+    stubber = Stubber(s3_client)
+    backend = S3BuildCacheBackend("bucket")
+
+    with stubber:
+        backend.evict()
+
+    assert backend.evicted == 0
@@ -0,0 +1,45 @@
+import pytest
+
+from gdk.aws_clients.ClientRegistry import ClientRegistry
+from gdk.commands.component.cache.LocalBuildCacheBackend import LocalBuildCacheBackend
+from gdk.commands.component.cache.S3BuildCacheBackend import S3BuildCacheBackend
+from gdk.commands.component.cache.SharedBuildCache import SharedBuildCache
+
+
+def test_GIVEN_directory_location_WHEN_get_backend_THEN_return_local_backend(tmp_path):
+    backend = SharedBuildCache.get({"location": str(tmp_path), "max_size_mb": 1, "max_age_days": 0.5})
+
+    assert isinstance(backend, LocalBuildCacheBackend)
+    assert backend.directory == tmp_path.resolve()
+    assert backend.max_size_bytes == 1024 * 1024
+    assert backend.max_age_seconds == 12 * 60 * 60
+
+
+def test_GIVEN_s3_location_WHEN_get_backend_THEN_return_s3_backend(mocker):
+    mock_client = mocker.patch("boto3.Session.client")
+
+    backend = SharedBuildCache.get(
+        {"location": "s3://bucket/prefix/builds", "region": "us-west-2", "endpoint_url": "http://localhost:9000"}
+    )
+
+    assert isinstance(backend, S3BuildCacheBackend)
+    assert (backend.bucket, backend.prefix) == ("bucket", "prefix/builds/")
+    assert backend.max_size_bytes is None and backend.max_age_seconds is None
+    mock_client.assert_called_once_with("s3", region_name="us-west-2", endpoint_url="http://localhost:9000")
+
+
+def test_GIVEN_no_location_WHEN_get_backend_THEN_raise_exception():
+    with pytest.raises(Exception) as e:
+        SharedBuildCache.get({"max_size_mb": 1})
+
+    assert "Build cache location is not specified" in str(e.value)
+
+
+def test_GIVEN_s3_location_and_clients_WHEN_get_backend_THEN_use_client_of_registry(mocker):
+    clients = ClientRegistry()
+    mock_client = mocker.patch.object(clients, "client")
+
+    backend = SharedBuildCache.get({"location": "s3://bucket", "region": "us-west-2"}, clients)
+
+    assert backend.s3_client is mock_client.return_value
+    mock_client.assert_called_once_with("s3", "us-west-2", None)
@@ -12,8 +12,9 @@ from gdk.common.config.GDKProject import GDKProject
 
 class ComponentPublishConfigurationTest(TestCase):
     @pytest.fixture(autouse=True)
-    def __inject_fixtures(self, mocker):
+    def __inject_fixtures(self, mocker, tmp_path):
         self.mocker = mocker
+        self.tmpdir = tmp_path
         self.mock_get_proj_config = self.mocker.patch(
             "gdk.common.configuration.get_configuration",
             return_value=config(),
@@ -29,7 +30,7 @@ class ComponentPublishConfigurationTest(TestCase):
             elif args[0] == "sts":
                 return self.sts_client
 
-        self.client = self.mocker.patch("boto3.client", side_effect=_clients)
+        self.client = Mock(side_effect=_clients)
         self.gg_client_stub = Stubber(self.gg_client)
         self.sts_client_stub = Stubber(self.sts_client)
         self.gg_client_stub.activate()
@@ -37,6 +38,7 @@ class ComponentPublishConfigurationTest(TestCase):
         self.sts_client_stub.add_response("get_caller_identity", {"Account": "123456789012"})
         boto3_ses = Mock()
         boto3_ses.get_partition_for_region.return_value = "aws"
+        boto3_ses.client = self.client
         self.mocker.patch("boto3.Session", return_value=boto3_ses)
 
     def test_GIVEN_config_with_no_arguments_WHEN_read_publish_config_THEN_read_from_config(self):
@@ -62,6 +64,7 @@ class ComponentPublishConfigurationTest(TestCase):
         pconfig = ComponentPublishConfiguration({})
         assert pconfig.publisher == "author"
         assert pconfig.component_version == "1.0.0"
+        assert pconfig.latest_component_version is None
         assert pconfig.bucket == "default-us-east-1-123456789012"
 
     def test_GIVEN_NEXT_PATCH_for_version_with_previous_versions_WHEN_get_version_THEN_calculate_next_version(self):
@@ -77,8 +80,32 @@ class ComponentPublishConfigurationTest(TestCase):
         pconfig = ComponentPublishConfiguration({})
         assert pconfig.publisher == "author"
         assert pconfig.component_version == "1.0.5"
+        assert pconfig.latest_component_version == "1.0.4"
         assert pconfig.bucket == "default-us-east-1-123456789012"
 
+    def test_GIVEN_no_artifact_layout_WHEN_get_artifact_s3_key_THEN_use_versioned_key(self):
+        self.gg_client_stub.add_response("list_component_versions", {"componentVersions": []})
+        pconfig = ComponentPublishConfiguration({})
+        assert pconfig.artifact_layout == "versioned"
+        assert pconfig.get_artifact_s3_key(Path("artifact.zip")) == "com.example.HelloWorld/1.0.0/artifact.zip"
+
+    def test_GIVEN_content_addressed_layout_WHEN_get_artifact_s3_key_THEN_use_checksum_key(self):
+        self.gg_client_stub.add_response("list_component_versions", {"componentVersions": []})
+        self.tmpdir.joinpath("artifact.zip").write_text("content")
+        mock_sha256 = self.mocker.patch("gdk.common.utils.get_file_sha256", return_value="abc")
+        pconfig = ComponentPublishConfiguration({"options": '{"artifact_layout": "content-addressed"}'})
+
+        artifact_key = pconfig.get_artifact_s3_key(self.tmpdir.joinpath("artifact.zip"))
+
+        assert artifact_key == "com.example.HelloWorld/sha256/abc/artifact.zip"
+        assert pconfig.get_artifact_checksum(self.tmpdir.joinpath("artifact.zip")) == "abc"
+        assert mock_sha256.call_count == 1
+
+    def test_GIVEN_invalid_artifact_layout_WHEN_get_config_THEN_raise_exception(self):
+        with pytest.raises(ValueError) as e:
+            ComponentPublishConfiguration({"options": '{"artifact_layout": "flat"}'})
+        assert "Invalid artifact layout 'flat'" in e.value.args[0]
+
     def test_GIVEN_config_with_bucket_args_WHEN_get_bucket_THEN_get_bucket_from_args(self):
         self.gg_client_stub.add_response(
             "list_component_versions",
@@ -1,21 +1,26 @@
 from pathlib import Path
 from shutil import Error
 from unittest import TestCase
-from unittest.mock import patch, ANY
+from unittest.mock import patch, ANY, call
 
 import pytest
 
+import gdk.common.consts as consts
 import gdk.common.utils as utils
+from gdk.aws_clients.ClientRegistry import ClientRegistry
 from gdk.build_system.ComponentBuildSystem import ComponentBuildSystem
 from gdk.commands.component.BuildCommand import BuildCommand
+from gdk.commands.component.cache.BuildCache import BuildCache
+from gdk.commands.component.cache.LocalBuildCacheBackend import LocalBuildCacheBackend
 from gdk.commands.component.transformer.BuildRecipeTransformer import BuildRecipeTransformer
 from gdk.common.config.GDKProject import GDKProject
 
 
 class BuildCommandTest(TestCase):
     @pytest.fixture(autouse=True)
-    def __inject_fixtures(self, mocker):
+    def __inject_fixtures(self, mocker, tmp_path):
         self.mocker = mocker
+        self.tmp_path = tmp_path
         self.mock_get_proj_config = self.mocker.patch(
             "gdk.common.configuration.get_configuration",
             return_value=config(),
@@ -34,6 +39,12 @@ class BuildCommandTest(TestCase):
         assert mock_default_build_component.assert_called_once
         assert not mock_subprocess_run.called
 
+    def test_build_command_shares_clients_with_transformer(self):
+        clients = ClientRegistry()
+        build = BuildCommand({}, clients)
+        assert build.clients is clients
+        assert build.build_recipe_transformer.clients is clients
+
     def test_build_run_custom(self):
         mock_create_gg_build_directories = self.mocker.patch.object(BuildCommand, "create_gg_build_directories")
         mock_default_build_component = self.mocker.patch.object(BuildCommand, "default_build_component")
@@ -54,6 +65,74 @@ class BuildCommandTest(TestCase):
         assert not mock_default_build_component.called
         assert mock_subprocess_run.called
 
+    def test_build_run_skips_build_when_up_to_date(self):
+        mock_create_gg_build_directories = self.mocker.patch.object(BuildCommand, "create_gg_build_directories")
+        mock_default_build_component = self.mocker.patch.object(BuildCommand, "default_build_component")
+        mock_is_up_to_date = self.mocker.patch.object(BuildCache, "is_up_to_date", return_value=True)
+        mock_save = self.mocker.patch.object(BuildCache, "save")
+
+        BuildCommand({}).run()
+
+        assert mock_is_up_to_date.called
+        assert not mock_create_gg_build_directories.called
+        assert not mock_default_build_component.called
+        assert not mock_save.called
+
+    def test_build_run_saves_cache_after_build(self):
+        mock_create_gg_build_directories = self.mocker.patch.object(BuildCommand, "create_gg_build_directories")
+        mock_default_build_component = self.mocker.patch.object(BuildCommand, "default_build_component")
+        self.mocker.patch.object(BuildCache, "is_up_to_date", return_value=False)
+        mock_save = self.mocker.patch.object(BuildCache, "save")
+
+        BuildCommand({}).run()
+
+        assert mock_create_gg_build_directories.called
+        assert mock_default_build_component.called
+        assert mock_save.called
+
+    def test_build_run_no_cache(self):
+        mock_default_build_component = self.mocker.patch.object(BuildCommand, "default_build_component")
+        self.mocker.patch.object(BuildCommand, "create_gg_build_directories")
+        mock_is_up_to_date = self.mocker.patch.object(BuildCache, "is_up_to_date", return_value=True)
+        mock_save = self.mocker.patch.object(BuildCache, "save")
+
+        BuildCommand({"no_cache": True}).run()
+
+        assert not mock_is_up_to_date.called
+        assert not mock_save.called
+        assert mock_default_build_component.called
+
+    def test_build_run_restores_outputs_from_shared_cache(self):
+        build_config = config()
+        build_config["component"]["com.example.PythonLocalPubSub"]["build"]["cache"] = {"location": "cache-dir"}
+        self.mocker.patch("gdk.common.configuration.get_configuration", return_value=build_config)
+        mock_default_build_component = self.mocker.patch.object(BuildCommand, "default_build_component")
+        self.mocker.patch.object(BuildCache, "is_up_to_date", return_value=False)
+        mock_restore = self.mocker.patch.object(BuildCache, "restore", return_value=True)
+        mock_save = self.mocker.patch.object(BuildCache, "save")
+        mock_log_statistics = self.mocker.patch.object(LocalBuildCacheBackend, "log_statistics")
+
+        BuildCommand({}).run()
+
+        assert mock_restore.called
+        assert not mock_default_build_component.called
+        assert not mock_save.called
+        assert mock_log_statistics.called
+
+    def test_build_run_shared_cache_location_from_env(self):
+        self.mocker.patch.dict("os.environ", {"GDK_BUILD_CACHE": "s3://bucket/builds"})
+        mock_s3_client = self.mocker.patch("boto3.Session.client")
+        self.mocker.patch.object(BuildCommand, "create_gg_build_directories")
+        self.mocker.patch.object(BuildCommand, "default_build_component")
+        self.mocker.patch.object(BuildCache, "is_up_to_date", return_value=False)
+        self.mocker.patch.object(BuildCache, "restore", return_value=False)
+        mock_save = self.mocker.patch.object(BuildCache, "save")
+
+        BuildCommand({}).run()
+
+        assert mock_s3_client.called
+        assert mock_save.called
+
     def test_default_build_component(self):
         mock_run_build_command = self.mocker.patch.object(BuildCommand, "run_build_command")
         mock_transform = self.mocker.patch.object(BuildRecipeTransformer, "transform")
@@ -71,6 +150,7 @@ class BuildCommandTest(TestCase):
         mock_transform = self.mocker.patch.object(BuildRecipeTransformer, "transform", side_effect=Error("generating"))
 
         mock_build_info = self.mocker.patch.object(BuildCommand, "_get_build_folder_by_build_system", return_value=None)
+        mock_remove_outputs = self.mocker.patch.object(BuildCommand, "remove_outputs")
         build = BuildCommand({})
         with pytest.raises(Exception) as e:
             build.default_build_component()
@@ -79,6 +159,33 @@ class BuildCommandTest(TestCase):
         assert mock_run_build_command.assert_called_once
         assert mock_transform.assert_called_once
         assert mock_build_info.assert_called_once
+        assert mock_remove_outputs.call_count == 1
+
+    def test_default_build_component_error_removes_previous_outputs(self):
+        self.mocker.patch.object(BuildCommand, "run_build_command", side_effect=Exception("build failed"))
+        build = BuildCommand({})
+        gg_build_dir = self.tmp_path.joinpath("greengrass-build")
+        build.project_config.gg_build_dir = gg_build_dir
+        build.project_config.gg_build_recipes_dir = gg_build_dir.joinpath("recipes")
+        build.project_config.gg_build_artifacts_dir = gg_build_dir.joinpath("artifacts")
+        build.project_config.gg_build_component_artifacts_dir = gg_build_dir.joinpath("artifacts/com.example/1.0.0")
+        files = [
+            "recipes/recipe.yaml",
+            "artifacts/com.example/1.0.0/hello_world.py",
+            consts.BUILD_MANIFEST_FILE,
+            "greengrass-nucleus-latest.zip",
+        ]
+        for file in files:
+            gg_build_dir.joinpath(file).parent.mkdir(parents=True, exist_ok=True)
+            gg_build_dir.joinpath(file).touch()
+
+        with pytest.raises(Exception) as e:
+            build.default_build_component()
+
+        assert "build failed" in e.value.args[0]
+        remaining = sorted(path.relative_to(gg_build_dir).as_posix() for path in gg_build_dir.rglob("*") if path.is_file())
+        assert remaining == ["greengrass-nucleus-latest.zip"]
+        assert not any(build.project_config.gg_build_component_artifacts_dir.iterdir())
 
     def test_create_gg_build_directories(self):
         mock_mkdir = self.mocker.patch("pathlib.Path.mkdir")
@@ -87,11 +194,87 @@ class BuildCommandTest(TestCase):
         build.create_gg_build_directories()
 
         assert mock_mkdir.call_count == 2
-        assert mock_clean.call_count == 1
+        assert not mock_clean.called
         mock_mkdir.assert_any_call(build.project_config.gg_build_recipes_dir, parents=True, exist_ok=True)
         mock_mkdir.assert_any_call(build.project_config.gg_build_component_artifacts_dir, parents=True, exist_ok=True)
+
+    def test_build_run_clean(self):
+        self.mocker.patch.object(BuildCommand, "create_gg_build_directories")
+        self.mocker.patch.object(BuildCommand, "default_build_component")
+        mock_clean = self.mocker.patch("gdk.common.utils.clean_dir")
+
+        build = BuildCommand({"clean": True, "no_cache": True})
+        build.run()
+
         mock_clean.assert_called_once_with(build.project_config.gg_build_dir)
 
+    def test_build_run_custom_removes_previous_outputs(self):
+        self.mocker.patch.object(BuildCommand, "create_gg_build_directories")
+        self.mocker.patch("subprocess.run")
+        mock_clean = self.mocker.patch("gdk.common.utils.clean_dir")
+        build_config = config()
+        build_config["component"]["com.example.PythonLocalPubSub"]["build"] = {
+            "build_system": "custom",
+            "custom_build_command": ["a"],
+        }
+        self.mocker.patch("gdk.common.configuration.get_configuration", return_value=build_config)
+
+        build = BuildCommand({})
+        build.run()
+
+        assert mock_clean.call_args_list == [
+            call(build.project_config.gg_build_recipes_dir),
+            call(build.project_config.gg_build_artifacts_dir),
+        ]
+
+    def test_remove_stale_outputs(self):
+        build = BuildCommand({})
+        gg_build_dir = self.tmp_path.joinpath("greengrass-build")
+        build.project_config.gg_build_dir = gg_build_dir
+        build.project_config.gg_build_recipes_dir = gg_build_dir.joinpath("recipes")
+        build.project_config.gg_build_artifacts_dir = gg_build_dir.joinpath("artifacts")
+        build.project_config.gg_build_component_artifacts_dir = gg_build_dir.joinpath("artifacts/com.example/1.0.1")
+        files = [
+            "recipes/recipe.yaml",
+            "recipes/recipe.json",
+            "artifacts/com.example/1.0.0/old.zip",
+            "artifacts/com.example/1.0.1/hello_world.py",
+            "artifacts/com.example/1.0.1/removed.py",
+            "greengrass-nucleus-latest.zip",
+            "gg-e2e-tests/target/tests.jar",
+        ]
+        for file in files:
+            gg_build_dir.joinpath(file).parent.mkdir(parents=True, exist_ok=True)
+            gg_build_dir.joinpath(file).touch()
+        build.build_recipe_transformer.build_outputs = {
+            gg_build_dir.joinpath("recipes/recipe.yaml"),
+            gg_build_dir.joinpath("artifacts/com.example/1.0.1/hello_world.py"),
+        }
+
+        build.remove_stale_outputs()
+
+        remaining = sorted(path.relative_to(gg_build_dir).as_posix() for path in gg_build_dir.rglob("*") if path.is_file())
+        assert remaining == [
+            "artifacts/com.example/1.0.1/hello_world.py",
+            "gg-e2e-tests/target/tests.jar",
+            "greengrass-nucleus-latest.zip",
+            "recipes/recipe.yaml",
+        ]
+        assert not gg_build_dir.joinpath("artifacts/com.example/1.0.0").exists()
+
+    def test_remove_stale_outputs_keeps_empty_component_artifacts_dir(self):
+        build = BuildCommand({})
+        gg_build_dir = self.tmp_path.joinpath("greengrass-build")
+        build.project_config.gg_build_recipes_dir = gg_build_dir.joinpath("recipes")
+        build.project_config.gg_build_artifacts_dir = gg_build_dir.joinpath("artifacts")
+        build.project_config.gg_build_component_artifacts_dir = gg_build_dir.joinpath("artifacts/com.example/1.0.0")
+        build.project_config.gg_build_component_artifacts_dir.mkdir(parents=True)
+        build.project_config.gg_build_recipes_dir.mkdir(parents=True)
+
+        build.remove_stale_outputs()
+
+        assert build.project_config.gg_build_component_artifacts_dir.is_dir()
+
     def test_run_build_command_with_error_not_zip(self):
         mock_subprocess_run = self.mocker.patch("subprocess.run", return_value=None, side_effect=Error("some error"))
 
@@ -195,9 +378,12 @@ class BuildCommandTest(TestCase):
         dummy_paths = {Path("/").joinpath("path1"), Path("/").joinpath(*["path1", "path2"])}
         mock_get_build_folders = self.mocker.patch.object(BuildCommand, "get_build_folders", return_value=dummy_paths)
 
+        mock_find_build_files = self.mocker.patch.object(BuildCommand, "find_build_files")
+
         build = BuildCommand({})
         build.component_build_system = ComponentBuildSystem.get("maven")
         maven_build_paths = build._get_build_folder_by_build_system()
+        mock_find_build_files.assert_called_once_with(build.component_build_system.build_system_identifier)
         assert maven_build_paths == dummy_paths
         mock_get_build_folders.assert_any_call(["target"], "pom.xml")
 
@@ -205,19 +391,38 @@ class BuildCommandTest(TestCase):
         dummy_paths = {Path("/").joinpath("path1"), Path("/").joinpath(*["path1", "path2"])}
         mock_get_build_folders = self.mocker.patch.object(BuildCommand, "get_build_folders", return_value=dummy_paths)
 
+        mock_find_build_files = self.mocker.patch.object(BuildCommand, "find_build_files")
+
         build = BuildCommand({})
         build.component_build_system = ComponentBuildSystem.get("gradle")
         gradle_build_paths = build._get_build_folder_by_build_system()
+        mock_find_build_files.assert_called_once_with(build.component_build_system.build_system_identifier)
         assert gradle_build_paths == dummy_paths
         mock_get_build_folders.assert_any_call(["build", "libs"], "build.gradle")
         mock_get_build_folders.assert_any_call(["build", "libs"], "build.gradle.kts")
 
+    def test_get_build_output_dirs_of_modules(self):
+        build_config = config()
+        build_config["component"]["com.example.PythonLocalPubSub"]["build"] = {"build_system": "gradle"}
+        self.mocker.patch("gdk.common.configuration.get_configuration", return_value=build_config)
+        build_files = {
+            "build.gradle": [self.tmp_path.joinpath("build.gradle"), self.tmp_path.joinpath("app", "build.gradle")],
+            "build.gradle.kts": [self.tmp_path.joinpath("lib", "build.gradle.kts")],
+        }
+        self.mocker.patch("gdk.common.utils.find_files", side_effect=lambda root, names, excluded_dirs: build_files)
+
+        # The build folders are excluded from the build cache even before the first build creates them.
+        assert BuildCommand({})._get_build_output_dirs() == {
+            self.tmp_path.joinpath("build").resolve(),
+            self.tmp_path.joinpath("app", "build").resolve(),
+            self.tmp_path.joinpath("lib", "build").resolve(),
+        }
+
     def test_get_build_folders_maven(self):
         dummy_build_file_paths = [Path("/").joinpath("path1"), Path("/").joinpath(*["path1", "path2"])]
 
-        def get_files(*args, **kwargs):
-            if args[0] == "pom.xml":
-                return dummy_build_file_paths
+        def get_files(root, names, excluded_dirs):
+            return {name: dummy_build_file_paths if name == "pom.xml" else [] for name in names}
 
         def mock_exists(self):
             return str(self) == str(Path("/").joinpath(*["path1", "target"]).resolve())
@@ -230,17 +435,16 @@ class BuildCommandTest(TestCase):
         )
         build = BuildCommand({})
         with patch.object(Path, "exists", mock_exists):
-            mock_rglob = self.mocker.patch("pathlib.Path.rglob", side_effect=get_files)
+            mock_find_files = self.mocker.patch("gdk.common.utils.find_files", side_effect=get_files)
             maven_b_paths = build.get_build_folders(["target"], "pom.xml")
-            mock_rglob.assert_any_call("pom.xml")
+            mock_find_files.assert_called_once_with(utils.get_current_directory(), ["pom.xml"], ANY)
             assert maven_b_paths == {Path("/").joinpath(*["path1", "target"]).resolve()}
 
     def test_get_build_folders_gradle(self):
         dummy_build_file_paths = [Path("/").joinpath("path1"), Path("/").joinpath(*["path1", "path2"])]
 
-        def get_files(*args, **kwargs):
-            if args[0] == "build.gradle":
-                return dummy_build_file_paths
+        def get_files(root, names, excluded_dirs):
+            return {name: dummy_build_file_paths if name == "build.gradle" else [] for name in names}
 
         def mock_exists(self):
             return str(self) == str(Path("/").joinpath(*["build", "libs"]).resolve()) or str(self) == str(
@@ -255,14 +459,28 @@ class BuildCommandTest(TestCase):
         )
         build = BuildCommand({})
         with patch.object(Path, "exists", mock_exists):
-            mock_rglob = self.mocker.patch("pathlib.Path.rglob", side_effect=get_files)
+            mock_find_files = self.mocker.patch("gdk.common.utils.find_files", side_effect=get_files)
             gradle_b_paths = build.get_build_folders(["build", "libs"], "build.gradle")
-            mock_rglob.assert_any_call("build.gradle")
+            mock_find_files.assert_called_once_with(utils.get_current_directory(), ["build.gradle"], ANY)
             assert gradle_b_paths == {
                 Path("/").joinpath(*["build", "libs"]).resolve(),
                 Path("/").joinpath(*["path1", "build", "libs"]).resolve(),
             }
 
+    def test_find_build_files_walks_project_once(self):
+        mock_find_files = self.mocker.patch(
+            "gdk.common.utils.find_files",
+            return_value={"build.gradle": [Path("/a/build.gradle")], "build.gradle.kts": [Path("/b/build.gradle.kts")]},
+        )
+        build = BuildCommand({})
+
+        build.find_build_files(["build.gradle", "build.gradle.kts"])
+        assert build.find_build_files(["build.gradle.kts"]) == {"build.gradle.kts": [Path("/b/build.gradle.kts")]}
+
+        mock_find_files.assert_called_once_with(
+            utils.get_current_directory(), ["build.gradle", "build.gradle.kts"], consts.MODULE_SEARCH_EXCLUDED_DIRS
+        )
+
 
 def config():
     return {
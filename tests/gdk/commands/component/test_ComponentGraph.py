@@ -0,0 +1,111 @@
+import json
+
+import pytest
+
+from gdk.commands.component.ComponentGraph import ComponentGraph, _satisfies
+
+
+@pytest.fixture()
+def project(tmp_path):
+    def create(recipes, versions=None):
+        components = {}
+        component_dirs = {}
+        for component_name, dependencies in recipes.items():
+            component_dir = tmp_path.joinpath(component_name)
+            component_dir.mkdir()
+            if dependencies is not None:
+                recipe = {"ComponentName": component_name, "componentDependencies": dependencies}
+                component_dir.joinpath("recipe.json").write_text(json.dumps(recipe))
+            components[component_name] = {"version": (versions or {}).get(component_name, "NEXT_PATCH")}
+            component_dirs[component_name] = component_dir
+        return components, component_dirs
+
+    return create
+
+
+def test_GIVEN_recipes_WHEN_create_graph_THEN_read_local_dependencies_in_order(project):
+    components, component_dirs = project(
+        {"d": {"b": {}, "c": {}}, "c": {"a": {}}, "b": {"aws.greengrass.Nucleus": {"VersionRequirement": ">=2.0.0"}}, "a": {}}
+    )
+
+    graph = ComponentGraph(components, component_dirs)
+
+    assert graph.dependencies == {"a": [], "b": [], "c": ["a"], "d": ["b", "c"]}
+    assert graph.order == ["a", "b", "c", "d"]
+    assert [graph.get_priority(name) for name in graph.order] == [3, 2, 2, 1]
+
+
+def test_GIVEN_missing_recipe_WHEN_create_graph_THEN_component_has_no_dependencies(project):
+    components, component_dirs = project({"a": None, "b": {"a": {}}})
+
+    graph = ComponentGraph(components, component_dirs)
+
+    assert graph.dependencies == {"a": [], "b": ["a"]}
+
+
+def test_GIVEN_dependency_cycle_WHEN_create_graph_THEN_raise_exception(project):
+    components, component_dirs = project({"a": {}, "b": {"d": {}}, "c": {"b": {}}, "d": {"c": {}, "a": {}}})
+
+    with pytest.raises(Exception) as e:
+        ComponentGraph(components, component_dirs)
+
+    assert "Components of the project depend on each other in a cycle: b -> d -> c -> b." in e.value.args[0]
+
+
+def test_GIVEN_component_depends_on_itself_WHEN_create_graph_THEN_raise_exception(project):
+    components, component_dirs = project({"a": {"a": {}}})
+
+    with pytest.raises(Exception) as e:
+        ComponentGraph(components, component_dirs)
+
+    assert "cycle: a -> a." in e.value.args[0]
+
+
+def test_GIVEN_local_dependency_version_not_in_project_WHEN_create_graph_THEN_raise_exception(project):
+    components, component_dirs = project(
+        {"a": {}, "b": {"a": {"VersionRequirement": "^2.0.0"}}}, versions={"a": "1.4.0"}
+    )
+
+    with pytest.raises(Exception) as e:
+        ComponentGraph(components, component_dirs)
+
+    assert "Component 'b' depends on the version '^2.0.0' of the component 'a' in the project" in e.value.args[0]
+    assert "project has its version '1.4.0'" in e.value.args[0]
+
+
+def test_GIVEN_local_dependency_version_not_known_WHEN_create_graph_THEN_do_not_check_version(project):
+    components, component_dirs = project({"a": {}, "b": {"a": {"VersionRequirement": "^2.0.0"}}})
+
+    assert ComponentGraph(components, component_dirs).dependencies["b"] == ["a"]
+
+
+def test_GIVEN_durations_WHEN_get_critical_path_THEN_return_slowest_chain(project):
+    components, component_dirs = project({"a": {}, "b": {}, "c": {"a": {}, "b": {}}, "d": {}})
+    graph = ComponentGraph(components, component_dirs)
+
+    assert graph.get_critical_path({"a": 1.0, "b": 3.0, "c": 2.0, "d": 4.0}) == (["b", "c"], 5.0)
+    assert graph.get_critical_path({"a": 1.0, "b": 3.0, "c": 2.0, "d": 6.0}) == (["d"], 6.0)
+
+
+@pytest.mark.parametrize(
+    "version, requirement, satisfied",
+    [
+        ("1.2.3", "1.2.3", True),
+        ("1.2.3", "=1.2.4", False),
+        ("1.2.3", ">=1.0.0 <2.0.0", True),
+        ("2.0.0", ">=1.0.0 <2.0.0", False),
+        ("1.9.0", "^1.2.0", True),
+        ("2.0.0", "^1.2.0", False),
+        ("0.3.1", "^0.3.0", True),
+        ("0.4.0", "^0.3.0", False),
+        ("0.0.4", "^0.0.3", False),
+        ("1.2.9", "~1.2.3", True),
+        ("1.3.0", "~1.2.3", False),
+        ("3.0.0", "^1.0.0 || ^3.0.0", True),
+        ("1.0.0", ">1.0.0", False),
+        ("1.0.0", "1.x", True),
+        ("1.0.0", "*", True),
+    ],
+)
+def test_GIVEN_version_requirement_WHEN_check_version_THEN_match_npm_style_requirements(version, requirement, satisfied):
+    assert _satisfies(version, requirement) == satisfied
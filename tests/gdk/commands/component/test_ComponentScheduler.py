@@ -0,0 +1,230 @@
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import TestCase
+
+import pytest
+
+import gdk.common.configuration as configuration
+from gdk.commands.component import ComponentScheduler as scheduler_module
+from gdk.commands.component.BuildCommand import BuildCommand
+from gdk.commands.component.ComponentScheduler import ComponentScheduler
+
+
+class ComponentSchedulerTest(TestCase):
+    @pytest.fixture(autouse=True)
+    def __inject_fixtures(self, mocker, tmp_path, monkeypatch):
+        self.mocker = mocker
+        self.tmp_path = tmp_path.resolve()
+        monkeypatch.chdir(self.tmp_path)
+        self.mock_executor = self.mocker.patch.object(
+            scheduler_module,
+            "ProcessPoolExecutor",
+            side_effect=lambda max_workers, mp_context: ThreadPoolExecutor(max_workers),
+        )
+        yield
+        configuration.select_component(None, None)
+
+    def test_GIVEN_single_component_in_project_dir_WHEN_is_required_THEN_return_false(self):
+        assert not ComponentScheduler.is_required(config({"abc": {}}))
+        assert not ComponentScheduler.is_required(config({"abc": {"path": "."}}))
+
+    def test_GIVEN_multiple_components_or_component_in_subdir_WHEN_is_required_THEN_return_true(self):
+        assert ComponentScheduler.is_required(config({"a": {"path": "a"}, "b": {"path": "b"}}))
+        assert ComponentScheduler.is_required(config({"a": {"path": "a"}}))
+
+    def test_GIVEN_component_dir_not_exists_WHEN_create_scheduler_THEN_raise_exception(self):
+        self.component_dirs("a")
+        with pytest.raises(Exception) as e:
+            ComponentScheduler("build", {}, config({"a": {"path": "a"}, "b": {"path": "b"}}))
+        assert "Directory '{}' of the component 'b' does not exist".format(self.tmp_path.joinpath("b")) in e.value.args[0]
+
+    def test_GIVEN_components_in_same_dir_WHEN_create_scheduler_THEN_raise_exception(self):
+        self.component_dirs("a")
+        with pytest.raises(Exception) as e:
+            ComponentScheduler("build", {}, config({"a": {"path": "a"}, "b": {"path": "./a"}}))
+        assert "Components 'a' and 'b' are in the same directory" in e.value.args[0]
+
+    def test_GIVEN_multiple_components_and_one_in_project_dir_WHEN_create_scheduler_THEN_raise_exception(self):
+        self.component_dirs("a")
+        with pytest.raises(Exception) as e:
+            ComponentScheduler("build", {}, config({"a": {"path": "a"}, "b": {}}))
+        assert "Component 'b' is in the project directory." in e.value.args[0]
+
+    def test_GIVEN_jobs_WHEN_create_scheduler_THEN_limit_jobs_to_components(self):
+        self.component_dirs("a", "b")
+        components = config({"a": {"path": "a"}, "b": {"path": "b"}})
+        self.mocker.patch("os.cpu_count", return_value=8)
+
+        assert ComponentScheduler("build", {"jobs": 1}, components).jobs == 1
+        assert ComponentScheduler("build", {"jobs": 4}, components).jobs == 2
+        assert ComponentScheduler("build", {}, components).jobs == 2
+
+    def test_GIVEN_components_WHEN_run_THEN_build_each_component_and_log_summary(self):
+        self.component_dirs("a", "b")
+        mock_run_command = self.mocker.patch.object(
+            scheduler_module, "run_component_command", side_effect=lambda *args: result(args[2], True)
+        )
+        spy_log_info = self.mocker.spy(logging, "info")
+
+        scheduler = ComponentScheduler("build", {"jobs": 2}, config({"a": {"path": "a"}, "b": {"path": "b"}}))
+        scheduler.run()
+
+        assert self.tmp_path.joinpath("greengrass-build/logs/build").is_dir()
+        assert sorted(call.args[2:5] for call in mock_run_command.call_args_list) == [
+            ("a", self.tmp_path.joinpath("a"), {"jobs": 2}),
+            ("b", self.tmp_path.joinpath("b"), {"jobs": 2}),
+        ]
+        mock_run_command.assert_any_call(
+            "build",
+            self.tmp_path.joinpath("gdk-config.json"),
+            "a",
+            self.tmp_path.joinpath("a"),
+            {"jobs": 2},
+            self.tmp_path.joinpath("greengrass-build/logs/build/a.log"),
+            logging.getLogger().getEffectiveLevel(),
+        )
+        spy_log_info.assert_any_call("%s %d of %d components in %.2f seconds.", "Built", 2, 2, self.mocker.ANY)
+
+    def test_GIVEN_components_WHEN_run_THEN_spawn_worker_processes(self):
+        self.component_dirs("a", "b")
+        self.mocker.patch.object(scheduler_module, "run_component_command", side_effect=lambda *args: result(args[2], True))
+
+        ComponentScheduler("build", {"jobs": 2}, config({"a": {"path": "a"}, "b": {"path": "b"}})).run()
+
+        assert self.mock_executor.call_args[1]["max_workers"] == 2
+        assert self.mock_executor.call_args[1]["mp_context"].get_start_method() == "spawn"
+
+    def test_GIVEN_failed_component_WHEN_run_THEN_raise_exception_after_all_builds(self):
+        self.component_dirs("a", "b", "c")
+        self.mocker.patch.object(
+            scheduler_module, "run_component_command", side_effect=lambda *args: result(args[2], args[2] != "b")
+        )
+
+        scheduler = ComponentScheduler("build", {}, config({"a": {"path": "a"}, "b": {"path": "b"}, "c": {"path": "c"}}))
+        with pytest.raises(Exception) as e:
+            scheduler.run()
+
+        assert "Failed to build the components ['b']" in e.value.args[0]
+
+    def test_GIVEN_component_dependencies_WHEN_run_THEN_start_component_after_its_dependencies(self):
+        self.component_dirs("a", "b", "c")
+        write_recipe(self.tmp_path.joinpath("c"), {"a": {"VersionRequirement": "^1.0.0"}, "aws.greengrass.Nucleus": {}})
+        events = []
+
+        def run_command(*args):
+            events.append(("start", args[2]))
+            events.append(("end", args[2]))
+            return result(args[2], True)
+
+        self.mocker.patch.object(scheduler_module, "run_component_command", side_effect=run_command)
+        spy_log_info = self.mocker.spy(logging, "info")
+
+        components = config({"a": {"path": "a"}, "b": {"path": "b"}, "c": {"path": "c"}})
+        scheduler = ComponentScheduler("build", {"jobs": 3}, components)
+        scheduler.run()
+
+        assert events.index(("end", "a")) < events.index(("start", "c"))
+        assert len(events) == 6
+        spy_log_info.assert_any_call("Critical path (%.2f seconds): %s", self.mocker.ANY, "a -> c")
+
+    def test_GIVEN_dependency_fails_WHEN_run_THEN_skip_dependents_and_run_other_components(self):
+        self.component_dirs("a", "b", "c", "d")
+        write_recipe(self.tmp_path.joinpath("c"), {"a": {}})
+        write_recipe(self.tmp_path.joinpath("d"), {"c": {}})
+        mock_run_command = self.mocker.patch.object(
+            scheduler_module, "run_component_command", side_effect=lambda *args: result(args[2], args[2] != "a")
+        )
+
+        scheduler = ComponentScheduler(
+            "build", {}, config({"a": {"path": "a"}, "b": {"path": "b"}, "c": {"path": "c"}, "d": {"path": "d"}})
+        )
+        with pytest.raises(Exception) as e:
+            scheduler.run()
+
+        assert "Failed to build the components ['a', 'c', 'd']" in e.value.args[0]
+        assert sorted(call.args[2] for call in mock_run_command.call_args_list) == ["a", "b"]
+
+    def test_GIVEN_dependency_cycle_WHEN_create_scheduler_THEN_raise_exception_before_running(self):
+        self.component_dirs("a", "b")
+        write_recipe(self.tmp_path.joinpath("a"), {"b": {}})
+        write_recipe(self.tmp_path.joinpath("b"), {"a": {}})
+        mock_run_command = self.mocker.patch.object(scheduler_module, "run_component_command")
+
+        with pytest.raises(Exception) as e:
+            ComponentScheduler("build", {}, config({"a": {"path": "a"}, "b": {"path": "b"}})).run()
+
+        assert "depend on each other in a cycle: a -> b -> a" in e.value.args[0]
+        assert not mock_run_command.called
+        assert not self.tmp_path.joinpath("greengrass-build").exists()
+
+    def test_GIVEN_publish_WHEN_run_THEN_publish_each_component_with_its_log(self):
+        self.component_dirs("a", "b")
+        mock_run_command = self.mocker.patch.object(
+            scheduler_module, "run_component_command", side_effect=lambda *args: result(args[2], True)
+        )
+
+        ComponentScheduler("publish", {}, config({"a": {"path": "a"}, "b": {"path": "b"}})).run()
+
+        assert {call.args[0] for call in mock_run_command.call_args_list} == {"publish"}
+        assert {call.args[5] for call in mock_run_command.call_args_list} == {
+            self.tmp_path.joinpath("greengrass-build/logs/publish/a.log"),
+            self.tmp_path.joinpath("greengrass-build/logs/publish/b.log"),
+        }
+
+    def test_GIVEN_component_WHEN_build_component_THEN_build_in_component_dir_and_write_log(self):
+        self.component_dirs("a")
+        log_file = self.tmp_path.joinpath("a.log")
+        build_dirs = []
+
+        def build(command):
+            build_dirs.append(Path(os.getcwd()))
+            logging.warning("Building the component %s.", configuration.get_selected_component())
+
+        self.mocker.patch.object(BuildCommand, "__init__", return_value=None)
+        self.mocker.patch.object(BuildCommand, "run", autospec=True, side_effect=build)
+
+        build_result = scheduler_module.run_component_command(
+            "build",
+            self.tmp_path.joinpath("gdk-config.json"), "a", self.tmp_path.joinpath("a"), {}, log_file, logging.INFO
+        )
+
+        assert build_result["component"] == "a"
+        assert build_result["succeeded"]
+        assert build_dirs == [self.tmp_path.joinpath("a")]
+        assert "WARNING - Building the component a." in log_file.read_text()
+
+    def test_GIVEN_build_fails_WHEN_build_component_THEN_return_error_and_write_log(self):
+        self.component_dirs("a")
+        log_file = self.tmp_path.joinpath("a.log")
+        self.mocker.patch.object(BuildCommand, "__init__", side_effect=Exception("Invalid recipe"))
+        handlers = list(logging.getLogger().handlers)
+
+        build_result = scheduler_module.run_component_command(
+            "build",
+            self.tmp_path.joinpath("gdk-config.json"), "a", self.tmp_path.joinpath("a"), {}, log_file, logging.INFO
+        )
+
+        assert not build_result["succeeded"]
+        assert build_result["error"] == "Invalid recipe"
+        assert "Exception: Invalid recipe" in log_file.read_text()
+        assert logging.getLogger().handlers == handlers
+
+    def component_dirs(self, *names):
+        for name in names:
+            self.tmp_path.joinpath(name).mkdir()
+
+
+def config(components):
+    return {"component": components, "gdk_version": "1.0.0"}
+
+
+def write_recipe(component_dir, dependencies):
+    recipe = {"RecipeFormatVersion": "2020-01-25", "ComponentName": component_dir.name, "ComponentDependencies": dependencies}
+    component_dir.joinpath("recipe.json").write_text(json.dumps(recipe))
+
+
+def result(component_name, succeeded):
+    return {"component": component_name, "succeeded": succeeded, "duration": 0.1, "error": None if succeeded else "failed"}
@@ -1,11 +1,14 @@
+import concurrent.futures
+import threading
 from pathlib import Path
 from unittest import TestCase
-from unittest.mock import call, Mock
+from unittest.mock import ANY, call, Mock
 from gdk.commands.component.transformer.PublishRecipeTransformer import PublishRecipeTransformer
 
 import pytest
 
 from gdk.aws_clients.Greengrassv2Client import Greengrassv2Client
+import gdk.common.utils as utils
 from gdk.aws_clients.S3Client import S3Client
 from gdk.commands.component.PublishCommand import PublishCommand
 from botocore.stub import Stubber
@@ -15,8 +18,9 @@ from gdk.common.config.GDKProject import GDKProject
 
 class PublishCommandTest(TestCase):
     @pytest.fixture(autouse=True)
-    def __inject_fixtures(self, mocker):
+    def __inject_fixtures(self, mocker, tmp_path):
         self.mocker = mocker
+        self.tmp_path = tmp_path
         self.mock_get_proj_config = self.mocker.patch(
             "gdk.common.configuration.get_configuration",
             return_value=config(),
@@ -32,7 +36,7 @@ class PublishCommandTest(TestCase):
             elif args[0] == "sts":
                 return self.sts_client
 
-        self.mocker.patch("boto3.client", side_effect=_clients)
+        self.mock_client = Mock(side_effect=_clients)
         self.gg_client_stub = Stubber(self.gg_client)
         self.sts_client_stub = Stubber(self.sts_client)
         self.gg_client_stub.activate()
@@ -47,8 +51,29 @@ class PublishCommandTest(TestCase):
         )
         boto3_ses = Mock()
         boto3_ses.get_partition_for_region.return_value = "aws"
+        boto3_ses.client = self.mock_client
         self.mocker.patch("boto3.Session", return_value=boto3_ses)
 
+    def artifacts(self, *names):
+        artifacts = []
+        for name in names:
+            artifact = self.tmp_path.joinpath(name)
+            artifact.write_text(f"content of {name}")
+            artifacts.append(artifact)
+        self.mocker.patch("pathlib.Path.iterdir", return_value=artifacts)
+        return artifacts
+
+    def test_publish_command_shares_clients_with_configuration(self):
+        publish = PublishCommand({})
+
+        assert publish.project_config.clients is publish.clients
+        assert publish.greengrass_client.client is self.gg_client
+        assert publish.clients.client("greengrassv2", "region") is self.gg_client
+        assert publish.clients.api_calls == {
+            "sts:GetCallerIdentity": 1,
+            "greengrassv2:ListComponentVersions": 1,
+        }
+
     def test_upload_artifacts_with_no_artifacts(self):
         publish = PublishCommand({})
         publish.service_clients = {"s3_client": self.mocker.patch("boto3.client", return_value=None)}
@@ -63,11 +88,142 @@ class PublishCommandTest(TestCase):
         self.mocker.patch.object(S3Client, "upload_artifact", return_value=None)
 
         publish.s3_client = S3Client("test-region")
-        self.mocker.patch("pathlib.Path.iterdir", return_value=[Path("a.py")])
+        self.mocker.patch.object(S3Client, "get_artifact_checksum", return_value=None)
+        self.artifacts("a.py")
         mock_create_bucket = self.mocker.patch.object(S3Client, "create_bucket", return_value=None)
         publish.upload_artifacts_s3()
         assert mock_create_bucket.call_args_list == [call("test-bucket")]
 
+    def test_upload_artifacts_concurrently(self):
+        publish = PublishCommand({"bucket": "test-bucket", "options": '{"upload_concurrency": 2}'})
+        publish.s3_client = S3Client("test-region")
+        self.mocker.patch.object(S3Client, "create_bucket", return_value=None)
+        self.mocker.patch.object(S3Client, "get_artifact_checksum", return_value=None)
+        self.artifacts("a.py", "b.py", "c.py")
+        barrier = threading.Barrier(2, timeout=5)
+        uploaded = []
+
+        def upload_artifact(artifact, bucket, s3_key_path, extra_args):
+            if artifact.name != "c.py":
+                # Both workers reach the barrier only if the first two artifacts are uploaded at the same time.
+                barrier.wait()
+            uploaded.append(s3_key_path)
+
+        mock_executor = self.mocker.spy(concurrent.futures.ThreadPoolExecutor, "__init__")
+        self.mocker.patch.object(S3Client, "upload_artifact", side_effect=upload_artifact)
+
+        publish.upload_artifacts_s3()
+
+        assert mock_executor.call_args == call(ANY, max_workers=2)
+        assert sorted(uploaded) == [
+            "com.example.HelloWorld/1.0.0/a.py",
+            "com.example.HelloWorld/1.0.0/b.py",
+            "com.example.HelloWorld/1.0.0/c.py",
+        ]
+
+    def test_upload_artifacts_reports_failed_artifacts(self):
+        publish = PublishCommand({"bucket": "test-bucket"})
+        publish.s3_client = S3Client("test-region")
+        self.mocker.patch.object(S3Client, "create_bucket", return_value=None)
+        self.mocker.patch.object(S3Client, "get_artifact_checksum", return_value=None)
+        self.artifacts("a.py", "b.py", "c.py")
+
+        def upload_artifact(artifact, bucket, s3_key_path, extra_args):
+            if artifact.name != "b.py":
+                raise Exception("upload failed")
+
+        mock_upload_artifact = self.mocker.patch.object(S3Client, "upload_artifact", side_effect=upload_artifact)
+
+        with pytest.raises(Exception) as e:
+            publish.upload_artifacts_s3()
+
+        assert mock_upload_artifact.call_count == 3
+        assert "Failed to upload the artifacts ['a.py', 'c.py'] to the bucket 'test-bucket'." in str(e.value)
+
+    def test_upload_artifacts_invalid_concurrency(self):
+        publish = PublishCommand({"bucket": "test-bucket", "options": '{"upload_concurrency": 0}'})
+        publish.s3_client = S3Client("test-region")
+        self.mocker.patch.object(S3Client, "create_bucket", return_value=None)
+        self.artifacts("a.py")
+        mock_upload_artifact = self.mocker.patch.object(S3Client, "upload_artifact")
+
+        with pytest.raises(ValueError) as e:
+            publish.upload_artifacts_s3()
+
+        assert "Invalid value '0' for the 'upload_concurrency' publish option" in str(e.value)
+        assert not mock_upload_artifact.called
+
+    def test_upload_artifacts_skips_unchanged_artifacts(self):
+        publish = PublishCommand({"bucket": "test-bucket"})
+        publish.s3_client = S3Client("test-region")
+        self.mocker.patch.object(S3Client, "create_bucket", return_value=None)
+        unchanged, changed = self.artifacts("unchanged.py", "changed.py")
+        checksums = {"com.example.HelloWorld/1.0.0/unchanged.py": utils.get_file_sha256(unchanged)}
+        self.mocker.patch.object(S3Client, "get_artifact_checksum", side_effect=lambda bucket, key: checksums.get(key))
+        mock_upload_artifact = self.mocker.patch.object(S3Client, "upload_artifact")
+        mock_log = self.mocker.patch("logging.info")
+
+        publish.upload_artifacts_s3()
+
+        assert mock_upload_artifact.call_args_list == [
+            call(
+                changed,
+                "test-bucket",
+                "com.example.HelloWorld/1.0.0/changed.py",
+                {"Metadata": {"gdk-sha256": utils.get_file_sha256(changed)}},
+            )
+        ]
+        assert mock_log.call_args[0][-1] == utils.format_size(unchanged.stat().st_size)
+
+    def test_upload_artifacts_copies_artifacts_unchanged_since_latest_version(self):
+        publish = PublishCommand({"bucket": "test-bucket", "options": '{"file_upload_args": {"Metadata": {"a": "b"}}}'})
+        publish.project_config.component_version = "1.0.1"
+        publish.project_config.latest_component_version = "1.0.0"
+        publish.s3_client = S3Client("test-region")
+        self.mocker.patch.object(S3Client, "create_bucket", return_value=None)
+        (artifact,) = self.artifacts("artifact.zip")
+        checksum = utils.get_file_sha256(artifact)
+        checksums = {"com.example.HelloWorld/1.0.0/artifact.zip": checksum}
+        self.mocker.patch.object(S3Client, "get_artifact_checksum", side_effect=lambda bucket, key: checksums.get(key))
+        mock_upload_artifact = self.mocker.patch.object(S3Client, "upload_artifact")
+        mock_copy_artifact = self.mocker.patch.object(S3Client, "copy_artifact")
+
+        publish.upload_artifacts_s3()
+
+        assert not mock_upload_artifact.called
+        assert mock_copy_artifact.call_args == call(
+            "test-bucket",
+            "com.example.HelloWorld/1.0.0/artifact.zip",
+            "com.example.HelloWorld/1.0.1/artifact.zip",
+            {"Metadata": {"a": "b", "gdk-sha256": checksum}},
+        )
+
+    def test_upload_artifacts_content_addressed(self):
+        publish = PublishCommand(
+            {"bucket": "test-bucket", "options": '{"artifact_layout": "content-addressed", "upload_concurrency": 1}'}
+        )
+        publish.project_config.latest_component_version = "0.9.0"
+        publish.s3_client = S3Client("test-region")
+        self.mocker.patch.object(S3Client, "create_bucket", return_value=None)
+        published, new = self.artifacts("published.zip", "new.zip")
+        published_key = f"com.example.HelloWorld/sha256/{utils.get_file_sha256(published)}/published.zip"
+        mock_get_checksum = self.mocker.patch.object(
+            S3Client,
+            "get_artifact_checksum",
+            side_effect=lambda bucket, key: utils.get_file_sha256(published) if key == published_key else None,
+        )
+        mock_upload_artifact = self.mocker.patch.object(S3Client, "upload_artifact")
+        mock_copy_artifact = self.mocker.patch.object(S3Client, "copy_artifact")
+
+        publish.upload_artifacts_s3()
+
+        new_key = f"com.example.HelloWorld/sha256/{utils.get_file_sha256(new)}/new.zip"
+        assert mock_get_checksum.call_args_list == [call("test-bucket", published_key), call("test-bucket", new_key)]
+        assert mock_upload_artifact.call_args_list == [
+            call(new, "test-bucket", new_key, {"Metadata": {"gdk-sha256": utils.get_file_sha256(new)}})
+        ]
+        assert not mock_copy_artifact.called
+
     def test_publish_run_not_build(self):
         mock_upload_artifacts_s3 = self.mocker.patch.object(PublishCommand, "upload_artifacts_s3", return_value=None)
         mock_transform = self.mocker.patch.object(PublishRecipeTransformer, "transform")
@@ -79,7 +235,7 @@ class PublishCommandTest(TestCase):
         )
         publish.run()
         assert mock_dir_exists.call_count == 1
-        assert mock_build.call_count == 1
+        mock_build.assert_called_once_with({}, publish.clients)
         assert mock_upload_artifacts_s3.call_count == 1
         assert mock_transform.call_count == 1
         assert mock_create_gg_component.call_count == 1
@@ -1,6 +1,7 @@
 import pytest
 from gdk.commands.component import component
 from gdk.commands.component.BuildCommand import BuildCommand
+from gdk.commands.component.ComponentScheduler import ComponentScheduler
 from gdk.commands.component.InitCommand import InitCommand
 from gdk.commands.component.ListCommand import ListCommand
 from gdk.commands.component.PublishCommand import PublishCommand
@@ -36,7 +37,7 @@ def test_component_build(mocker):
     component.build(d_args)
     assert mock_component_build.call_count == 1
     assert mock_component_build_run.call_count == 1
-    mock_component_build.assert_called_with(d_args)
+    mock_component_build.assert_called_with(d_args, None)
 
 
 def test_component_build_exception(mocker):
@@ -48,7 +49,45 @@ def test_component_build_exception(mocker):
     assert "Error in build" in e.value.args[0]
     assert mock_component_build.call_count == 1
     assert mock_component_build_run.call_count == 0
-    mock_component_build.assert_called_with(d_args)
+    mock_component_build.assert_called_with(d_args, None)
+
+
+def test_component_build_multiple_components(mocker):
+    project_config = {"component": {"a": {"path": "a"}, "b": {"path": "b"}}}
+    mocker.patch("gdk.common.configuration.get_configuration", return_value=project_config)
+    mock_scheduler = mocker.patch.object(ComponentScheduler, "__init__", return_value=None)
+    mock_scheduler_run = mocker.patch.object(ComponentScheduler, "run", return_value=None)
+    mock_component_build = mocker.patch.object(BuildCommand, "__init__", return_value=None)
+    d_args = {"jobs": 2}
+    component.build(d_args)
+    mock_scheduler.assert_called_with("build", d_args, project_config)
+    assert mock_scheduler_run.call_count == 1
+    assert mock_component_build.call_count == 0
+
+
+def test_component_build_selected_component_of_multiple_components(mocker):
+    project_config = {"component": {"a": {"path": "a"}, "b": {"path": "b"}}}
+    mocker.patch("gdk.common.configuration.get_configuration", return_value=project_config)
+    mocker.patch("gdk.common.configuration.get_selected_component", return_value="a")
+    mock_scheduler = mocker.patch.object(ComponentScheduler, "__init__", return_value=None)
+    mock_component_build = mocker.patch.object(BuildCommand, "__init__", return_value=None)
+    mocker.patch.object(BuildCommand, "run", return_value=None)
+    component.build({})
+    assert mock_scheduler.call_count == 0
+    assert mock_component_build.call_count == 1
+
+
+def test_component_publish_multiple_components(mocker):
+    project_config = {"component": {"a": {"path": "a"}, "b": {"path": "b"}}}
+    mocker.patch("gdk.common.configuration.get_configuration", return_value=project_config)
+    mock_scheduler = mocker.patch.object(ComponentScheduler, "__init__", return_value=None)
+    mock_scheduler_run = mocker.patch.object(ComponentScheduler, "run", return_value=None)
+    mock_component_publish = mocker.patch.object(PublishCommand, "__init__", return_value=None)
+    d_args = {"jobs": None}
+    component.publish(d_args)
+    mock_scheduler.assert_called_with("publish", d_args, project_config)
+    assert mock_scheduler_run.call_count == 1
+    assert mock_component_publish.call_count == 0
 
 
 def test_component_publish(mocker):
@@ -1,3 +1,5 @@
+import logging
+import os
 from pathlib import Path
 from unittest import TestCase
 from unittest.mock import call
@@ -6,6 +8,8 @@ import pytest
 
 from gdk.commands.component.transformer.BuildRecipeTransformer import BuildRecipeTransformer
 from gdk.common.CaseInsensitive import CaseInsensitiveRecipeFile, CaseInsensitiveDict
+from gdk.common.FileDigester import FileDigester
+from gdk.common.FileStager import FileStager
 from gdk.commands.component.config.ComponentBuildConfiguration import ComponentBuildConfiguration
 from gdk.common.config.GDKProject import GDKProject
 from gdk.aws_clients.S3Client import S3Client
@@ -13,8 +17,10 @@ from gdk.aws_clients.S3Client import S3Client
 
 class BuildRecipeTransformerTest(TestCase):
     @pytest.fixture(autouse=True)
-    def __inject_fixtures(self, mocker):
+    def __inject_fixtures(self, mocker, tmp_path, caplog):
         self.mocker = mocker
+        self.caplog = caplog
+        self.tmp_path = tmp_path
         self.mock_get_proj_config = self.mocker.patch(
             "gdk.common.configuration.get_configuration",
             return_value=config(),
@@ -165,9 +171,8 @@ class BuildRecipeTransformerTest(TestCase):
         assert not mock_is_artifact_in_s3.called
 
     def test_is_artifact_in_build(self):
-        zip_build_path = [Path("zip-build").resolve()]
-        mock_shutil_copy = self.mocker.patch("shutil.copy")
-        mock_is_file = self.mocker.patch("pathlib.Path.is_file", return_value=True)
+        zip_build_path = [self.build_folder("zip-build", "hello_world.py")]
+        mock_stage = self.mocker.patch.object(FileStager, "stage")
         pc = ComponentBuildConfiguration({})
         brg = BuildRecipeTransformer(pc)
         artifact_uri = CaseInsensitiveDict(
@@ -175,28 +180,109 @@ class BuildRecipeTransformerTest(TestCase):
         )
         assert brg.is_artifact_in_build(artifact_uri, zip_build_path)
 
-        assert mock_shutil_copy.called
-        assert mock_is_file.assert_called_once
-        mock_shutil_copy.assert_called_with(
-            Path("zip-build").joinpath("hello_world.py").resolve(),
+        assert mock_stage.called
+        mock_stage.assert_called_with(
+            zip_build_path[0].joinpath("hello_world.py"),
             pc.gg_build_component_artifacts_dir,
         )
         assert artifact_uri.to_dict() == {"uri": "s3://BUCKET_NAME/COMPONENT_NAME/COMPONENT_VERSION/hello_world.py"}
 
     def test_is_artifact_in_build_not_exists(self):
-        zip_build_path = [Path("zip-build").resolve()]
-        mock_shutil_copy = self.mocker.patch("shutil.copy")
-        mock_is_file = self.mocker.patch("pathlib.Path.is_file", return_value=False)
+        zip_build_path = [self.build_folder("zip-build", "other.py")]
+        mock_stage = self.mocker.patch.object(FileStager, "stage")
         brg = BuildRecipeTransformer(ComponentBuildConfiguration({}))
         artifact_uri = CaseInsensitiveDict(
             {"uri": "s3://DOC-EXAMPLE-BUCKET/artifacts/com.example.HelloWorld/1.0.0/hello_world.py"}
         )
         assert not brg.is_artifact_in_build(artifact_uri, zip_build_path)
 
-        assert not mock_shutil_copy.called
-        assert mock_is_file.assert_called_once
+        assert not mock_stage.called
         assert artifact_uri == {"uri": "s3://DOC-EXAMPLE-BUCKET/artifacts/com.example.HelloWorld/1.0.0/hello_world.py"}
 
+    def test_is_artifact_in_build_lists_build_folders_once(self):
+        build_folders = [self.build_folder("a/target", "a.jar"), self.build_folder("b/target", "b.jar")]
+        self.mocker.patch.object(FileStager, "stage")
+        spy_scandir = self.mocker.spy(os, "scandir")
+        brg = BuildRecipeTransformer(ComponentBuildConfiguration({}))
+
+        for name in ["a.jar", "b.jar", "a.jar"]:
+            assert brg.is_artifact_in_build(CaseInsensitiveDict({"uri": f"s3://bucket/{name}"}), build_folders)
+
+        assert spy_scandir.call_count == 2
+
+    def test_is_artifact_in_build_case_insensitive_filesystem(self):
+        build_folders = [self.build_folder("target", "App.jar")]
+        self.mocker.patch("os.path.normcase", side_effect=lambda name: name.lower())
+        mock_stage = self.mocker.patch.object(FileStager, "stage")
+        brg = BuildRecipeTransformer(ComponentBuildConfiguration({}))
+
+        artifact = CaseInsensitiveDict({"uri": "s3://bucket/app.JAR"})
+        assert brg.is_artifact_in_build(artifact, build_folders)
+
+        mock_stage.assert_called_once_with(
+            build_folders[0].joinpath("app.JAR"), brg.project_config.gg_build_component_artifacts_dir
+        )
+        assert artifact.to_dict() == {"uri": "s3://BUCKET_NAME/COMPONENT_NAME/COMPONENT_VERSION/app.JAR"}
+
+    def test_is_artifact_in_build_multiple_build_folders(self):
+        build_folders = [self.build_folder("a/target", "app.jar"), self.build_folder("b/target", "app.jar")]
+        mock_stage = self.mocker.patch.object(FileStager, "stage")
+        brg = BuildRecipeTransformer(ComponentBuildConfiguration({}))
+
+        with pytest.raises(Exception) as e:
+            brg.is_artifact_in_build(CaseInsensitiveDict({"uri": "s3://bucket/app.jar"}), build_folders)
+
+        assert "Artifact 'app.jar' of the recipe is found in multiple build folders" in e.value.args[0]
+        assert str(build_folders[0]) in e.value.args[0] and str(build_folders[1]) in e.value.args[0]
+        assert not mock_stage.called
+
+    def test_find_artifacts_and_update_uri_sets_digests_of_staged_artifacts(self):
+        build_folders = [self.build_folder("target", "app.jar")]
+        recipe = CaseInsensitiveDict(
+            {
+                "Manifests": [
+                    {"Artifacts": [{"URI": "s3://bucket/app.jar"}, {"URI": "s3://bucket/on-s3.zip"}]},
+                    {"Artifacts": [{"uri": "s3://bucket/app.jar", "digest": "old"}]},
+                ]
+            }
+        )
+        self.mocker.patch.object(FileStager, "stage")
+        self.mocker.patch.object(S3Client, "s3_artifact_exists", return_value=True)
+        mock_digest = self.mocker.patch.object(FileDigester, "digest", return_value={build_folders[0] / "app.jar": "ZGlnZXN0"})
+        brg = BuildRecipeTransformer(ComponentBuildConfiguration({}))
+
+        brg.update_artifact_uris(recipe, build_folders)
+
+        assert mock_digest.call_args_list == [call([build_folders[0] / "app.jar", build_folders[0] / "app.jar"])]
+        assert recipe.to_dict()["Manifests"] == [
+            {
+                "Artifacts": [
+                    {
+                        "URI": "s3://BUCKET_NAME/COMPONENT_NAME/COMPONENT_VERSION/app.jar",
+                        "Digest": "ZGlnZXN0",
+                        "Algorithm": "SHA-256",
+                    },
+                    {"URI": "s3://bucket/on-s3.zip"},
+                ]
+            },
+            {
+                "Artifacts": [
+                    {
+                        "uri": "s3://BUCKET_NAME/COMPONENT_NAME/COMPONENT_VERSION/app.jar",
+                        "digest": "ZGlnZXN0",
+                        "Algorithm": "SHA-256",
+                    }
+                ]
+            },
+        ]
+
+    def build_folder(self, path, *files):
+        build_folder = self.tmp_path.joinpath(path).resolve()
+        build_folder.mkdir(parents=True)
+        for file in files:
+            build_folder.joinpath(file).touch()
+        return build_folder
+
     def test_find_artifacts_and_update_uri_mix_uri_in_recipe_call_counts(self):
         build_folders = [Path("zip-build").resolve()]
         recipe_mixed_uris = {
@@ -237,10 +323,63 @@ class BuildRecipeTransformerTest(TestCase):
             call({"URI": "s3://found-1-on-s3.py"}, build_folders),
             call({"URI": "s3://found-2-on-s3.py"}, build_folders),
         ]
-        assert mock_is_artifact_in_s3.call_args_list == [
-            call("s3://found-1-on-s3.py"),
-            call("s3://found-2-on-s3.py"),
-        ]
+        # The artifacts are checked on s3 at the same time, so the calls can be in any order.
+        assert mock_is_artifact_in_s3.call_count == 2
+        mock_is_artifact_in_s3.assert_has_calls([call("s3://found-1-on-s3.py"), call("s3://found-2-on-s3.py")], any_order=True)
+
+    def test_find_artifacts_and_update_uri_checks_each_s3_uri_once(self):
+        build_folders = [Path("zip-build").resolve()]
+        recipe = {
+            "RecipeFormatVersion": "2020-01-25",
+            "ComponentName": "com.example.HelloWorld",
+            "ComponentVersion": "1.0.0",
+            "Manifests": [
+                {
+                    "Platform": {"os": "linux"},
+                    "Artifacts": [{"URI": "s3://bucket/shared.zip"}, {"URI": "s3://bucket/linux.zip"}],
+                },
+                {
+                    "Platform": {"os": "windows"},
+                    "Artifacts": [{"URI": "s3://bucket/shared.zip"}, {"URI": "s3://bucket/windows.zip"}],
+                },
+            ],
+        }
+        self.mocker.patch.object(BuildRecipeTransformer, "is_artifact_in_build", return_value=False)
+        mock_is_artifact_in_s3 = self.mocker.patch.object(S3Client, "s3_artifact_exists", return_value=True)
+        brg = BuildRecipeTransformer(ComponentBuildConfiguration({}))
+
+        with self.caplog.at_level(logging.INFO):
+            brg.update_component_recipe_file(CaseInsensitiveDict(recipe), build_folders)
+            brg.update_component_recipe_file(CaseInsensitiveDict(recipe), build_folders)
+
+        assert mock_is_artifact_in_s3.call_count == 3
+        mock_is_artifact_in_s3.assert_has_calls(
+            [call("s3://bucket/shared.zip"), call("s3://bucket/linux.zip"), call("s3://bucket/windows.zip")], any_order=True
+        )
+        assert self.caplog.text.count("Checked 3 artifact(s) on s3 in") == 1
+
+    def test_find_artifacts_and_update_uri_reports_first_missing_s3_uri(self):
+        build_folders = [Path("zip-build").resolve()]
+        recipe = {
+            "RecipeFormatVersion": "2020-01-25",
+            "ComponentName": "com.example.HelloWorld",
+            "ComponentVersion": "1.0.0",
+            "Manifests": [
+                {"Artifacts": [{"URI": "s3://bucket/found.zip"}, {"URI": "s3://bucket/missing-1.zip"}]},
+                {"Artifacts": [{"URI": "s3://bucket/missing-2.zip"}]},
+            ],
+        }
+        self.mocker.patch.object(BuildRecipeTransformer, "is_artifact_in_build", return_value=False)
+        mock_is_artifact_in_s3 = self.mocker.patch.object(
+            S3Client, "s3_artifact_exists", side_effect=lambda uri: uri == "s3://bucket/found.zip"
+        )
+        brg = BuildRecipeTransformer(ComponentBuildConfiguration({}))
+
+        with pytest.raises(Exception) as e:
+            brg.update_component_recipe_file(CaseInsensitiveDict(recipe), build_folders)
+
+        assert "Could not find artifact with URI 's3://bucket/missing-1.zip' on s3" in e.value.args[0]
+        assert mock_is_artifact_in_s3.call_count == 3
 
     def test_create_recipe_file_json(self):
         pc = ComponentBuildConfiguration({})
@@ -37,7 +37,7 @@ class PublishRecipeTransformerTest(TestCase):
             elif args[0] == "sts":
                 return self.sts_client
 
-        self.mocker.patch("boto3.client", side_effect=_clients)
+        self.mock_client = Mock(side_effect=_clients)
         self.gg_client_stub = Stubber(self.gg_client)
         self.sts_client_stub = Stubber(self.sts_client)
         self.gg_client_stub.activate()
@@ -45,6 +45,7 @@ class PublishRecipeTransformerTest(TestCase):
         self.sts_client_stub.add_response("get_caller_identity", {"Account": "123456789012"})
         boto3_ses = Mock()
         boto3_ses.get_partition_for_region.return_value = "aws"
+        boto3_ses.client = self.mock_client
         self.mocker.patch("boto3.Session", return_value=boto3_ses)
         self.gg_client_stub.add_response(
             "list_component_versions",
@@ -94,6 +95,27 @@ class PublishRecipeTransformerTest(TestCase):
         assert mock_glob.call_args_list == [call("hello_world.py")]
         assert cis_recipe["Manifests"][0]["Artifacts"][0]["URI"] == "s3://default/com.example.HelloWorld/1.0.0/hello_world.py"
 
+    def test_update_component_recipe_file_content_addressed(self):
+        recipe = {
+            "RecipeFormatVersion": "2020-01-25",
+            "ComponentName": "com.example.HelloWorld",
+            "ComponentVersion": "1.0.0",
+            "Manifests": [{"Platform": {"os": "linux"}, "Artifacts": [{"URI": "s3://hello_world.py"}]}],
+        }
+        self.mocker.patch("pathlib.Path.glob", return_value=[Path("hello_world.py").resolve()])
+        mock_checksum = self.mocker.patch.object(ComponentPublishConfiguration, "get_artifact_checksum", return_value="abc")
+
+        prg = PublishRecipeTransformer(
+            ComponentPublishConfiguration({"bucket": "default", "options": '{"artifact_layout": "content-addressed"}'})
+        )
+        cis_recipe = CaseInsensitiveDict(recipe)
+        prg.update_component_recipe_file(cis_recipe)
+        assert mock_checksum.call_args_list == [call(Path("hello_world.py").resolve())]
+        assert (
+            cis_recipe["Manifests"][0]["Artifacts"][0]["URI"]
+            == "s3://default/com.example.HelloWorld/sha256/abc/hello_world.py"
+        )
+
     def test_update_component_recipe_file_with_docker_uris(self):
         recipe = {
             "RecipeFormatVersion": "2020-01-25",
@@ -59,7 +59,7 @@ class CommandTest(TestCase):
         cli_model = {
             "init": {"conflicting_arg_groups": [["language", "template"], ["repository"], ["project"], ["interactive"]]}
         }
-        self.mocker.patch.object(gdk.CLIParser.cli_tool, "cli_model", cli_model)
+        self.mocker.patch.object(gdk.CLIParser.CLIParser, "cli_model", cli_model)
         c = Command(command_args, "init")
         assert mock_init.called
         with pytest.raises(ConflictingArgumentsError):
@@ -79,7 +79,7 @@ class CommandTest(TestCase):
         cli_model = {
             "init": {"conflicting_arg_groups": [["language", "template"], ["repository"], ["project"], ["interactive"]]}
         }
-        self.mocker.patch.object(gdk.CLIParser.cli_tool, "cli_model", cli_model)
+        self.mocker.patch.object(gdk.CLIParser.CLIParser, "cli_model", cli_model)
         c = Command(command_args, "init")
         assert mock_init.called
         assert not c.check_if_arguments_conflict()
@@ -218,26 +218,26 @@ class CommandTest(TestCase):
         c = Command(command_args, "init")
         c.arguments = command_args
         c.name = "init"
-        self.mocker.patch.object(gdk.CLIParser.cli_tool, "cli_model", cli_model)
+        self.mocker.patch.object(gdk.CLIParser.CLIParser, "cli_model", cli_model)
         assert c._non_conflicting_args_map() == expected_dic
 
         cli_model = {"init": {"arguments": []}}
-        self.mocker.patch.object(gdk.CLIParser.cli_tool, "cli_model", cli_model)
+        self.mocker.patch.object(gdk.CLIParser.CLIParser, "cli_model", cli_model)
         assert c._non_conflicting_args_map() == {}
 
         cli_model = {"init": {"conflicting_arg_groups": []}}
-        self.mocker.patch.object(gdk.CLIParser.cli_tool, "cli_model", cli_model)
+        self.mocker.patch.object(gdk.CLIParser.CLIParser, "cli_model", cli_model)
         assert c._non_conflicting_args_map() == {}
 
         cli_model = {"init": {"conflicting_arg_groups": [["language", "template"], []]}}
         expected_dic = {"language": {"language", "template"}, "template": {"language", "template"}}
-        self.mocker.patch.object(gdk.CLIParser.cli_tool, "cli_model", cli_model)
+        self.mocker.patch.object(gdk.CLIParser.CLIParser, "cli_model", cli_model)
         assert c._non_conflicting_args_map() == expected_dic
 
         cli_model = {"init": {"conflicting_arg_groups": [["language", "template"], []]}}
         c.name = "invalid-command"
         expected_dic = {}
-        self.mocker.patch.object(gdk.CLIParser.cli_tool, "cli_model", cli_model)
+        self.mocker.patch.object(gdk.CLIParser.CLIParser, "cli_model", cli_model)
         assert c._non_conflicting_args_map() == expected_dic
 
 
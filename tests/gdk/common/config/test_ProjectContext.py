@@ -0,0 +1,81 @@
+import json
+import os
+
+import pytest
+
+from gdk.common.config.ProjectContext import ProjectContext
+
+
+@pytest.fixture(autouse=True)
+def clear_contexts():
+    ProjectContext.clear()
+    yield
+    ProjectContext.clear()
+
+
+@pytest.fixture()
+def config_file(tmp_path):
+    config_file = tmp_path.joinpath("gdk-config.json")
+    config_file.write_text(json.dumps({"component": {"abc": {"version": "1.0.0"}}}))
+    return config_file
+
+
+def load(config_file, content):
+    return json.loads(content)
+
+
+def test_GIVEN_config_file_WHEN_get_context_THEN_load_config(mocker, config_file):
+    mock_load = mocker.Mock(side_effect=load)
+
+    context = ProjectContext.get(config_file, mock_load)
+
+    assert context.config == {"component": {"abc": {"version": "1.0.0"}}}
+    mock_load.assert_called_once_with(config_file, config_file.read_text())
+
+
+def test_GIVEN_unchanged_config_file_WHEN_get_context_again_THEN_reuse_context(mocker, config_file):
+    mock_load = mocker.Mock(side_effect=load)
+
+    context = ProjectContext.get(config_file, mock_load)
+
+    assert ProjectContext.get(config_file, mock_load) is context
+    assert mock_load.call_count == 1
+
+
+def test_GIVEN_config_file_touched_WHEN_get_context_again_THEN_reuse_context_with_same_content(mocker, config_file):
+    mock_load = mocker.Mock(side_effect=load)
+    context = ProjectContext.get(config_file, mock_load)
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+    assert ProjectContext.get(config_file, mock_load) is context
+    assert mock_load.call_count == 1
+
+
+def test_GIVEN_config_file_changed_WHEN_get_context_again_THEN_load_config_again(mocker, config_file):
+    mock_load = mocker.Mock(side_effect=load)
+    ProjectContext.get(config_file, mock_load)
+    config_file.write_text(json.dumps({"component": {"abc": {"version": "2.0.0"}}}))
+
+    context = ProjectContext.get(config_file, mock_load)
+
+    assert context.config == {"component": {"abc": {"version": "2.0.0"}}}
+    assert mock_load.call_count == 2
+
+
+def test_GIVEN_invalid_config_file_WHEN_get_context_THEN_raise_exception_every_time(mocker, config_file):
+    mock_load = mocker.Mock(side_effect=Exception("invalid config"))
+
+    for _ in range(2):
+        with pytest.raises(Exception) as e:
+            ProjectContext.get(config_file, mock_load)
+        assert "invalid config" in e.value.args[0]
+    assert mock_load.call_count == 2
+
+
+def test_GIVEN_context_WHEN_config_changed_by_command_THEN_context_config_not_changed(config_file):
+    context = ProjectContext.get(config_file, load)
+
+    context.config["component"]["abc"]["version"] = "3.0.0"
+
+    assert context.config["component"]["abc"]["version"] == "1.0.0"
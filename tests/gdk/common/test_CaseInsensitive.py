@@ -84,6 +84,30 @@ class CaseInsensitiveRecipeFileTest(TestCase):
                 with open(tmp_path, "r") as updated_yaml:
                     assert yaml.safe_load(original_yaml.read()) == yaml.safe_load(updated_yaml.read())
 
+    def test_write_yaml_with_anchors_without_aliases(self):
+        recipe = (
+            "ComponentName: com.example.Anchors\n"
+            "Manifests:\n"
+            "  - Platform:\n"
+            "      os: linux\n"
+            "    Lifecycle: &lifecycle\n"
+            "      Run: python3 -u main.py\n"
+            "  - Platform:\n"
+            "      os: darwin\n"
+            "    Lifecycle: *lifecycle\n"
+        )
+        with tempfile.TemporaryDirectory() as newDir:
+            recipe_file = Path(newDir).joinpath("recipe.yaml")
+            recipe_file.write_text(recipe)
+            build_recipe_file = Path(newDir).joinpath("build-recipe.yaml")
+            contents = CaseInsensitiveRecipeFile().read(recipe_file)
+            contents["manifests"][0]["platform"].update_value("os", "linux")
+            CaseInsensitiveRecipeFile().write(build_recipe_file, contents)
+
+            written_recipe = build_recipe_file.read_text()
+            assert "&id" not in written_recipe and "*id" not in written_recipe
+            assert yaml.safe_load(written_recipe) == yaml.safe_load(recipe)
+
     def test_write_invalid_format(self):
         with tempfile.TemporaryDirectory() as newDir:
             yaml_file = Path(".").joinpath("tests/gdk/static/project_utils").joinpath("valid_component_recipe.yaml").resolve()
@@ -129,3 +153,38 @@ class CaseInsensitiveDictTest(TestCase):
             "key2": [{"key21": "updated-value21"}, {"key22": "value22"}],
             "key3": {"key31": {"key311": "key312"}},
         }
+
+    def test_nested_values_converted_on_access(self):
+        dictionary = {
+            "Manifests": [{"Artifacts": [{"URI": "s3://bucket/artifact.zip"}]}],
+            "ComponentConfiguration": {"DefaultConfiguration": {"Message": "world"}},
+        }
+        cis = CaseInsensitiveDict(dictionary)
+        cis["manifests"][0]["artifacts"][0].update_value("uri", "s3://BUCKET_NAME/artifact.zip")
+
+        assert isinstance(cis["MANIFESTS"][0], CaseInsensitiveDict)
+        assert cis["manifests"] is cis["Manifests"]
+        assert cis["Manifests"][0]["Artifacts"][0]["Uri"] == "s3://BUCKET_NAME/artifact.zip"
+        assert cis.to_dict()["ComponentConfiguration"] is not dictionary["ComponentConfiguration"]
+        assert cis.to_dict() == {
+            "Manifests": [{"Artifacts": [{"URI": "s3://BUCKET_NAME/artifact.zip"}]}],
+            "ComponentConfiguration": {"DefaultConfiguration": {"Message": "world"}},
+        }
+        assert dictionary["Manifests"][0]["Artifacts"][0]["URI"] == "s3://bucket/artifact.zip"
+
+    def test_set_item_and_update_value_key_case(self):
+        cis = CaseInsensitiveDict({"ComponentName": "a", "ComponentVersion": "1.0.0"})
+        cis["componentname"] = "b"
+        cis.update_value("COMPONENTVERSION", "2.0.0")
+        cis.update_value("ComponentPublisher", "publisher")
+
+        assert list(cis) == ["componentname", "ComponentVersion", "ComponentPublisher"]
+        assert cis.to_dict() == {"componentname": "b", "ComponentVersion": "2.0.0", "ComponentPublisher": "publisher"}
+
+    def test_compare_and_copy(self):
+        cis = CaseInsensitiveDict({"Key": {"Nested": ["a"]}}, other="value")
+
+        assert cis == {"KEY": {"nested": ["a"]}, "OTHER": "value"}
+        assert cis != {"key": {"nested": ["b"]}, "other": "value"}
+        assert cis.copy() == cis and cis.copy() is not cis
+        assert not hasattr(cis, "__dict__")
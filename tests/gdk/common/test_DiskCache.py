@@ -0,0 +1,51 @@
+import json
+import time
+
+from gdk.common.DiskCache import DiskCache
+
+
+def test_GIVEN_cached_value_WHEN_get_THEN_return_value(gdk_cache_dir):
+    DiskCache("test").set("key", {"a": 1})
+
+    assert DiskCache("test").get("key") == {"a": 1}
+    assert gdk_cache_dir.joinpath("test.json").is_file()
+    assert [path.name for path in gdk_cache_dir.iterdir()] == ["test.json"]
+
+
+def test_GIVEN_no_cache_file_WHEN_get_THEN_return_none():
+    assert DiskCache("test").get("key") is None
+
+
+def test_GIVEN_expired_value_WHEN_get_THEN_return_none(mocker):
+    cache = DiskCache("test")
+    cache.set("key", "value")
+    mocker.patch("time.time", return_value=time.time() + 120)
+
+    assert cache.get("key", max_age_seconds=60) is None
+    assert cache.get("key", max_age_seconds=300) == "value"
+
+
+def test_GIVEN_corrupt_cache_file_WHEN_get_and_set_THEN_ignore_file(gdk_cache_dir):
+    gdk_cache_dir.joinpath("test.json").write_text("not json")
+    cache = DiskCache("test")
+
+    assert cache.get("key") is None
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+
+
+def test_GIVEN_cache_file_with_other_version_WHEN_get_THEN_return_none(gdk_cache_dir):
+    gdk_cache_dir.joinpath("test.json").write_text(
+        json.dumps({"version": 0, "entries": {"key": {"value": "value", "updated": time.time()}}})
+    )
+
+    assert DiskCache("test").get("key") is None
+
+
+def test_GIVEN_cache_dir_not_writable_WHEN_set_THEN_ignore_error(mocker):
+    mocker.patch("pathlib.Path.mkdir", side_effect=PermissionError("denied"))
+    cache = DiskCache("test")
+
+    cache.set("key", "value")
+
+    assert cache.get("key") is None
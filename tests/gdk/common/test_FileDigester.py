@@ -0,0 +1,106 @@
+import base64
+import hashlib
+import json
+import os
+
+import pytest
+
+import gdk.common.FileDigester as file_digester_module
+from gdk.common.FileDigester import FileDigester
+
+
+def expected_digest(content: bytes) -> str:
+    return base64.b64encode(hashlib.sha256(content).digest()).decode("ascii")
+
+
+@pytest.fixture()
+def cache_file(tmp_path):
+    return tmp_path.joinpath("greengrass-build", "artifact-digests.json")
+
+
+@pytest.fixture()
+def files(tmp_path):
+    build_dir = tmp_path.joinpath("target")
+    build_dir.mkdir()
+    files = [build_dir.joinpath("artifact.jar"), build_dir.joinpath("config.zip"), build_dir.joinpath("empty.txt")]
+    files[0].write_bytes(b"artifact" * 1000)
+    files[1].write_bytes(b"config")
+    files[2].write_bytes(b"")
+    return files
+
+
+@pytest.fixture(autouse=True)
+def gg_build_dir(cache_file):
+    cache_file.parent.mkdir()
+
+
+def test_GIVEN_files_WHEN_digest_THEN_return_base64_sha256_of_each_file(cache_file, files):
+    digests = FileDigester(cache_file).digest(files)
+
+    assert digests == {file: expected_digest(file.read_bytes()) for file in files}
+    assert cache_file.exists()
+
+
+def test_GIVEN_no_files_WHEN_digest_THEN_do_not_write_cache(cache_file):
+    assert FileDigester(cache_file).digest([]) == {}
+    assert not cache_file.exists()
+
+
+def test_GIVEN_file_cannot_be_memory_mapped_WHEN_digest_THEN_read_file_in_blocks(mocker, cache_file, files):
+    mocker.patch.object(file_digester_module.mmap, "mmap", side_effect=OSError("Operation not supported"))
+    mocker.patch.object(file_digester_module, "READ_BLOCK_SIZE", 100)
+
+    digests = FileDigester(cache_file).digest(files)
+
+    assert digests == {file: expected_digest(file.read_bytes()) for file in files}
+
+
+def test_GIVEN_unchanged_files_WHEN_digest_again_THEN_use_cached_digests(mocker, cache_file, files):
+    FileDigester(cache_file).digest(files)
+    spy_sha256 = mocker.spy(FileDigester, "_sha256")
+
+    digests = FileDigester(cache_file).digest(files)
+
+    assert not spy_sha256.called
+    assert digests == {file: expected_digest(file.read_bytes()) for file in files}
+
+
+def test_GIVEN_changed_file_WHEN_digest_again_THEN_hash_only_changed_file(mocker, cache_file, files):
+    FileDigester(cache_file).digest(files)
+    files[1].write_bytes(b"changed config")
+    stat = files[1].stat()
+    os.utime(files[1], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    spy_sha256 = mocker.spy(FileDigester, "_sha256")
+
+    digests = FileDigester(cache_file).digest(files)
+
+    assert [c[0][1] for c in spy_sha256.call_args_list] == [files[1]]
+    assert digests[files[1]] == expected_digest(b"changed config")
+
+
+def test_GIVEN_files_of_previous_build_WHEN_digest_THEN_keep_only_files_of_this_build(cache_file, files):
+    FileDigester(cache_file).digest(files)
+    files[0].write_bytes(b"changed artifact")
+
+    FileDigester(cache_file).digest(files[:2])
+
+    cached_files = json.loads(cache_file.read_text())["files"]
+    assert sorted(cached_files) == sorted(str(file.resolve()) for file in files[:2])
+
+
+def test_GIVEN_invalid_cache_file_WHEN_digest_THEN_hash_files(cache_file, files):
+    cache_file.write_text("not json")
+
+    digests = FileDigester(cache_file).digest(files)
+
+    assert digests == {file: expected_digest(file.read_bytes()) for file in files}
+    assert json.loads(cache_file.read_text())["version"] == file_digester_module.CACHE_FORMAT_VERSION
+
+
+def test_GIVEN_cache_file_cannot_be_written_WHEN_digest_THEN_return_digests(tmp_path, files):
+    cache_file = tmp_path.joinpath("missing-dir", "artifact-digests.json")
+
+    digests = FileDigester(cache_file).digest(files)
+
+    assert digests == {file: expected_digest(file.read_bytes()) for file in files}
+    assert not cache_file.exists()
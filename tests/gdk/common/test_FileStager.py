@@ -0,0 +1,102 @@
+import pytest
+
+import gdk.common.FileStager as file_stager_module
+from gdk.common.FileStager import FileStager
+
+
+@pytest.fixture(autouse=True)
+def clear_methods():
+    FileStager.clear()
+    yield
+    FileStager.clear()
+
+
+@pytest.fixture()
+def source_file(tmp_path):
+    build_dir = tmp_path.joinpath("target")
+    build_dir.mkdir()
+    source_file = build_dir.joinpath("artifact.jar")
+    source_file.write_bytes(b"artifact")
+    source_file.chmod(0o750)
+    return source_file
+
+
+@pytest.fixture()
+def destination_dir(tmp_path):
+    destination_dir = tmp_path.joinpath("greengrass-build")
+    destination_dir.mkdir()
+    return destination_dir
+
+
+def test_GIVEN_file_WHEN_stage_THEN_place_file_with_same_content_and_mode(source_file, destination_dir):
+    destination_file = FileStager().stage(source_file, destination_dir)
+
+    assert destination_file == destination_dir.joinpath("artifact.jar")
+    assert destination_file.read_bytes() == b"artifact"
+    assert destination_file.stat().st_mode == source_file.stat().st_mode
+
+
+def test_GIVEN_reflink_not_supported_WHEN_stage_THEN_hardlink_file(mocker, source_file, destination_dir):
+    mocker.patch.object(FileStager, "_reflink", side_effect=OSError("Operation not supported"))
+
+    destination_file = FileStager().stage(source_file, destination_dir)
+
+    assert destination_file.samefile(source_file)
+    assert list(destination_dir.iterdir()) == [destination_file]
+
+
+def test_GIVEN_links_not_supported_WHEN_stage_THEN_copy_file(mocker, source_file, destination_dir):
+    mocker.patch.object(FileStager, "_reflink", side_effect=OSError("Operation not supported"))
+    mocker.patch("os.link", side_effect=OSError("Invalid cross-device link"))
+
+    destination_file = FileStager().stage(source_file, destination_dir)
+
+    assert not destination_file.samefile(source_file)
+    assert destination_file.read_bytes() == b"artifact"
+
+
+def test_GIVEN_no_fcntl_WHEN_reflink_THEN_raise_os_error(mocker, source_file, destination_dir):
+    mocker.patch.object(file_stager_module, "fcntl", None)
+
+    with pytest.raises(OSError):
+        FileStager()._reflink(source_file, destination_dir.joinpath("artifact.jar"))
+
+
+def test_GIVEN_method_selected_for_filesystems_WHEN_stage_again_THEN_use_same_method(mocker, source_file, destination_dir):
+    mock_reflink = mocker.patch.object(FileStager, "_reflink", side_effect=OSError("Operation not supported"))
+    spy_debug = mocker.spy(file_stager_module.logging, "debug")
+
+    FileStager().stage(source_file, destination_dir)
+    destination_file = FileStager().stage(source_file, destination_dir)
+
+    assert mock_reflink.call_count == 1
+    assert destination_file.samefile(source_file)
+    spy_debug.assert_any_call("Staging files from '%s' to '%s' with a %s.", source_file.parent, destination_dir, "hardlink")
+
+
+def test_GIVEN_selected_link_fails_for_file_WHEN_stage_THEN_copy_file(mocker, source_file, destination_dir):
+    mocker.patch.object(FileStager, "_reflink", side_effect=OSError("Operation not supported"))
+    FileStager().stage(source_file, destination_dir)
+    mocker.patch("os.link", side_effect=OSError("Too many links"))
+
+    destination_file = FileStager().stage(source_file, destination_dir)
+
+    assert not destination_file.samefile(source_file)
+    assert destination_file.read_bytes() == b"artifact"
+
+
+def test_GIVEN_staged_link_WHEN_stage_new_file_THEN_do_not_change_previous_source(mocker, tmp_path, destination_dir):
+    previous_source = tmp_path.joinpath("artifact.jar")
+    previous_source.write_bytes(b"previous")
+    destination_dir.joinpath("artifact.jar").symlink_to(previous_source)
+    new_source = tmp_path.joinpath("target")
+    new_source.mkdir()
+    new_source = new_source.joinpath("artifact.jar")
+    new_source.write_bytes(b"new")
+    mocker.patch.object(FileStager, "_reflink", side_effect=OSError("Operation not supported"))
+    mocker.patch("os.link", side_effect=OSError("Invalid cross-device link"))
+
+    destination_file = FileStager().stage(new_source, destination_dir)
+
+    assert destination_file.read_bytes() == b"new"
+    assert previous_source.read_bytes() == b"previous"
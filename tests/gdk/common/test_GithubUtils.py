@@ -1,3 +1,4 @@
+import time
 from unittest import TestCase
 
 import pytest
@@ -24,3 +25,33 @@ class GithubUtilsTest(TestCase):
         github_utils = GithubUtils()
         latest_release = github_utils.get_latest_release_name("author", "repo")
         assert latest_release == "1.0.0"
+
+    def test_GIVEN_latest_release_request_WHEN_request_THEN_use_timeout(self):
+        mock_get = self.mocker.patch("requests.get", return_value=MockGetResponse({"name": "1.0.0"}, 200))
+        GithubUtils().get_latest_release_name("author", "repo")
+        mock_get.assert_called_once_with("https://api.github.com/repos/author/repo/releases/latest", timeout=5)
+
+    def test_GIVEN_cached_release_WHEN_get_cached_latest_release_THEN_do_not_call_github(self):
+        mock_get = self.mocker.patch("requests.get", return_value=MockGetResponse({"name": "1.0.0"}, 200))
+
+        assert GithubUtils().get_cached_latest_release_name("author", "repo", 60) == "1.0.0"
+        assert GithubUtils().get_cached_latest_release_name("author", "repo", 60) == "1.0.0"
+        assert mock_get.call_count == 1
+
+    def test_GIVEN_expired_cached_release_WHEN_get_cached_latest_release_THEN_call_github(self):
+        mock_get = self.mocker.patch("requests.get", return_value=MockGetResponse({"name": "1.0.0"}, 200))
+        GithubUtils().get_cached_latest_release_name("author", "repo", 60)
+        mock_get.return_value = MockGetResponse({"name": "1.1.0"}, 200)
+        self.mocker.patch("time.time", return_value=time.time() + 120)
+
+        assert GithubUtils().get_cached_latest_release_name("author", "repo", 60) == "1.1.0"
+        assert mock_get.call_count == 2
+
+    def test_GIVEN_offline_WHEN_get_cached_latest_release_THEN_use_expired_cached_release(self):
+        mock_get = self.mocker.patch("requests.get", return_value=MockGetResponse({"name": "1.0.0"}, 200))
+        assert GithubUtils().get_cached_latest_release_name("author", "repo", 60, offline=True) is None
+        GithubUtils().get_cached_latest_release_name("author", "repo", 60)
+        self.mocker.patch("time.time", return_value=time.time() + 120)
+
+        assert GithubUtils().get_cached_latest_release_name("author", "repo", 60, offline=True) == "1.0.0"
+        assert mock_get.call_count == 1
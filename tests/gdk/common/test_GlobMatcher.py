@@ -0,0 +1,99 @@
+import glob
+import os
+from pathlib import Path
+
+import pytest
+
+from gdk.common.GlobMatcher import GlobMatcher
+
+PATTERNS = [
+    "gdk-config.json",
+    "greengrass-build",
+    "recipe.yaml",
+    "**/test*",
+    "**/.*",
+    "**/node_modules",
+    "*.txt",
+    "**/*.txt",
+    "src/*.py",
+    "src/**/*.py",
+    "src/",
+    "src/**",
+    "**/",
+    "**",
+    "*",
+    ".*",
+    "[a-c]*",
+    "src/nested/?odule.py",
+    "**/nested/**/*.js",
+    "does-not-exist",
+    "lib/*/",
+]
+
+
+@pytest.fixture()
+def project_dir(tmp_path):
+    root = tmp_path.joinpath("project")
+    files = [
+        "gdk-config.json",
+        "recipe.yaml",
+        "main.py",
+        "readme.txt",
+        ".env",
+        "test_root.txt",
+        "abc.cfg",
+        "src/main.py",
+        "src/.hidden.py",
+        "src/test_main.py",
+        "src/notes.txt",
+        "src/nested/module.py",
+        "src/nested/node_modules/dep/index.js",
+        "src/nested/deep/app.js",
+        "src/.cache/cached.py",
+        "src/.cache/node_modules/pkg.js",
+        "node_modules/pkg/index.js",
+        "lib/one/lib.py",
+        "lib/two.py",
+        ".git/config",
+        ".git/objects/test_object",
+        "greengrass-build/recipes/recipe.yaml",
+        "tests/test_file.py",
+    ]
+    for file in files:
+        path = root.joinpath(file)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    return root
+
+
+def all_paths(root: Path):
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in dirnames + filenames:
+            yield Path(dirpath).joinpath(name)
+
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_GIVEN_pattern_WHEN_match_paths_THEN_match_same_paths_as_glob(project_dir, pattern):
+    globbed = set(glob.glob(f"{project_dir}{os.path.sep}{pattern}", recursive=True))
+    matcher = GlobMatcher([pattern])
+
+    for path in all_paths(project_dir):
+        expected = str(path) in globbed or f"{path}{os.path.sep}" in globbed
+        actual = matcher.matches(path.relative_to(project_dir).parts, path.is_dir)
+        assert actual == expected, f"Pattern '{pattern}' and path '{path.relative_to(project_dir)}'"
+
+
+def test_GIVEN_multiple_patterns_WHEN_match_THEN_match_if_any_pattern_matches():
+    matcher = GlobMatcher(["gdk-config.json", "**/node_modules"])
+
+    assert matcher.matches(("gdk-config.json",), lambda: False)
+    assert matcher.matches(("src", "node_modules"), lambda: True)
+    assert not matcher.matches(("src", "gdk-config.json"), lambda: False)
+
+
+def test_GIVEN_pattern_not_ending_with_separator_WHEN_match_THEN_directory_is_not_checked(mocker):
+    is_dir = mocker.Mock(return_value=True)
+    matcher = GlobMatcher(["src/*.py"])
+
+    assert matcher.matches(("src", "main.py"), is_dir)
+    assert not is_dir.called
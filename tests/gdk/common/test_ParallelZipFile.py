@@ -0,0 +1,51 @@
+import os
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from gdk.common.ParallelZipFile import ParallelZipFile
+
+
+def write_entries(zip_file, source_dir: Path):
+    with zip_file as archive:
+        for dirpath, dirnames, filenames in os.walk(source_dir):
+            dirnames.sort()
+            for name in dirnames + sorted(filenames):
+                path = Path(dirpath).joinpath(name)
+                archive.write(path, path.relative_to(source_dir).as_posix())
+
+
+@pytest.fixture()
+def source_dir(tmp_path):
+    source = tmp_path.joinpath("source")
+    source.joinpath("nested", "deeper").mkdir(parents=True)
+    source.joinpath("empty.txt").touch()
+    source.joinpath("small.txt").write_text("hello world")
+    source.joinpath("nested", "large.bin").write_bytes(os.urandom(300 * 1024) + b"a" * 3 * 1024 * 1024)
+    for i in range(20):
+        source.joinpath("nested", "deeper", f"file_{i}.py").write_text(f"print({i})\n" * (i + 1))
+    return source
+
+
+def test_GIVEN_files_WHEN_written_in_parallel_THEN_archive_matches_zipfile(tmp_path, source_dir):
+    expected_archive = tmp_path.joinpath("expected.zip")
+    parallel_archive = tmp_path.joinpath("parallel.zip")
+
+    write_entries(zipfile.ZipFile(expected_archive, "w", compression=zipfile.ZIP_DEFLATED), source_dir)
+    write_entries(ParallelZipFile(parallel_archive, 4), source_dir)
+
+    assert parallel_archive.read_bytes() == expected_archive.read_bytes()
+    with zipfile.ZipFile(parallel_archive) as archive:
+        assert archive.testzip() is None
+        assert archive.read("small.txt") == b"hello world"
+        assert archive.getinfo("nested/").is_dir()
+
+
+def test_GIVEN_deflate_fails_WHEN_written_in_parallel_THEN_raise_exception(mocker, tmp_path, source_dir):
+    mocker.patch.object(ParallelZipFile, "_deflate", side_effect=OSError("read failed"))
+
+    with pytest.raises(OSError) as e:
+        write_entries(ParallelZipFile(tmp_path.joinpath("parallel.zip"), 2), source_dir)
+
+    assert "read failed" in str(e.value)
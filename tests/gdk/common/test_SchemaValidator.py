@@ -0,0 +1,106 @@
+import datetime
+import json
+
+import jsonschema
+import pytest
+
+import gdk.common.consts as consts
+from gdk.common.DiskCache import DiskCache
+from gdk.common.SchemaValidator import SchemaValidator
+
+SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "properties": {"name": {"type": "string"}, "version": {"type": "string", "pattern": "^[0-9]+$"}},
+    "required": ["name"],
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_validators():
+    SchemaValidator._validators.clear()
+    yield
+    SchemaValidator._validators.clear()
+
+
+@pytest.fixture()
+def schema_file(tmp_path):
+    schema_file = tmp_path.joinpath("schema.json")
+    schema_file.write_text(json.dumps(SCHEMA))
+    return schema_file
+
+
+def test_GIVEN_schema_WHEN_get_validator_twice_THEN_compile_schema_once(mocker, schema_file):
+    spy_check_schema = mocker.spy(jsonschema.validators.Draft7Validator, "check_schema")
+
+    validator = SchemaValidator.get(schema_file)
+
+    assert SchemaValidator.get(schema_file) is validator
+    assert spy_check_schema.call_count == 1
+
+
+def test_GIVEN_invalid_schema_WHEN_get_validator_THEN_raise_schema_error(tmp_path):
+    schema_file = tmp_path.joinpath("schema.json")
+    schema_file.write_text(json.dumps({"type": "unknown"}))
+
+    with pytest.raises(jsonschema.exceptions.SchemaError):
+        SchemaValidator.get(schema_file)
+
+
+def test_GIVEN_invalid_document_WHEN_validate_THEN_raise_same_error_as_jsonschema(schema_file):
+    document = {"name": "abc", "version": "1.a"}
+    with pytest.raises(jsonschema.exceptions.ValidationError) as expected:
+        jsonschema.validate(document, SCHEMA)
+
+    for _ in range(2):
+        with pytest.raises(jsonschema.exceptions.ValidationError) as e:
+            SchemaValidator.get(schema_file).validate(document)
+        assert e.value.message == expected.value.message
+    assert DiskCache(consts.SCHEMA_VALIDATION_CACHE_NAME).get(SchemaValidator.get(schema_file)._cache_key) is None
+
+
+def test_GIVEN_valid_document_WHEN_validate_in_later_command_THEN_skip_validation(mocker, schema_file):
+    SchemaValidator.get(schema_file).validate({"name": "abc", "version": "1"})
+    SchemaValidator._validators.clear()
+    validator = SchemaValidator.get(schema_file)
+    spy_best_match = mocker.spy(jsonschema.exceptions, "best_match")
+
+    validator.validate({"version": "1", "name": "abc"})
+
+    assert not spy_best_match.called
+
+
+def test_GIVEN_schema_changed_WHEN_validate_valid_document_again_THEN_validate(mocker, schema_file):
+    SchemaValidator.get(schema_file).validate({"name": "abc"})
+    SchemaValidator._validators.clear()
+    schema_file.write_text(json.dumps(dict(SCHEMA, required=["name", "version"])))
+
+    with pytest.raises(jsonschema.exceptions.ValidationError) as e:
+        SchemaValidator.get(schema_file).validate({"name": "abc"})
+    assert e.value.message == "'version' is a required property"
+
+
+def test_GIVEN_many_valid_documents_WHEN_validate_THEN_cache_most_recent(mocker, schema_file):
+    mocker.patch("gdk.common.consts.MAX_CACHED_VALID_DOCUMENTS", 2)
+    validator = SchemaValidator.get(schema_file)
+    for name in ["a", "b", "c"]:
+        validator.validate({"name": name})
+    spy_best_match = mocker.spy(jsonschema.exceptions, "best_match")
+
+    validator.validate({"name": "c"})
+    validator.validate({"name": "b"})
+    assert not spy_best_match.called
+    validator.validate({"name": "a"})
+    assert spy_best_match.call_count == 1
+
+
+def test_GIVEN_document_with_non_json_values_WHEN_validate_THEN_always_validate(mocker, schema_file):
+    validator = SchemaValidator.get(schema_file)
+    spy_best_match = mocker.spy(jsonschema.exceptions, "best_match")
+
+    for _ in range(2):
+        with pytest.raises(jsonschema.exceptions.ValidationError):
+            validator.validate({"name": datetime.date(2020, 1, 25)})
+        validator.validate({"name": "abc", "date": datetime.date(2020, 1, 25)})
+
+    assert spy_best_match.call_count == 4
@@ -117,3 +117,17 @@ def test_get_project_config_file_not_exists(mocker):
 
     assert e_info.value.args[0] == error_messages.CONFIG_FILE_NOT_EXISTS
     assert mock_file_exists.called
+
+
+def test_get_project_config_file_component_selected(mocker, tmp_path):
+    config_file = tmp_path.joinpath(consts.cli_project_config_file)
+    config_file.touch()
+
+    config.select_component(config_file, "abc")
+    try:
+        assert config._get_project_config_file() == config_file
+        assert config.get_selected_component() == "abc"
+    finally:
+        config.select_component(None, None)
+
+    assert config.get_selected_component() is None
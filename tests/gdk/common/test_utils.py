@@ -1,10 +1,13 @@
+import hashlib
 import logging
 from pathlib import Path
 
 import pytest
 from urllib3.exceptions import HTTPError
 
+import gdk.common.consts as consts
 import gdk.common.utils as utils
+from gdk.common.DiskCache import DiskCache
 
 
 def test_get_static_file_path_exists(mocker):
@@ -138,7 +141,16 @@ def test_get_latest_cli_version_invalid_request(mocker):
     assert mock_get_version.called
 
 
-def test_cli_version_check_latest_not_available(mocker):
+@pytest.fixture()
+def sync_thread(mocker):
+    def run_target(target, args, daemon):
+        assert daemon
+        return mocker.Mock(start=lambda: target(*args))
+
+    return mocker.patch("gdk.common.utils.threading.Thread", side_effect=run_target)
+
+
+def test_cli_version_check_latest_not_available(mocker, sync_thread):
     mock_get_latest_cli_version = mocker.patch("gdk.common.utils.get_latest_cli_version", return_value=utils.cli_version)
     spy_log = mocker.spy(logging, "info")
     utils.cli_version_check()
@@ -146,7 +158,7 @@ def test_cli_version_check_latest_not_available(mocker):
     assert spy_log.call_count == 0
 
 
-def test_cli_version_check_latest_available(mocker):
+def test_cli_version_check_latest_available(mocker, sync_thread):
     mock_get_latest_cli_version = mocker.patch("gdk.common.utils.get_latest_cli_version", return_value="1000.0.0")
     spy_log = mocker.spy(logging, "info")
     utils.cli_version_check()
@@ -154,6 +166,72 @@ def test_cli_version_check_latest_available(mocker):
     assert spy_log.call_count == 1
 
 
+def test_cli_version_check_cached_version_is_fresh(mocker, sync_thread):
+    DiskCache(consts.CLI_VERSION_CACHE_NAME).set(utils.LATEST_CLI_VERSION_CACHE_KEY, "1000.0.0")
+    mock_get_latest_cli_version = mocker.patch("gdk.common.utils.get_latest_cli_version", return_value="1000.0.0")
+    spy_log = mocker.spy(logging, "info")
+    utils.cli_version_check()
+    assert not mock_get_latest_cli_version.called
+    assert not sync_thread.called
+    assert spy_log.call_count == 1
+
+
+def test_cli_version_check_cached_version_is_stale(mocker, sync_thread, monkeypatch):
+    monkeypatch.setenv(consts.GDK_UPDATE_CHECK_TTL_HOURS_ENV_KEY, "0")
+    DiskCache(consts.CLI_VERSION_CACHE_NAME).set(utils.LATEST_CLI_VERSION_CACHE_KEY, utils.cli_version)
+    mock_get_latest_cli_version = mocker.patch("gdk.common.utils.get_latest_cli_version", return_value="1000.0.0")
+    spy_log = mocker.spy(logging, "info")
+    utils.cli_version_check()
+    assert mock_get_latest_cli_version.call_count == 1
+    assert spy_log.call_count == 1
+    assert DiskCache(consts.CLI_VERSION_CACHE_NAME).get(utils.LATEST_CLI_VERSION_CACHE_KEY) == "1000.0.0"
+
+
+def test_cli_version_check_does_not_wait_for_latest_version(mocker):
+    mock_thread = mocker.patch("gdk.common.utils.threading.Thread")
+    mock_get_latest_cli_version = mocker.patch("gdk.common.utils.get_latest_cli_version", return_value="1000.0.0")
+    spy_log = mocker.spy(logging, "info")
+    utils.cli_version_check()
+    assert mock_thread.return_value.start.called
+    assert not mock_get_latest_cli_version.called
+    assert spy_log.call_count == 0
+
+
+def test_cli_version_check_does_not_check_again_after_unfinished_check(mocker):
+    mock_thread = mocker.patch("gdk.common.utils.threading.Thread")
+    utils.cli_version_check()
+    assert mock_thread.call_count == 1
+
+    # The command exited before the latest version was fetched, so the next command does not send the request again.
+    utils.cli_version_check()
+    assert mock_thread.call_count == 1
+
+
+def test_cli_version_check_checks_again_after_expired_check(mocker, monkeypatch):
+    monkeypatch.setenv(consts.GDK_UPDATE_CHECK_TTL_HOURS_ENV_KEY, "0")
+    DiskCache(consts.CLI_VERSION_CACHE_NAME).set(utils.CLI_VERSION_CHECK_CACHE_KEY, True)
+    mock_thread = mocker.patch("gdk.common.utils.threading.Thread")
+    utils.cli_version_check()
+    assert mock_thread.return_value.start.called
+
+
+@pytest.mark.parametrize("env", [{"GDK_DISABLE_UPDATE_CHECK": "true"}, {"GDK_OFFLINE": "1"}])
+def test_cli_version_check_disabled(mocker, monkeypatch, env):
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    mock_thread = mocker.patch("gdk.common.utils.threading.Thread")
+    mock_get_latest_cli_version = mocker.patch("gdk.common.utils.get_latest_cli_version", return_value="1000.0.0")
+    utils.cli_version_check()
+    assert not mock_thread.called
+    assert not mock_get_latest_cli_version.called
+
+
+@pytest.mark.parametrize("ttl_hours, expected", [("", 24 * 60 * 60), ("1.5", 90 * 60), ("-2", 0), ("invalid", 24 * 60 * 60)])
+def test_get_update_check_ttl_seconds(monkeypatch, ttl_hours, expected):
+    monkeypatch.setenv(consts.GDK_UPDATE_CHECK_TTL_HOURS_ENV_KEY, ttl_hours)
+    assert utils.get_update_check_ttl_seconds() == expected
+
+
 @pytest.mark.parametrize(
     "version",
     [
@@ -197,3 +275,110 @@ def test_invalid_recipe_size(mocker):
     is_valid_size, file_size = utils.is_recipe_size_valid('large_recipe.yaml')
     assert not is_valid_size
     assert file_size == 17000
+
+
+def test_get_file_sha256(tmp_path):
+    file = tmp_path.joinpath("artifact.zip")
+    file.write_bytes(b"a" * (utils.HASH_CHUNK_SIZE + 1))
+    assert utils.get_file_sha256(file) == hashlib.sha256(b"a" * (utils.HASH_CHUNK_SIZE + 1)).hexdigest()
+
+
+def test_atomic_write_replaces_file(tmp_path):
+    file = tmp_path.joinpath("cache.json")
+    file.write_text("old")
+    with utils.atomic_write(file) as f:
+        f.write("new")
+    assert file.read_text() == "new"
+    assert [path.name for path in tmp_path.iterdir()] == ["cache.json"]
+
+
+def test_atomic_write_failure_keeps_file(tmp_path):
+    file = tmp_path.joinpath("cache.json")
+    file.write_text("old")
+    with pytest.raises(ValueError):
+        with utils.atomic_write(file) as f:
+            f.write("partial")
+            raise ValueError("failed")
+    assert file.read_text() == "old"
+    assert [path.name for path in tmp_path.iterdir()] == ["cache.json"]
+
+
+def test_read_versioned_json_written_with_same_version(tmp_path):
+    file = tmp_path.joinpath("cache.json")
+    utils.write_versioned_json(file, 1, "entries", {"key": "value"})
+    assert utils.read_versioned_json(file, 1, "entries") == {"key": "value"}
+    assert utils.read_versioned_json(file, 2, "entries") == {}
+    assert utils.read_versioned_json(tmp_path.joinpath("missing.json"), 1, "entries") == {}
+
+
+def test_write_versioned_json_ignores_failures(tmp_path):
+    utils.write_versioned_json(tmp_path.joinpath("missing-dir", "cache.json"), 1, "entries", {"key": "value"})
+    assert not tmp_path.joinpath("missing-dir").exists()
+
+
+@pytest.mark.parametrize(
+    "size, formatted_size",
+    [(0, "0 B"), (1023, "1023 B"), (1536, "1.5 KB"), (5 * 1024 * 1024, "5.0 MB"), (3 * 1024**4, "3072.0 GB")],
+)
+def test_format_size(size, formatted_size):
+    assert utils.format_size(size) == formatted_size
+
+
+def test_get_cache_dir_from_env(monkeypatch, tmp_path):
+    monkeypatch.setenv("GDK_CACHE_DIR", str(tmp_path))
+    assert utils.get_cache_dir() == tmp_path
+
+
+def test_get_cache_dir_default(monkeypatch):
+    monkeypatch.delenv("GDK_CACHE_DIR")
+    assert utils.get_cache_dir() == Path.home().joinpath(".gdk", "cache")
+
+
+@pytest.mark.parametrize("value, offline", [("true", True), ("1", True), ("YES", True), ("false", False), ("", False)])
+def test_is_offline(monkeypatch, value, offline):
+    monkeypatch.setenv("GDK_OFFLINE", value)
+    assert utils.is_offline() == offline
+
+
+@pytest.mark.parametrize("value, number", [("1", 1), ("8", 8)])
+def test_positive_integer(value, number):
+    assert utils.positiveInteger(value) == number
+
+
+@pytest.mark.parametrize("value", ["0", "-2", "two"])
+def test_positive_integer_invalid(value):
+    with pytest.raises(ValueError):
+        utils.positiveInteger(value)
+
+
+def test_find_files(tmp_path):
+    files = [
+        "pom.xml",
+        "module/pom.xml",
+        "module/src/build.gradle",
+        "node_modules/pkg/pom.xml",
+        ".git/pom.xml",
+        "greengrass-build/gg-e2e-tests/pom.xml",
+        "module/pom.xml.bak",
+    ]
+    for file in files:
+        tmp_path.joinpath(file).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.joinpath(file).touch()
+    tmp_path.joinpath("module/src/build.gradle.kts").mkdir()
+
+    names = ["pom.xml", "build.gradle", "build.gradle.kts"]
+    found = utils.find_files(tmp_path, names, [".git", "node_modules", "greengrass-build"])
+
+    assert found == {
+        "pom.xml": [tmp_path.joinpath("module/pom.xml"), tmp_path.joinpath("pom.xml")],
+        "build.gradle": [tmp_path.joinpath("module/src/build.gradle")],
+        "build.gradle.kts": [],
+    }
+
+
+def test_find_files_does_not_follow_directory_links(tmp_path):
+    tmp_path.joinpath("module").mkdir()
+    tmp_path.joinpath("module/pom.xml").touch()
+    tmp_path.joinpath("module/loop").symlink_to(tmp_path, target_is_directory=True)
+
+    assert utils.find_files(tmp_path, ["pom.xml"]) == {"pom.xml": [tmp_path.joinpath("module/pom.xml")]}
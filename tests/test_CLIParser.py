@@ -85,7 +85,7 @@ def test_add_arg_to_group_or_parser_with_parser(mocker):
 
 def test_main(mocker):
     args_namespace = argparse.Namespace(component="init", init=None, lang="python", template="name", **{"gdk": "component"})
-    mock_cli_parser = mocker.patch("gdk.CLIParser.cli_parser.parse_args", return_value=args_namespace)
+    mock_cli_parser = mocker.patch("gdk.CLIParser.parse_args", return_value=args_namespace)
     mock_run_command = mocker.patch("gdk.common.parse_args_actions.run_command", return_value=None)
     mock_validate_cli_version = mocker.patch("gdk.common.utils.cli_version_check", return_value=None)
     cli_parser.main()
@@ -96,7 +96,7 @@ def test_main(mocker):
 
 def test_main_exception(mocker):
     args_namespace = argparse.Namespace(component="init", init=None, lang="python", template="name", **{"gdk": "component"})
-    mock_cli_parser = mocker.patch("gdk.CLIParser.cli_parser.parse_args", return_value=args_namespace)
+    mock_cli_parser = mocker.patch("gdk.CLIParser.parse_args", return_value=args_namespace)
     mock_run_command = mocker.patch(
         "gdk.common.parse_args_actions.run_command", return_value=None, side_effect=HTTPError("some")
     )
@@ -106,3 +106,67 @@ def test_main_exception(mocker):
     mock_cli_parser.assert_any_call()
     mock_run_command.assert_any_call(args_namespace)
     assert mock_validate_cli_version.called
+
+
+@pytest.mark.parametrize(
+    "args, command_path",
+    [
+        ([], []),
+        (["-v"], []),
+        (["component", "build", "-d"], ["component", "build"]),
+        (["component", "-h", "build"], ["component"]),
+        (["-d", "component", "build"], []),
+        (["component", "unknown"], ["component"]),
+        (["test-e2e", "run"], ["test-e2e", "run"]),
+    ],
+)
+def test_get_command_path(args, command_path):
+    assert cli_parser.get_command_path(args) == command_path
+
+
+def test_CLIParser_create_parser_with_command_path():
+    parser = cli_parser.CLIParser(consts.cli_tool_name, None, command_path=["component", "build"]).create_parser()
+    top_level_choices = parser._subparsers._group_actions[0].choices
+    assert list(top_level_choices) == ["component"]
+    component_choices = top_level_choices["component"]._subparsers._group_actions[0].choices
+    assert list(component_choices) == ["build"]
+
+
+def test_parse_args_only_creates_branch_of_command(mocker):
+    spy_get_cli_parser = mocker.spy(cli_parser, "get_cli_parser")
+    args = cli_parser.parse_args(["component", "build", "-d"])
+    assert not spy_get_cli_parser.called
+    assert args == cli_parser.get_cli_parser().parse_args(["component", "build", "-d"])
+
+
+def test_parse_args_reads_sys_argv(mocker):
+    mocker.patch("sys.argv", ["gdk", "component", "list", "--template"])
+    args = cli_parser.parse_args()
+    assert args.component == "list"
+    assert args.template
+
+
+def test_parse_args_unrecognized_arguments_use_full_parser(mocker):
+    mock_full_parser = mocker.Mock()
+    mocker.patch("gdk.CLIParser.get_cli_parser", return_value=mock_full_parser)
+    args = cli_parser.parse_args(["component", "build", "--unknown"])
+    mock_full_parser.parse_args.assert_called_once_with(["component", "build", "--unknown"])
+    assert args == mock_full_parser.parse_args.return_value
+
+
+def test_parse_args_no_command_uses_full_parser(mocker):
+    spy_create_cli_tool = mocker.spy(cli_parser, "_create_cli_tool")
+    mocker.patch("gdk.CLIParser._cli_tool", None)
+    cli_parser.parse_args(["-d"])
+    spy_create_cli_tool.assert_called_once_with(())
+    assert cli_parser.cli_parser is cli_parser.cli_tool.parser
+
+
+@pytest.mark.parametrize("args", [["component", "build", "--help"], ["component", "--help"], ["-v"]])
+def test_parse_args_help_output_matches_full_parser(capsys, args):
+    with pytest.raises(SystemExit):
+        cli_parser.parse_args(args)
+    output = capsys.readouterr().out
+    with pytest.raises(SystemExit):
+        cli_parser.get_cli_parser().parse_args(args)
+    assert output == capsys.readouterr().out
@@ -0,0 +1,53 @@
+import statistics
+import subprocess
+import sys
+
+import pytest
+
+# Modules that are only imported by the commands that use them.
+DEFERRED_MODULES = ["boto3", "botocore", "jsonschema", "yaml", "requests", "semver", "packaging"]
+# Cumulative import time of gdk.CLIParser in microseconds. It was about 330ms when the commands imported their
+# dependencies eagerly and is about 40ms without them. The budget leaves room for slower machines, like CI runners, while
+# still failing when the dependencies are imported eagerly again.
+IMPORT_TIME_BUDGET_US = 200000
+# Number of imports of which the median is compared with the budget, so a single slow import does not fail the test.
+IMPORT_TIME_RUNS = 5
+
+
+def import_times(module):
+    """
+    Imports the module in a new interpreter with `-X importtime` and returns the cumulative import time in microseconds of
+    every imported module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_GIVEN_cli_WHEN_import_THEN_command_dependencies_are_not_imported():
+    times = import_times("gdk.CLIParser")
+
+    imported = sorted({name.split(".")[0] for name in times} & set(DEFERRED_MODULES))
+    assert imported == []
+
+
+@pytest.mark.parametrize("module", ["boto3", "jsonschema", "yaml", "requests"])
+def test_GIVEN_dependency_WHEN_import_THEN_it_is_measured(module):
+    # Guards the parsing of the `-X importtime` output that the budget relies on.
+    assert module in import_times(module)
+
+
+def test_GIVEN_cli_WHEN_import_THEN_import_time_is_within_budget():
+    import_time = statistics.median(import_times("gdk.CLIParser")["gdk.CLIParser"] for _ in range(IMPORT_TIME_RUNS))
+
+    assert import_time < IMPORT_TIME_BUDGET_US, f"Importing gdk.CLIParser took {import_time / 1000:.1f}ms."